@@ -0,0 +1,62 @@
+"""
+Compare scoring of profiles with and without frameshifts.
+
+Frame states of zero epsilon only emit codons, so the Python engines skip the
+emission lengths 1, 2, 4 and 5 for them. The baseline is the same profile with
+a negligible epsilon, which keeps every emission length. The native DP always
+visits every emission length, so its timings are reported alongside.
+
+Usage: python bench/codon_only.py [--profile-length N] [--reads N] ...
+"""
+
+import argparse
+from time import perf_counter
+
+from common import random_profile, random_reads
+from imm import Sequence
+from imm.testing import assert_allclose
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile-length", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=32)
+    parser.add_argument("--read-length", type=int, default=150)
+    parser.add_argument("--baseline-epsilon", type=float, default=1e-9)
+    args = parser.parse_args()
+
+    baseline = random_profile(args.profile_length, epsilon=args.baseline_epsilon)
+    codon_only = random_profile(args.profile_length, epsilon=0.0)
+    assert not baseline.topology.codon_only
+    assert len(codon_only.topology.codon_only) == args.profile_length
+    reads = random_reads(args.reads, args.read_length)
+
+    def native(model):
+        seqs = [Sequence.create(read, model.alphabet) for read in reads]
+        start = perf_counter()
+        scores = [model.dp.viterbi(seq)[0].loglikelihood for seq in seqs]
+        return scores, perf_counter() - start
+
+    def python(model):
+        start = perf_counter()
+        scores = model.viterbi_scores(reads)
+        return scores, perf_counter() - start
+
+    _, native_baseline = native(baseline)
+    expected, native_codon = native(codon_only)
+    _, python_baseline = python(baseline)
+    scores, python_codon = python(codon_only)
+
+    print(f"dp.viterbi, all lengths:   {native_baseline:.3f}s")
+    print(f"dp.viterbi, codon-only:    {native_codon:.3f}s")
+    print(f"dp.viterbi speedup:        {native_baseline / native_codon:.2f}x")
+    print(f"Python, all lengths:       {python_baseline:.3f}s")
+    print(f"Python, codon-only:        {python_codon:.3f}s")
+    print(f"Python speedup:            {python_baseline / python_codon:.2f}x")
+    print(f"codon-only Python vs dp:   {native_codon / python_codon:.2f}x")
+    for score, native_score in zip(scores, expected):
+        assert_allclose(score, native_score)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+
+from math import log
+from random import Random
+from typing import List
+
+from nmm import Model, RNAAlphabet, build_frame_profile
+
+
+def random_profile(length: int, epsilon: float = 0.01, seed: int = 0) -> Model:
+    """
+    Linear frame-state profile with random codon probabilities.
+    """
+    random = Random(seed)
+    alphabet = RNAAlphabet()
+    base_lprobs = [[log(0.25)] * 4 for _ in range(length)]
+    codon_lprobs = []
+    for _ in range(length):
+        weights = [random.random() for _ in range(64)]
+        total = sum(weights)
+        codon_lprobs.append([log(w / total) for w in weights])
+    epsilons = [epsilon] * length
+    transitions = [[log(1 / length), log(0.9), log(0.1)] for _ in range(length)]
+    return build_frame_profile(
+        alphabet, base_lprobs, codon_lprobs, epsilons, transitions
+    )
+
+
+def random_reads(n: int, length: int, seed: int = 0) -> List[bytes]:
+    """
+    Uniformly random RNA reads.
+    """
+    random = Random(seed)
+    return [bytes(random.choice(b"ACGU") for _ in range(length)) for _ in range(n)]
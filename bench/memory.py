@@ -0,0 +1,61 @@
+"""
+Measure the memory of a database of models held in memory.
+
+Unless a database is given, one is written first with random profiles. Every
+model is then read and kept, and the Python-side memory traced while loading is
+reported next to the `Model.nbytes` estimates.
+
+Usage: python bench/memory.py [--database FILE] [--models N] ...
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from common import random_profile
+
+from nmm import Input, Output
+
+
+def write_database(filepath: str, nmodels: int, length: int):
+    with Output.create(filepath.encode()) as output:
+        for seed in range(nmodels):
+            output.write(random_profile(length, seed=seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database", type=str, default=None)
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--profile-length", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = args.database
+        if filepath is None:
+            filepath = os.path.join(tmpdir, "database.nmm")
+            write_database(filepath, args.models, args.profile_length)
+
+        tracemalloc.start()
+        start = perf_counter()
+        with Input.create(filepath.encode()) as input:
+            models = list(input)
+        seconds = perf_counter() - start
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    nmodels = len(models)
+    nstates = sum(len(model.hmm.states) for model in models)
+    estimated = sum(model.nbytes for model in models)
+
+    print(f"models:                {nmodels} ({nstates} states)")
+    print(f"load time:             {seconds:.3f}s")
+    print(f"python memory:         {traced / 2**20:.1f} MiB (peak {peak / 2**20:.1f})")
+    print(f"python per model:      {traced / max(nmodels, 1) / 2**10:.1f} KiB")
+    print(f"nbytes estimate:       {estimated / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare the fused scoring of `ModelGroup.viterbi_scores` with native `dp.viterbi`.
+
+Usage: python bench/model_group.py [--models N] [--profile-length N] ...
+"""
+
+import argparse
+from time import perf_counter
+
+from common import random_profile, random_reads
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import group_models
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--models", type=int, default=8)
+    parser.add_argument("--profile-length", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=16)
+    parser.add_argument("--read-length", type=int, default=90)
+    args = parser.parse_args()
+
+    models = [random_profile(args.profile_length, seed=i) for i in range(args.models)]
+    groups = list(group_models(models))
+    assert len(groups) == 1
+    group = groups[0]
+    reads = random_reads(args.reads, args.read_length)
+
+    start = perf_counter()
+    native = [
+        [
+            model.dp.viterbi(Sequence.create(read, model.alphabet))[0].loglikelihood
+            for model in models
+        ]
+        for read in reads
+    ]
+    native_seconds = perf_counter() - start
+
+    start = perf_counter()
+    fused = [group.viterbi_scores(read) for read in reads]
+    fused_seconds = perf_counter() - start
+
+    print(f"dp.viterbi per model:  {native_seconds:.3f}s")
+    print(f"group viterbi_scores:  {fused_seconds:.3f}s ({args.models} models)")
+    print(f"group vs dp.viterbi:   {native_seconds / fused_seconds:.2f}x")
+    for expected_row, fused_row in zip(native, fused):
+        for expected, score in zip(expected_row, fused_row):
+            assert_allclose(score, expected)
+
+
+if __name__ == "__main__":
+    main()
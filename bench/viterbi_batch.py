@@ -0,0 +1,50 @@
+"""
+Compare the Python batch scoring of `Model.viterbi_scores` with native `dp.viterbi`.
+
+Usage: python bench/viterbi_batch.py [--profile-length N] [--reads N] ...
+"""
+
+import argparse
+from time import perf_counter
+
+from common import random_profile, random_reads
+from imm import Sequence
+from imm.testing import assert_allclose
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile-length", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=64)
+    parser.add_argument("--read-length", type=int, default=150)
+    parser.add_argument("--lanes", type=int, default=16)
+    args = parser.parse_args()
+
+    model = random_profile(args.profile_length)
+    reads = random_reads(args.reads, args.read_length)
+    seqs = [Sequence.create(read, model.alphabet) for read in reads]
+
+    start = perf_counter()
+    native = [model.dp.viterbi(seq)[0].loglikelihood for seq in seqs]
+    native_seconds = perf_counter() - start
+
+    start = perf_counter()
+    looped = [model.viterbi_score(read) for read in reads]
+    looped_seconds = perf_counter() - start
+
+    start = perf_counter()
+    batched = model.viterbi_scores(reads, args.lanes)
+    batched_seconds = perf_counter() - start
+
+    print(f"dp.viterbi loop:       {native_seconds:.3f}s")
+    print(f"viterbi_score loop:    {looped_seconds:.3f}s")
+    print(f"viterbi_scores batch:  {batched_seconds:.3f}s ({args.lanes} lanes)")
+    print(f"batch vs dp.viterbi:   {native_seconds / batched_seconds:.2f}x")
+    print(f"batch vs score loop:   {looped_seconds / batched_seconds:.2f}x")
+    for expected, looped_score, batched_score in zip(native, looped, batched):
+        assert_allclose(looped_score, expected)
+        assert_allclose(batched_score, expected)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,39 @@ from ._alphabet import (
     IUPACAminoAlphabet,
     RNAAlphabet,
 )
+from ._cache import CachedResult, CacheStats, ResultCache
 from ._cdata import CData
 from ._codon import Codon, codon_iter
 from ._codon_prob import CodonProb
+from ._encoded import EncodedSequence
+from ._evalue import ScoreStatistics
+from ._fasta import SequenceRecord, read_sequences
+from ._fingerprint import fingerprint, hash_parts
+from ._genetic_code import GeneticCode
+from ._group import ModelGroup, group_models
+from ._hit_writer import HitWriter
+from ._hmmer import HMMERProfile, convert_hmmer3, read_hmmer3, read_model_names
 from ._input import Input
 from ._model import Model
+from ._model_cache import ModelCache
+from ._optimize import (
+    OptimizeReport,
+    optimize_file,
+    optimize_model,
+    optimize_topology,
+)
 from ._output import Output
+from ._path import ViterbiPath
+from ._prefilter import Prefilter, PrefilterStats
+from ._profile import build_frame_profile
+from ._sampler import SampledSequence, Sampler
+from ._scan import Hit
 from ._state import CodonState, FrameState, StateType
 from ._table import AminoTable, BaseTable, CodonTable
+from ._table_archive import TableArchive, TableKind
 from ._testit import test
+from ._topology import Topology
+from ._training import TrainingStats, ViterbiTrainer
 from ._translator import NTTranslator, NullTranslator, Translator
 
 try:
@@ -36,23 +60,57 @@ __all__ = [
     "BaseAlphabet",
     "BaseTable",
     "CData",
+    "CacheStats",
+    "CachedResult",
     "Codon",
     "CodonProb",
     "CodonState",
     "CodonTable",
     "DNAAlphabet",
+    "EncodedSequence",
     "FrameState",
+    "GeneticCode",
+    "HMMERProfile",
+    "Hit",
+    "HitWriter",
     "IUPACAminoAlphabet",
     "Input",
     "Model",
+    "ModelCache",
+    "ModelGroup",
     "NTTranslator",
     "NullTranslator",
+    "OptimizeReport",
     "Output",
+    "Prefilter",
+    "PrefilterStats",
     "RNAAlphabet",
+    "ResultCache",
+    "SampledSequence",
+    "Sampler",
+    "ScoreStatistics",
+    "SequenceRecord",
     "StateType",
+    "TableArchive",
+    "TableKind",
+    "Topology",
+    "TrainingStats",
     "Translator",
+    "ViterbiPath",
+    "ViterbiTrainer",
     "__version__",
+    "build_frame_profile",
     "codon_iter",
+    "convert_hmmer3",
+    "fingerprint",
+    "group_models",
+    "hash_parts",
     "lib",
+    "optimize_file",
+    "optimize_model",
+    "optimize_topology",
+    "read_hmmer3",
+    "read_model_names",
+    "read_sequences",
     "test",
 ]
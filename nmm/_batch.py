@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from math import inf
+from typing import List, Sequence
+
+from ._dp import emission_lengths
+from ._topology import Topology
+
+__all__ = ["viterbi_scores"]
+
+Lanes = List[float]
+
+
+def viterbi_scores(topology: Topology, seqs: Sequence[bytes]) -> List[float]:
+    """
+    Viterbi log-likelihoods of several sequences advanced together.
+
+    Each DP cell holds one value per sequence (lane), so the per-state work of a
+    row (predecessors, emission lengths, start and mute handling) is done once
+    for all lanes. Being pure Python, it remains slower than the native DP and
+    serves as a reference. Sequences may have different lengths: a lane leaves the
+    computation once its sequence ends. Emissions are looked up through the
+    shared emission tables of the topology. Memory is O(states × lanes).
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seqs
+        Sequences symbols.
+
+    Returns
+    -------
+    Viterbi log-likelihood of each sequence, in the given order.
+    """
+    nstates = topology.nstates
+    start = topology.start_lprobs
+    emissions = topology.emissions
+    lengths = emission_lengths(topology)
+    emitters = [i for i in range(nstates) if lengths[i]]
+    mute_order = topology.mute_order
+    pred = [topology.predecessors(i) for i in range(nstates)]
+    end = topology.end
+
+    # Longest sequences first, so the active lanes are always a prefix.
+    order = sorted(range(len(seqs)), key=lambda i: len(seqs[i]), reverse=True)
+    lanes = [seqs[i] for i in order]
+    scores = [-inf] * len(lanes)
+
+    nrows = max(topology.max_seq) + 1
+    rows: List[List[Lanes]] = [[[] for _ in range(nstates)] for _ in range(nrows)]
+    nactive = len(lanes)
+
+    for pos in range((len(lanes[0]) if lanes else 0) + 1):
+        while nactive > 0 and len(lanes[nactive - 1]) < pos:
+            nactive -= 1
+        active = lanes[:nactive]
+        row = rows[pos % nrows]
+        for t in range(nstates):
+            row[t] = [-inf] * nactive
+
+        for t in emitters:
+            emission = emissions[t]
+            out = row[t]
+            for size in lengths[t]:
+                if size > pos:
+                    break
+                prev = rows[(pos - size) % nrows]
+                e = [emission(seq[pos - size : pos]) for seq in active]
+                inc = [start[t]] * nactive if pos == size else [-inf] * nactive
+                for s, lprob in pred[t]:
+                    inc = [max(a, b + lprob) for a, b in zip(inc, prev[s])]
+                out = [max(o, a + b) for o, a, b in zip(out, inc, e)]
+            row[t] = out
+
+        for t in mute_order:
+            e0 = emissions[t](b"")
+            if e0 == -inf:
+                continue
+            inc = [start[t]] * nactive if pos == 0 else [-inf] * nactive
+            for s, lprob in pred[t]:
+                inc = [max(a, b + lprob) for a, b in zip(inc, row[s])]
+            row[t] = [max(o, a + e0) for o, a in zip(row[t], inc)]
+
+        final = row[end]
+        j = nactive - 1
+        while j >= 0 and len(lanes[j]) == pos:
+            scores[j] = final[j]
+            j -= 1
+
+    result = [-inf] * len(seqs)
+    for lane, i in enumerate(order):
+        result[i] = scores[lane]
+    return result
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, NamedTuple, Optional, Tuple, Union
+
+from imm import Sequence
+
+__all__ = ["CacheStats", "CachedResult", "ResultCache"]
+
+# Approximate size of an entry, excluding its key and path.
+_ENTRY_NBYTES = 160
+# Approximate size of a stored path per sequence symbol.
+_PATH_NBYTES_PER_SYMBOL = 16
+
+
+class CachedResult(NamedTuple):
+    """
+    Viterbi result kept by a `ResultCache`.
+
+    Attributes
+    ----------
+    loglikelihood
+        Viterbi log-likelihood.
+    results
+        Full Viterbi results, if the cache stores paths.
+    """
+
+    loglikelihood: float
+    results: Optional[Any]
+
+    @property
+    def path(self):
+        if self.results is None:
+            return None
+        return self.results[0].path
+
+
+class CacheStats(NamedTuple):
+    """
+    Result cache counters.
+    """
+
+    hits: int
+    misses: int
+    nentries: int
+    nbytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ResultCache:
+    """
+    Thread-safe, bounded LRU cache of Viterbi results keyed by sequence.
+
+    Parameters
+    ----------
+    max_entries
+        Maximum number of entries.
+    max_nbytes
+        Approximate memory limit, in bytes.
+    store_path
+        Whether to keep the full results, and therefore paths, of each entry.
+    hash_keys
+        Whether to key entries by a SHA-1 digest of the sequence instead of the
+        sequence itself, bounding the key size of long sequences.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100000,
+        max_nbytes: int = 64 * 1024 * 1024,
+        store_path: bool = False,
+        hash_keys: bool = False,
+    ):
+        self._max_entries = max_entries
+        self._max_nbytes = max_nbytes
+        self._store_path = store_path
+        self._hash_keys = hash_keys
+        self._entries: OrderedDict[bytes, Tuple[CachedResult, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    @property
+    def store_path(self) -> bool:
+        return self._store_path
+
+    def key(self, seq: Union[bytes, Sequence]) -> bytes:
+        symbols = bytes(seq)
+        if self._hash_keys:
+            return hashlib.sha1(symbols).digest()
+        return symbols
+
+    def get(self, key: bytes) -> Optional[CachedResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, result: CachedResult, seq_len: int):
+        nbytes = _ENTRY_NBYTES + len(key)
+        if result.results is not None:
+            nbytes += _PATH_NBYTES_PER_SYMBOL * seq_len
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (result, nbytes)
+            self._nbytes += nbytes
+            while self._entries and (
+                len(self._entries) > self._max_entries
+                or self._nbytes > self._max_nbytes
+            ):
+                _, (_, size) = self._entries.popitem(last=False)
+                self._nbytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, len(self._entries), self._nbytes
+            )
@@ -25,6 +25,8 @@ class Codon:
         Four-nucleotides alphabet.
     """
 
+    __slots__ = ("_nmm_codon", "_alphabet")
+
     def __init__(self, nmm_codon: CData, alphabet: BaseAlphabet):
         if nmm_codon == ffi.NULL:
             raise RuntimeError("`nmm_codon` is NULL.")
@@ -8,6 +8,7 @@ from ._alphabet import BaseAlphabet
 from ._cdata import CData
 from ._codon import Codon
 from ._ffi import ffi, lib
+from ._nbytes import CODON_LPROB_NBYTES, object_nbytes
 
 __all__ = ["CodonProb"]
 
@@ -24,6 +25,8 @@ class CodonProb:
         Four-nucleotides alphabet.
     """
 
+    __slots__ = ("_nmm_codon_lprob", "_alphabet")
+
     def __init__(self, nmm_codon_lprob: CData, alphabet: BaseAlphabet):
         if nmm_codon_lprob == ffi.NULL:
             raise RuntimeError("`nmm_codon_lprob` is NULL.")
@@ -64,6 +67,13 @@ class CodonProb:
         if lib.nmm_codon_lprob_normalize(self._nmm_codon_lprob) != 0:
             raise RuntimeError("Could not normalize.")
 
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the probabilities, native allocation included.
+        """
+        return CODON_LPROB_NBYTES + object_nbytes(self)
+
     def __del__(self):
         if self._nmm_codon_lprob != ffi.NULL:
             lib.nmm_codon_lprob_destroy(self._nmm_codon_lprob)
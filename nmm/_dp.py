@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from itertools import product
+from math import exp, inf, log
+from typing import Callable, Dict, Hashable, List, NamedTuple, Tuple
+
+from ._emission import EmissionTable
+from ._state import FrameState
+from ._topology import Topology
+
+# Pure-Python DP over a `Topology`. It reproduces `dp.viterbi` scores and adds
+# Forward, but runs orders of magnitude slower than the native DP: it serves as a
+# reference and for algorithms the native API does not offer, not as a faster
+# scoring path.
+
+__all__ = [
+    "ThresholdScore",
+    "forward_score",
+    "logsumexp",
+    "symbol_rate",
+    "viterbi_score",
+    "viterbi_threshold",
+]
+
+Reduce = Callable[[List[float]], float]
+
+
+def logsumexp(values: List[float]) -> float:
+    vmax = max(values)
+    if vmax == -inf:
+        return -inf
+    return vmax + log(sum(exp(v - vmax) for v in values))
+
+
+def viterbi_score(topology: Topology, seq: bytes) -> float:
+    """
+    Viterbi log-likelihood without traceback, in Python.
+
+    Only the last ``max_seq + 1`` rows of the DP matrix are kept, so memory is
+    O(states) regardless of the sequence length. Use `dp.viterbi` for speed.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seq
+        Sequence symbols.
+    """
+    return _score(topology, seq, max)[0]
+
+
+def forward_score(topology: Topology, seq: bytes) -> float:
+    """
+    Forward log-likelihood, summing over all paths, in Python.
+
+    Memory usage is the same as for `viterbi_score`.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seq
+        Sequence symbols.
+    """
+    return _score(topology, seq, logsumexp)[0]
+
+
+class ThresholdScore(NamedTuple):
+    """
+    Outcome of a threshold-aware Viterbi.
+
+    Attributes
+    ----------
+    loglikelihood
+        Viterbi log-likelihood, or ``-inf`` if the computation was abandoned.
+    abandoned
+        Whether the threshold was found unreachable before the end.
+    skipped_cells
+        Number of DP cells left uncomputed.
+    ncells
+        Number of DP cells of the full computation.
+    """
+
+    loglikelihood: float
+    abandoned: bool
+    skipped_cells: int
+    ncells: int
+
+
+def viterbi_threshold(
+    topology: Topology, seq: bytes, threshold: float, rate: float
+) -> ThresholdScore:
+    """
+    Viterbi log-likelihood in Python, abandoned once it cannot reach `threshold`.
+
+    After each row, the best score any path can still reach is bounded by the
+    best live cell plus `rate` per remaining symbol. Computation stops as soon as
+    that bound falls below `threshold`. This is a reference engine: the native DP
+    cannot stop midway, and the bound of `symbol_rate` rarely falls below a
+    realistic cutoff, so no native threshold mode is provided.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seq
+        Sequence symbols.
+    threshold
+        Minimum log-likelihood of interest.
+    rate
+        Upper bound on the log-likelihood gained per emitted symbol, as given by
+        `symbol_rate`.
+    """
+    score, skipped = _score(topology, seq, max, threshold, rate)
+    ncells = (len(seq) + 1) * topology.nstates
+    return ThresholdScore(score, skipped > 0, skipped, ncells)
+
+
+def symbol_rate(topology: Topology) -> float:
+    """
+    Upper bound on the log-likelihood a path gains per emitted symbol.
+
+    It is the best ratio, over emitting states and emission lengths, between the
+    best incoming transition plus the best emission and the emission length.
+    Emissions are enumerated once per distinct state, any-symbol included. The
+    bound is infinite if a transition or a zero-length emission has a positive
+    log probability, as paths could then gain score without emitting.
+    """
+    nstates = topology.nstates
+    emissions = topology.emissions
+    lengths = emission_lengths(topology)
+    start = topology.start_lprobs
+    if any(v > 0.0 for v in topology.transitions.values()):
+        return inf
+    if any(v > 0.0 for v in start):
+        return inf
+    if any(emissions[t](b"") > 0.0 for t in topology.mute_order):
+        return inf
+
+    alphabet = topology.alphabet
+    symbols = [bytes([s]) for s in alphabet.symbols]
+    if alphabet.any_symbol not in symbols:
+        symbols.append(alphabet.any_symbol)
+
+    incoming = [start[t] for t in range(nstates)]
+    for (_, b), lprob in topology.transitions.items():
+        incoming[b] = max(incoming[b], lprob)
+
+    best: Dict[Hashable, List[Tuple[int, float]]] = {}
+    rate = -inf
+    for t in range(nstates):
+        if not lengths[t] or incoming[t] == -inf:
+            continue
+        key = _emission_key(topology, t)
+        if key not in best:
+            best[key] = _best_emissions(emissions[t], symbols, lengths[t])
+        for size, lprob in best[key]:
+            rate = max(rate, (incoming[t] + lprob) / size)
+    return rate
+
+
+def _score(
+    topology: Topology,
+    seq: bytes,
+    reduce: Reduce,
+    threshold: float = -inf,
+    rate: float = inf,
+) -> Tuple[float, int]:
+    nstates = topology.nstates
+    start = topology.start_lprobs
+    emissions = topology.emissions
+    lengths = emission_lengths(topology)
+    emitters = [i for i in range(nstates) if lengths[i]]
+    mute_order = topology.mute_order
+    pred = [topology.predecessors(i) for i in range(nstates)]
+
+    nrows = max(topology.max_seq) + 1
+    rows = [[-inf] * nstates for _ in range(nrows)]
+    row_max = [-inf] * nrows
+    prune = threshold > -inf and rate < inf
+    length = len(seq)
+
+    for pos in range(length + 1):
+        row = rows[pos % nrows]
+        for i in range(nstates):
+            row[i] = -inf
+
+        for t in emitters:
+            cands: List[float] = []
+            for size in lengths[t]:
+                if size > pos:
+                    break
+                e = emissions[t](seq[pos - size : pos])
+                if e == -inf:
+                    continue
+                prev = rows[(pos - size) % nrows]
+                if pos == size and start[t] > -inf:
+                    cands.append(start[t] + e)
+                for s, lprob in pred[t]:
+                    v = prev[s]
+                    if v > -inf:
+                        cands.append(v + lprob + e)
+            if cands:
+                row[t] = reduce(cands)
+
+        for t in mute_order:
+            e = emissions[t](b"")
+            if e == -inf:
+                continue
+            cands = [row[t]] if row[t] > -inf else []
+            if pos == 0 and start[t] > -inf:
+                cands.append(start[t] + e)
+            for s, lprob in pred[t]:
+                v = row[s]
+                if v > -inf:
+                    cands.append(v + lprob + e)
+            if cands:
+                row[t] = reduce(cands)
+
+        if prune and pos < length:
+            row_max[pos % nrows] = max(row)
+            bound = max(
+                row_max[p % nrows] + (length - p) * rate
+                for p in range(max(pos - nrows + 1, 0), pos + 1)
+            )
+            if bound < threshold:
+                return -inf, (length - pos) * nstates
+
+    return rows[length % nrows][topology.end], 0
+
+
+def _best_emissions(
+    emission: EmissionTable, symbols: List[bytes], lengths: List[int]
+) -> List[Tuple[int, float]]:
+    return [
+        (size, max(emission(b"".join(seq)) for seq in product(symbols, repeat=size)))
+        for size in lengths
+    ]
+
+
+def _emission_key(topology: Topology, t: int) -> Hashable:
+    state = topology.states[t]
+    if isinstance(state, FrameState):
+        tables = (state.base_table.nmm_base_table, state.codon_table.nmm_codon_table)
+        return tables + (state.epsilon,)
+    return t
+
+
+def emission_lengths(topology: Topology) -> List[List[int]]:
+    """
+    Positive emission lengths of each state, in increasing order.
+    """
+    return [
+        list(range(max(lo, 1), hi + 1))
+        for lo, hi in zip(topology.min_seq, topology.max_seq)
+    ]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Dict
+
+from imm import Alphabet, Sequence, State
+
+from ._nbytes import container_nbytes, object_nbytes
+
+__all__ = ["EmissionTable"]
+
+
+class EmissionTable:
+    """
+    Emission log probabilities of a state, memoized by emitted symbols.
+
+    States emit short sequences, so the number of distinct entries is bounded by
+    the alphabet size and the maximum emission length, and lookups soon stop
+    crossing into native code.
+
+    Parameters
+    ----------
+    state
+        State.
+    alphabet
+        Alphabet of the state.
+    """
+
+    __slots__ = ("_state", "_alphabet", "_cache")
+
+    def __init__(self, state: State, alphabet: Alphabet):
+        self._state = state
+        self._alphabet = alphabet
+        self._cache: Dict[bytes, float] = {}
+
+    @property
+    def state(self) -> State:
+        return self._state
+
+    def __call__(self, symbols: bytes) -> float:
+        lprob = self._cache.get(symbols)
+        if lprob is None:
+            seq = Sequence.create(symbols, self._alphabet)
+            lprob = self._state.lprob(seq)
+            self._cache[symbols] = lprob
+        return lprob
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory of the table and of its memoized entries.
+        """
+        return object_nbytes(self) + container_nbytes(self._cache)
+
+    def __len__(self) -> int:
+        return len(self._cache)
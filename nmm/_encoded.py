@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple, Type, Union
+
+from imm import Sequence
+
+from ._alphabet import BaseAlphabet
+from ._cdata import CData
+
+__all__ = ["EncodedSequence", "SequenceLike", "as_sequence"]
+
+_INVALID = 0xFF
+
+
+class EncodedSequence:
+    """
+    Sequence encoded once as alphabet symbol indices.
+
+    Index ``i`` stands for the i-th alphabet symbol and the index following the
+    last symbol for the any-symbol. The indices are kept in a byte buffer that
+    may be shared with the object it was created from, and the symbols are
+    decoded once, on first use.
+
+    Functions of this package taking a `SequenceLike` accept encoded sequences.
+    imm functions, like ``dp.viterbi``, do not: pass them ``sequence_for(alphabet)``
+    instead. A DP only scores sequences created with its own alphabet object, and
+    models read from a file each have their own, so scoring a read against many
+    models still creates one `imm.Sequence` per model, which imm validates and
+    encodes again. Only the sequence of the most recent alphabet is kept.
+
+    Parameters
+    ----------
+    indices
+        Symbol indices.
+    alphabet
+        Base alphabet.
+    """
+
+    __slots__ = ("_indices", "_alphabet", "_symbols", "_last")
+
+    def __init__(self, indices: memoryview, alphabet: BaseAlphabet):
+        self._indices = indices
+        self._alphabet = alphabet
+        self._symbols: Optional[bytes] = None
+        self._last: Optional[Tuple[BaseAlphabet, Sequence]] = None
+
+    @classmethod
+    def create(
+        cls: Type[EncodedSequence], symbols: bytes, alphabet: BaseAlphabet
+    ) -> EncodedSequence:
+        """
+        Encode a sequence of symbols.
+
+        Parameters
+        ----------
+        symbols
+            Sequence of alphabet symbols, the any-symbol included.
+        alphabet
+            Base alphabet.
+        """
+        indices = bytes(symbols).translate(_encoding_table(alphabet))
+        if _INVALID in indices:
+            raise ValueError("Sequence has symbols outside the alphabet.")
+        seq = cls(memoryview(indices), alphabet)
+        seq._symbols = bytes(symbols)
+        return seq
+
+    @classmethod
+    def from_buffer(
+        cls: Type[EncodedSequence], buffer, alphabet: BaseAlphabet
+    ) -> EncodedSequence:
+        """
+        Wrap a buffer of symbol indices without copying it.
+
+        Parameters
+        ----------
+        buffer
+            Contiguous object supporting the buffer protocol, like a bytearray or
+            a one-dimensional ``numpy.uint8`` array.
+        alphabet
+            Base alphabet.
+        """
+        indices = memoryview(buffer).cast("B")
+        valid = bytes(range(len(alphabet.symbols) + 1))
+        if indices.tobytes().translate(None, valid):
+            raise ValueError("Symbol index out of range.")
+        return cls(indices, alphabet)
+
+    @property
+    def alphabet(self) -> BaseAlphabet:
+        return self._alphabet
+
+    @property
+    def indices(self) -> memoryview:
+        return self._indices
+
+    @property
+    def symbols(self) -> bytes:
+        if self._symbols is None:
+            self._symbols = self._indices.tobytes().translate(
+                _decoding_table(self._alphabet)
+            )
+        return self._symbols
+
+    @property
+    def sequence(self) -> Sequence:
+        """
+        Sequence of the encoding alphabet.
+        """
+        return self.sequence_for(self._alphabet)
+
+    def sequence_for(self, alphabet: BaseAlphabet) -> Sequence:
+        """
+        Sequence of an alphabet, reused while the same alphabet object is asked for.
+
+        Parameters
+        ----------
+        alphabet
+            Alphabet object with the symbols of the encoding alphabet.
+        """
+        if self._last is not None and self._last[0] is alphabet:
+            return self._last[1]
+        if alphabet is not self._alphabet and (
+            alphabet.symbols != self._alphabet.symbols
+            or alphabet.any_symbol != self._alphabet.any_symbol
+        ):
+            raise ValueError("Alphabet symbols differ from the encoding ones.")
+        seq = Sequence.create(self.symbols, alphabet)
+        self._last = (alphabet, seq)
+        return seq
+
+    @property
+    def imm_seq(self) -> CData:
+        return self.sequence.imm_seq
+
+    def __getitem__(self, index: slice) -> EncodedSequence:
+        if not isinstance(index, slice):
+            raise TypeError("Encoded sequences can only be sliced.")
+        return EncodedSequence(self._indices[index], self._alphabet)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __bytes__(self) -> bytes:
+        return self.symbols
+
+    def __str__(self) -> str:
+        return self.symbols.decode()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}:{str(self)}>"
+
+
+SequenceLike = Union[bytes, Sequence, EncodedSequence]
+
+
+def as_sequence(seq: SequenceLike, alphabet: BaseAlphabet) -> Sequence:
+    """
+    Bytes, encoded sequence, or sequence as an `imm.Sequence`.
+    """
+    if isinstance(seq, bytes):
+        return Sequence.create(seq, alphabet)
+    if isinstance(seq, EncodedSequence):
+        return seq.sequence_for(alphabet)
+    return seq
+
+
+def _encoding_table(alphabet: BaseAlphabet) -> bytes:
+    table = bytearray([_INVALID] * 256)
+    for i, symbol in enumerate(alphabet.symbols + alphabet.any_symbol):
+        table[symbol] = i
+    return bytes(table)
+
+
+def _decoding_table(alphabet: BaseAlphabet) -> bytes:
+    table = bytearray(256)
+    for i, symbol in enumerate(alphabet.symbols + alphabet.any_symbol):
+        table[i] = symbol
+    return bytes(table)
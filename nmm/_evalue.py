@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from math import exp, expm1, inf, pi, sqrt
+from random import Random
+from typing import TYPE_CHECKING, Dict, List, NamedTuple
+
+from imm import Sequence, lprob_is_valid
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+__all__ = ["ScoreStatistics", "calibrate", "read_statistics", "write_statistics"]
+
+_EULER_GAMMA = 0.5772156649015329
+
+
+class ScoreStatistics(NamedTuple):
+    """
+    Gumbel null distribution of Viterbi log-likelihoods.
+
+    Attributes
+    ----------
+    mu
+        Location parameter.
+    lambda_
+        Scale parameter.
+    nsamples
+        Number of random sequences used in the fit.
+    """
+
+    mu: float
+    lambda_: float
+    nsamples: int
+
+    def pvalue(self, loglikelihood: float) -> float:
+        """
+        Probability of a random sequence scoring at least `loglikelihood`.
+        """
+        if loglikelihood == -inf:
+            return 1.0
+        return -expm1(-exp(-self.lambda_ * (loglikelihood - self.mu)))
+
+    def evalue(self, loglikelihood: float, nsequences: int = 1) -> float:
+        """
+        Expected number of random sequences scoring at least `loglikelihood`.
+
+        Parameters
+        ----------
+        loglikelihood
+            Viterbi log-likelihood.
+        nsequences
+            Number of sequences searched.
+        """
+        return nsequences * self.pvalue(loglikelihood)
+
+
+def fit_gumbel(scores: List[float]) -> ScoreStatistics:
+    """
+    Fit a Gumbel distribution by the method of moments.
+    """
+    n = len(scores)
+    if n < 2:
+        raise ValueError("At least two finite scores are needed.")
+    mean = sum(scores) / n
+    var = sum((s - mean) ** 2 for s in scores) / (n - 1)
+    if var == 0.0:
+        raise ValueError("Scores have zero variance.")
+    lambda_ = pi / sqrt(6 * var)
+    mu = mean - _EULER_GAMMA / lambda_
+    return ScoreStatistics(mu, lambda_, n)
+
+
+def calibrate(
+    model: Model,
+    length: int,
+    nsamples: int = 1000,
+    seed: int = 0,
+    workers: int = 1,
+) -> ScoreStatistics:
+    """
+    Fit the null score distribution of a model.
+
+    Random sequences with uniformly distributed symbols are scored by Viterbi.
+    Sequences the model cannot emit are discarded.
+
+    Parameters
+    ----------
+    model
+        Model.
+    length
+        Length of the random sequences.
+    nsamples
+        Number of random sequences.
+    seed
+        Random seed.
+    workers
+        Number of threads scoring sequences concurrently.
+    """
+    alphabet = model.alphabet
+    symbols = alphabet.symbols
+    dp = model.dp
+    random = Random(seed)
+    seqs = [
+        bytes(random.choice(symbols) for _ in range(length)) for _ in range(nsamples)
+    ]
+
+    def score(seq: bytes) -> float:
+        results = dp.viterbi(Sequence.create(seq, alphabet))
+        if len(results) == 0:
+            return -inf
+        loglik: float = results[0].loglikelihood
+        return loglik if lprob_is_valid(loglik) else -inf
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        scores = [s for s in executor.map(score, seqs) if s > -inf]
+    return fit_gumbel(scores)
+
+
+def statistics_filepath(filepath: bytes) -> bytes:
+    """
+    Sidecar file storing the score statistics of the models in `filepath`.
+    """
+    return filepath + b".stats"
+
+
+def write_statistics(filepath: bytes, stats: Dict[int, ScoreStatistics]):
+    """
+    Write score statistics keyed by model index in the file.
+
+    Without statistics, the sidecar file is removed instead so that a stale one
+    is not read back with other models.
+    """
+    if not stats:
+        try:
+            os.remove(statistics_filepath(filepath))
+        except FileNotFoundError:
+            pass
+        return
+    with open(statistics_filepath(filepath), "w") as stream:
+        for index in sorted(stats.keys()):
+            s = stats[index]
+            stream.write(f"{index}\t{s.mu!r}\t{s.lambda_!r}\t{s.nsamples}\n")
+
+
+def read_statistics(filepath: bytes) -> Dict[int, ScoreStatistics]:
+    """
+    Read score statistics keyed by model index in the file.
+
+    Returns an empty dictionary if there is no sidecar file.
+    """
+    stats: Dict[int, ScoreStatistics] = {}
+    try:
+        stream = open(statistics_filepath(filepath), "r")
+    except FileNotFoundError:
+        return stats
+    with stream:
+        for line in stream:
+            index, mu, lambda_, nsamples = line.split("\t")
+            stats[int(index)] = ScoreStatistics(
+                float(mu), float(lambda_), int(nsamples)
+            )
+    return stats
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gzip
+from typing import IO, Iterator, List, NamedTuple, Tuple, Union
+
+from ._alphabet import BaseAlphabet
+from ._encoded import EncodedSequence
+
+__all__ = ["SequenceRecord", "read_sequences", "symbol_table"]
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SequenceRecord(NamedTuple):
+    """
+    Sequence read from a FASTA or FASTQ file.
+
+    Attributes
+    ----------
+    id
+        Record identifier, the first word of its header.
+    sequence
+        Sequence, encoded independently of any model so that it can be scored
+        against models each holding their own alphabet object.
+    """
+
+    id: bytes
+    sequence: EncodedSequence
+
+
+def symbol_table(alphabet: BaseAlphabet) -> bytes:
+    """
+    Translation table mapping any byte to an alphabet symbol.
+
+    Symbols map to themselves and lowercase symbols to their uppercase form. The
+    remaining bytes map to the any-symbol. Use it with `bytes.translate`.
+    """
+    table = bytearray(alphabet.any_symbol * 256)
+    for symbol in alphabet.symbols:
+        table[symbol] = symbol
+        table[bytes([symbol]).lower()[0]] = symbol
+    return bytes(table)
+
+
+def read_sequences(
+    filepath: Union[str, bytes],
+    alphabet: BaseAlphabet,
+    batch_size: int = 1024,
+    buffer_size: int = 1 << 20,
+) -> Iterator[List[SequenceRecord]]:
+    """
+    Read FASTA or FASTQ records in batches.
+
+    The format is detected from the first record, and gzipped files from their
+    magic number. Unknown symbols are replaced by the alphabet any-symbol, so
+    every record yields a valid sequence. At most one batch is held in memory.
+
+    Parameters
+    ----------
+    filepath
+        FASTA or FASTQ file, plain or gzipped.
+    alphabet
+        Alphabet of the sequences.
+    batch_size
+        Number of records per batch.
+    buffer_size
+        Size of the read buffer, in bytes.
+    """
+    table = symbol_table(alphabet)
+    with _open(filepath, buffer_size) as stream:
+        batch: List[SequenceRecord] = []
+        for id_, symbols in _records(stream):
+            seq = EncodedSequence.create(symbols.translate(table), alphabet)
+            batch.append(SequenceRecord(id_, seq))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _open(filepath: Union[str, bytes], buffer_size: int) -> IO[bytes]:
+    with open(filepath, "rb") as stream:
+        magic = stream.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(filepath, "rb")
+    return open(filepath, "rb", buffering=buffer_size)
+
+
+def _records(stream: IO[bytes]) -> Iterator[Tuple[bytes, bytes]]:
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(b">"):
+            yield from _fasta_records(stream, line)
+        elif line.startswith(b"@"):
+            yield from _fastq_records(stream, line)
+        else:
+            raise ValueError("Unknown sequence file format.")
+        return
+
+
+def _fasta_records(stream: IO[bytes], header: bytes) -> Iterator[Tuple[bytes, bytes]]:
+    parts: List[bytes] = []
+    for line in stream:
+        line = line.strip()
+        if line.startswith(b">"):
+            yield _identifier(header), b"".join(parts)
+            header = line
+            parts = []
+        elif line:
+            parts.append(line)
+    yield _identifier(header), b"".join(parts)
+
+
+def _fastq_records(stream: IO[bytes], header: bytes) -> Iterator[Tuple[bytes, bytes]]:
+    while True:
+        symbols = stream.readline().strip()
+        if not stream.readline().startswith(b"+"):
+            raise ValueError("Malformed FASTQ record.")
+        stream.readline()
+        yield _identifier(header), symbols
+
+        header = b""
+        while not header:
+            line = stream.readline()
+            if not line:
+                return
+            header = line.strip()
+        if not header.startswith(b"@"):
+            raise ValueError("Malformed FASTQ record.")
+
+
+def _identifier(header: bytes) -> bytes:
+    fields = header[1:].split(maxsplit=1)
+    return fields[0] if fields else b""
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import struct
+from typing import List, Union
+
+from imm import Sequence, State
+
+from ._codon import codon_iter
+from ._state import CodonState, FrameState
+from ._topology import Topology
+
+__all__ = ["fingerprint", "hash_parts"]
+
+_VERSION = b"nmm-model-1"
+_DOUBLE = struct.Struct("<d")
+_UINT = struct.Struct("<Q")
+# Generic states are hashed by their emission probabilities, enumerated up to
+# this many sequences.
+_MAX_EMISSIONS = 4096
+
+
+def fingerprint(topology: Topology) -> str:
+    """
+    Content hash of a model graph.
+
+    The SHA-256 digest covers the alphabet, every state (name, type, tables and
+    epsilon), the start and transition probabilities, and the end state. It does
+    not depend on object identities or on the order transitions were set, so
+    equal models built in separate runs have equal fingerprints.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+
+    Returns
+    -------
+    Hexadecimal digest.
+    """
+    digest = hashlib.sha256(_VERSION)
+    alphabet = topology.alphabet
+    _update(digest, alphabet.symbols + alphabet.any_symbol)
+
+    digest.update(_UINT.pack(topology.nstates))
+    for state, start in zip(topology.states, topology.start_lprobs):
+        _update_state(digest, state)
+        digest.update(_DOUBLE.pack(start))
+
+    transitions = sorted(topology.transitions.items())
+    digest.update(_UINT.pack(len(transitions)))
+    for (a, b), lprob in transitions:
+        digest.update(_UINT.pack(a) + _UINT.pack(b) + _DOUBLE.pack(lprob))
+    digest.update(_UINT.pack(topology.end))
+    return digest.hexdigest()
+
+
+def hash_parts(*parts: Union[bytes, str, int, float]) -> str:
+    """
+    Hexadecimal SHA-256 digest of a sequence of values.
+
+    Useful to derive a cache key from the inputs a model is built from, e.g. the
+    content of a parameter file and the build options.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            _update(digest, b"s" + part.encode())
+        elif isinstance(part, bytes):
+            _update(digest, b"b" + part)
+        elif isinstance(part, int):
+            _update(digest, b"i" + str(part).encode())
+        elif isinstance(part, float):
+            _update(digest, b"f" + _DOUBLE.pack(part))
+        else:
+            raise TypeError(f"Unsupported part type {type(part).__name__}.")
+    return digest.hexdigest()
+
+
+def _update(digest, data: bytes):
+    digest.update(_UINT.pack(len(data)))
+    digest.update(data)
+
+
+def _update_state(digest, state: State):
+    _update(digest, state.name)
+    alphabet = state.alphabet
+    if isinstance(state, FrameState):
+        _update(digest, b"frame")
+        bases = [alphabet.symbols[i : i + 1] for i in range(4)]
+        codont = state.codon_table
+        lprobs = [state.base_table.lprob(b) for b in bases]
+        lprobs += [codont.lprob(c) for c in codon_iter(alphabet)]
+        lprobs.append(state.epsilon)
+    elif isinstance(state, CodonState):
+        _update(digest, b"codon")
+        codonp = state.codon_prob
+        lprobs = [codonp.get_lprob(c) for c in codon_iter(alphabet)]
+    else:
+        _update(digest, type(state).__name__.encode())
+        lprobs = _emission_lprobs(state)
+    digest.update(_UINT.pack(state.min_seq) + _UINT.pack(state.max_seq))
+    digest.update(b"".join(_DOUBLE.pack(v) for v in lprobs))
+
+
+def _emission_lprobs(state: State) -> List[float]:
+    alphabet = state.alphabet
+    symbols = [bytes([s]) for s in alphabet.symbols]
+    lprobs: List[float] = []
+    for size in range(state.min_seq, state.max_seq + 1):
+        if len(lprobs) + len(symbols) ** size > _MAX_EMISSIONS:
+            raise ValueError("State emits too many sequences to be hashed.")
+        for seq in itertools.product(symbols, repeat=size):
+            lprobs.append(state.lprob(Sequence.create(b"".join(seq), alphabet)))
+    return lprobs
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import itertools
+from math import inf, log
+from typing import Dict, List, Sequence, Type
+
+__all__ = ["GeneticCode"]
+
+_BASES = "TCAG"
+
+# NCBI translation table 1, codons enumerated in TCAG order.
+_STANDARD = "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG"
+
+
+class GeneticCode:
+    """
+    Genetic code mapping codons to amino acids.
+
+    Parameters
+    ----------
+    table
+        Mapping from DNA codon (e.g. ``b"ATG"``) to amino acid symbol. Stop codons
+        map to ``b"*"``.
+    """
+
+    def __init__(self, table: Dict[bytes, bytes]):
+        if len(table) != 64:
+            raise ValueError("Genetic code must have 64 codons.")
+        self._table = dict(table)
+
+    @classmethod
+    def create(cls: Type[GeneticCode]) -> GeneticCode:
+        """
+        Create the standard genetic code.
+        """
+        codons = ("".join(c).encode() for c in itertools.product(_BASES, repeat=3))
+        aminos = (a.encode() for a in _STANDARD)
+        return cls(dict(zip(codons, aminos)))
+
+    def translate(self, codon: bytes) -> bytes:
+        """
+        Amino acid encoded by a codon.
+
+        Parameters
+        ----------
+        codon
+            Three nucleotides, either DNA or RNA.
+        """
+        return self._table[codon.upper().replace(b"U", b"T")]
+
+    def codons(self, amino: bytes) -> List[bytes]:
+        """
+        DNA codons that encode an amino acid.
+        """
+        return [c for c, a in self._table.items() if a == amino]
+
+    def codon_lprobs(
+        self, bases: bytes, aminos: bytes, lprobs: Sequence[float]
+    ) -> List[float]:
+        """
+        Codon log probabilities from amino acid log probabilities.
+
+        The probability of an amino acid is evenly split among its synonymous
+        codons. Stop codons, and codons of amino acids not in `aminos`, have zero
+        probability.
+
+        Parameters
+        ----------
+        bases
+            Symbols of a four-nucleotides alphabet, e.g. ``b"ACGU"``.
+        aminos
+            Amino acid symbols.
+        lprobs
+            Log probability of each amino acid in `aminos`.
+
+        Returns
+        -------
+        Log probability of each codon, in `codon_iter` order for an alphabet with
+        symbols `bases`.
+        """
+        amino_lprob = {aminos[i : i + 1]: lprobs[i] for i in range(len(aminos))}
+        nsyn: Dict[bytes, int] = {}
+        for amino in self._table.values():
+            nsyn[amino] = nsyn.get(amino, 0) + 1
+
+        row: List[float] = []
+        for triplet in itertools.product(bases, repeat=3):
+            amino = self.translate(bytes(triplet))
+            lprob = amino_lprob.get(amino, -inf)
+            row.append(lprob - log(nsyn[amino]) if lprob > -inf else -inf)
+        return row
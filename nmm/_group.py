@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from math import inf
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from ._dp import emission_lengths
+from ._emission import EmissionTable
+from ._model import Model
+from ._topology import Topology
+
+__all__ = ["ModelGroup", "group_models", "topology_signature"]
+
+Lanes = List[float]
+
+
+def topology_signature(topology: Topology) -> Hashable:
+    """
+    Structure of a model graph, regardless of its parameters.
+
+    Two graphs have the same signature if their states, in order, have the same
+    emission lengths and if they have the same start states, transitions and
+    end state.
+    """
+    return (
+        tuple(zip(topology.min_seq, topology.max_seq)),
+        tuple(i for i, v in enumerate(topology.start_lprobs) if v > -inf),
+        tuple(sorted(topology.transitions.keys())),
+        topology.end,
+    )
+
+
+class ModelGroup:
+    """
+    Models sharing the same graph, scored together.
+
+    Start, transition and emission parameters are stacked per state, one value
+    per model, and a sequence is scored against every model of the group in a
+    single pass over its DP rows. The pass runs in Python and is slower than
+    scoring each model with the native `dp.viterbi`, which should be used for
+    throughput; it serves as a reference.
+
+    Parameters
+    ----------
+    models
+        Models with equal `topology_signature`.
+    """
+
+    __slots__ = ("_models", "_signature", "_topology", "_start", "_pred", "_emissions")
+
+    def __init__(self, models: List[Model]):
+        if not models:
+            raise ValueError("A group needs at least one model.")
+        topologies = [model.topology for model in models]
+        first = topologies[0]
+        signature = topology_signature(first)
+        for topology in topologies[1:]:
+            if topology_signature(topology) != signature:
+                raise ValueError("Models have different topologies.")
+
+        nstates = first.nstates
+        self._models = list(models)
+        self._signature = signature
+        self._topology = first
+        self._start: List[Lanes] = [
+            [top.start_lprobs[t] for top in topologies] for t in range(nstates)
+        ]
+        self._pred: List[List[Tuple[int, Lanes]]] = [
+            [
+                (s, [top.transitions[(s, t)] for top in topologies])
+                for s, _ in first.predecessors(t)
+            ]
+            for t in range(nstates)
+        ]
+        self._emissions: List[List[EmissionTable]] = [
+            [top.emissions[t] for top in topologies] for t in range(nstates)
+        ]
+
+    @classmethod
+    def create(cls, models: Iterable[Model]) -> ModelGroup:
+        return cls(list(models))
+
+    @property
+    def models(self) -> List[Model]:
+        return self._models
+
+    @property
+    def signature(self) -> Hashable:
+        return self._signature
+
+    def viterbi_scores(self, seq: bytes) -> List[float]:
+        """
+        Viterbi log-likelihood of a sequence under each model of the group.
+
+        Parameters
+        ----------
+        seq
+            Sequence symbols.
+
+        Returns
+        -------
+        One log-likelihood per model, in group order.
+        """
+        topology = self._topology
+        nstates = topology.nstates
+        nmodels = len(self._models)
+        lengths = emission_lengths(topology)
+        emitters = [i for i in range(nstates) if lengths[i]]
+        seq = bytes(seq)
+
+        nrows = max(topology.max_seq) + 1
+        rows: List[List[Lanes]] = [[[] for _ in range(nstates)] for _ in range(nrows)]
+        unreachable = [-inf] * nmodels
+
+        for pos in range(len(seq) + 1):
+            row = rows[pos % nrows]
+            for t in range(nstates):
+                row[t] = unreachable
+
+            for t in emitters:
+                tables = self._emissions[t]
+                out = unreachable
+                for size in lengths[t]:
+                    if size > pos:
+                        break
+                    symbols = seq[pos - size : pos]
+                    e = [table(symbols) for table in tables]
+                    prev = rows[(pos - size) % nrows]
+                    inc = self._start[t] if pos == size else unreachable
+                    for s, lprobs in self._pred[t]:
+                        inc = [max(a, b + c) for a, b, c in zip(inc, prev[s], lprobs)]
+                    out = [max(o, a + b) for o, a, b in zip(out, inc, e)]
+                row[t] = out
+
+            for t in topology.mute_order:
+                e = [table(b"") for table in self._emissions[t]]
+                inc = self._start[t] if pos == 0 else unreachable
+                for s, lprobs in self._pred[t]:
+                    inc = [max(a, b + c) for a, b, c in zip(inc, row[s], lprobs)]
+                row[t] = [max(o, a + b) for o, a, b in zip(row[t], inc, e)]
+
+        return list(rows[len(seq) % nrows][topology.end])
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __iter__(self):
+        return iter(self._models)
+
+
+def group_models(
+    models: Iterable[Model], max_models: Optional[int] = None
+) -> Iterator[ModelGroup]:
+    """
+    Group consecutive models of equal topology signature, as they are read.
+
+    Only the group being filled is held in memory, so models of the same
+    signature form one group only if they are adjacent.
+
+    Parameters
+    ----------
+    models
+        Models, possibly read lazily from a file.
+    max_models
+        Maximum number of models of a group. Unbounded by default.
+    """
+    if max_models is not None and max_models < 1:
+        raise ValueError("`max_models` must be positive.")
+    members: List[Model] = []
+    signature: Hashable = None
+    for model in models:
+        model_signature = topology_signature(model.topology)
+        if members and (model_signature != signature or len(members) == max_models):
+            yield ModelGroup(members)
+            members = []
+        members.append(model)
+        signature = model_signature
+    if members:
+        yield ModelGroup(members)
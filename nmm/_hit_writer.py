@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import IO, Dict, List, Optional, Tuple, Type, Union
+
+from imm import Fragment, Path, Sequence
+
+from ._state import FrameState
+
+__all__ = ["HitWriter", "path_summary"]
+
+COLUMNS = ("model", "sequence", "loglikelihood", "path", "codons")
+_SEPARATORS = frozenset("\t\n\r")
+
+
+class HitWriter:
+    """
+    Buffered tab-separated writer of scoring hits.
+
+    Hits are buffered column by column and written as a batch of rows once
+    `flush_size` hits accumulate. Writing is thread-safe.
+
+    Parameters
+    ----------
+    stream
+        Text stream.
+    flush_size
+        Number of buffered hits that triggers a write.
+    header
+        Whether to write the column names first.
+    """
+
+    def __init__(self, stream: IO[str], flush_size: int = 10000, header: bool = True):
+        self._stream = stream
+        self._flush_size = flush_size
+        self._columns: Dict[str, List[str]] = {name: [] for name in COLUMNS}
+        self._nbuffered = 0
+        self._lock = Lock()
+        self._owned = False
+        if header:
+            stream.write("\t".join(COLUMNS) + "\n")
+
+    @classmethod
+    def create(
+        cls: Type[HitWriter], filepath: Union[str, bytes], flush_size: int = 10000
+    ) -> HitWriter:
+        """
+        Create a writer of a new file.
+        """
+        writer = cls(open(filepath, "w"), flush_size)
+        writer._owned = True
+        return writer
+
+    def write(
+        self,
+        model: str,
+        sequence: str,
+        loglikelihood: float,
+        path: str = "",
+        codons: str = "",
+    ):
+        """
+        Buffer a hit.
+
+        Parameters
+        ----------
+        model
+            Model name.
+        sequence
+            Sequence identifier.
+        loglikelihood
+            Log-likelihood.
+        path
+            Path summary.
+        codons
+            Decoded codons.
+
+        Raises
+        ------
+        ValueError
+            If a field contains a tab or a line break.
+        """
+        fields = (model, sequence, path, codons)
+        if any(_SEPARATORS.intersection(field) for field in fields):
+            raise ValueError("Hit fields must not contain tabs or line breaks.")
+        with self._lock:
+            columns = self._columns
+            columns["model"].append(model)
+            columns["sequence"].append(sequence)
+            columns["loglikelihood"].append(repr(loglikelihood))
+            columns["path"].append(path)
+            columns["codons"].append(codons)
+            self._nbuffered += 1
+            if self._nbuffered >= self._flush_size:
+                self._flush()
+
+    def write_result(
+        self,
+        model: str,
+        sequence: str,
+        seq: Sequence,
+        loglikelihood: float,
+        path: Optional[Path] = None,
+    ):
+        """
+        Buffer a Viterbi hit, summarizing its path and decoded codons.
+
+        Parameters
+        ----------
+        model
+            Model name.
+        sequence
+            Sequence identifier.
+        seq
+            Scored sequence.
+        loglikelihood
+            Viterbi log-likelihood.
+        path
+            Viterbi path, if available.
+        """
+        if path is None:
+            self.write(model, sequence, loglikelihood)
+            return
+        summary, codons = path_summary(seq, path)
+        self.write(model, sequence, loglikelihood, summary, codons)
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        self.flush()
+        if self._owned:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        del exception_type
+        del exception_value
+        del traceback
+        self.close()
+
+    def _flush(self):
+        if self._nbuffered == 0:
+            return
+        rows = zip(*(self._columns[name] for name in COLUMNS))
+        self._stream.write("".join("\t".join(row) + "\n" for row in rows))
+        for values in self._columns.values():
+            values.clear()
+        self._nbuffered = 0
+
+
+def path_summary(seq: Sequence, path: Path) -> Tuple[str, str]:
+    """
+    Summarize a path and the codons decoded by its frame-state steps.
+
+    Returns
+    -------
+    Comma-separated ``name:length`` steps, and the concatenated codons.
+    """
+    steps: List[str] = []
+    codons: List[bytes] = []
+    for frag_step in Fragment(seq, path):
+        state = frag_step.step.state
+        steps.append(f"{state.name.decode()}:{frag_step.step.seq_len}")
+        if isinstance(state, FrameState):
+            codons.append(state.decode(frag_step.sequence)[1].symbols)
+    return ",".join(steps), b"".join(codons).decode()
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from math import exp, inf, log
+from typing import (
+    IO,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from imm import MuteState, State
+
+from ._alphabet import BaseAlphabet
+from ._genetic_code import GeneticCode
+from ._model import Model
+from ._output import Output
+from ._profile import TableFactory
+from ._state import FrameState
+from ._topology import Topology
+
+__all__ = ["HMMERProfile", "convert_hmmer3", "read_hmmer3", "read_model_names"]
+
+
+class HMMERProfile(NamedTuple):
+    """
+    Parameters of a HMMER3 protein profile.
+
+    All values are natural log probabilities.
+
+    Attributes
+    ----------
+    name
+        Profile name.
+    aminos
+        Amino acid symbols, in the order of the emission columns.
+    match
+        Match emissions of nodes 1, ..., L.
+    insert
+        Insert emissions of nodes 0, ..., L.
+    trans
+        Transitions of nodes 0, ..., L, in the order m→m, m→i, m→d, i→m, i→i,
+        d→m, d→d.
+    """
+
+    name: str
+    aminos: bytes
+    match: List[List[float]]
+    insert: List[List[float]]
+    trans: List[List[float]]
+
+    @property
+    def length(self) -> int:
+        return len(self.match)
+
+
+class FrameProfileParams(NamedTuple):
+    """
+    Frame-state profile parameters derived from a `HMMERProfile`.
+    """
+
+    name: str
+    base: List[float]
+    match: List[List[float]]
+    insert: List[List[float]]
+    trans: List[List[float]]
+
+
+def read_hmmer3(stream: IO[str]) -> Iterator[HMMERProfile]:
+    """
+    Read HMMER3 protein profiles from a plain-text ``.hmm`` stream.
+
+    Profiles are parsed one at a time, so memory usage does not depend on the
+    number of profiles in the stream.
+
+    Parameters
+    ----------
+    stream
+        Text stream.
+    """
+    for block in _blocks(stream):
+        yield _parse_block(block)
+
+
+def convert_hmmer3(
+    hmm_filepath: Union[str, bytes],
+    nmm_filepath: bytes,
+    alphabet: BaseAlphabet,
+    epsilon: float = 0.01,
+    genetic_code: Optional[GeneticCode] = None,
+    workers: int = 1,
+) -> int:
+    """
+    Convert HMMER3 protein profiles into frame-state models.
+
+    Each profile node becomes a match frame state, an insert frame state, and a
+    delete mute state. Amino acid emissions are mapped to codon probabilities via
+    `genetic_code`. Profiles are streamed from `hmm_filepath` and written, in
+    order, to `nmm_filepath`. Their names are written, in the same order, to a
+    sidecar file read back by `read_model_names`.
+
+    Parameters
+    ----------
+    hmm_filepath
+        HMMER3 plain-text file.
+    nmm_filepath
+        Output file.
+    alphabet
+        Four-nucleotides alphabet of the resulting models.
+    epsilon
+        Epsilon of the frame states.
+    genetic_code
+        Genetic code. Defaults to the standard one.
+    workers
+        Number of processes that convert parameters in parallel.
+
+    Returns
+    -------
+    Number of converted profiles.
+    """
+    if genetic_code is None:
+        genetic_code = GeneticCode.create()
+
+    bases = alphabet.symbols
+    names: List[str] = []
+    with open(hmm_filepath, "r") as stream, Output.create(nmm_filepath) as output:
+        profiles = read_hmmer3(stream)
+        for params in _map_params(profiles, bases, genetic_code, workers):
+            output.write(_create_model(params, alphabet, epsilon))
+            names.append(params.name)
+    with open(names_filepath(nmm_filepath), "w") as stream:
+        stream.writelines(f"{name}\n" for name in names)
+    return len(names)
+
+
+def names_filepath(filepath: bytes) -> bytes:
+    """
+    Sidecar file storing the names of the models in `filepath`.
+    """
+    return filepath + b".names"
+
+
+def read_model_names(filepath: bytes) -> List[str]:
+    """
+    Names of the models of a file converted by `convert_hmmer3`, in file order.
+
+    Returns an empty list if there is no sidecar file.
+    """
+    try:
+        stream = open(names_filepath(filepath), "r")
+    except FileNotFoundError:
+        return []
+    with stream:
+        return [line.rstrip("\n") for line in stream]
+
+
+def frame_profile_params(
+    profile: HMMERProfile, bases: bytes, genetic_code: GeneticCode
+) -> FrameProfileParams:
+    """
+    Derive frame-state parameters from a protein profile.
+
+    Parameters
+    ----------
+    profile
+        Protein profile.
+    bases
+        Symbols of the four-nucleotides alphabet.
+    genetic_code
+        Genetic code.
+    """
+    aminos = profile.aminos
+    match = [genetic_code.codon_lprobs(bases, aminos, r) for r in profile.match]
+    insert = [genetic_code.codon_lprobs(bases, aminos, r) for r in profile.insert]
+    base = _base_lprobs(match)
+    return FrameProfileParams(profile.name, base, match, insert, profile.trans)
+
+
+def _map_params(
+    profiles: Iterator[HMMERProfile],
+    bases: bytes,
+    genetic_code: GeneticCode,
+    workers: int,
+) -> Iterator[FrameProfileParams]:
+    if workers <= 1:
+        for profile in profiles:
+            yield frame_profile_params(profile, bases, genetic_code)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _bounded_map(executor, profiles, bases, genetic_code, 2 * workers)
+
+
+def _bounded_map(
+    executor: Executor,
+    profiles: Iterator[HMMERProfile],
+    bases: bytes,
+    genetic_code: GeneticCode,
+    limit: int,
+) -> Iterator[FrameProfileParams]:
+    pending: Deque[Future] = deque()
+    for profile in profiles:
+        pending.append(
+            executor.submit(frame_profile_params, profile, bases, genetic_code)
+        )
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _create_model(
+    params: FrameProfileParams, alphabet: BaseAlphabet, epsilon: float
+) -> Model:
+    factory = TableFactory(alphabet)
+    baset = factory.base_table(params.base)
+    length = len(params.match)
+
+    B = MuteState.create(b"B", alphabet)
+    E = MuteState.create(b"E", alphabet)
+    M: List[FrameState] = []
+    I: List[FrameState] = []
+    D: List[MuteState] = []
+    for k in range(1, length + 1):
+        codont = factory.codon_table(params.match[k - 1])
+        M.append(FrameState.create(f"M{k}".encode(), baset, codont, epsilon))
+        D.append(MuteState.create(f"D{k}".encode(), alphabet))
+        if k < length:
+            codont = factory.codon_table(params.insert[k])
+            I.append(FrameState.create(f"I{k}".encode(), baset, codont, epsilon))
+
+    states: List[State] = [B]
+    for k in range(length):
+        states.append(M[k])
+        states.append(D[k])
+        if k + 1 < length:
+            states.append(I[k])
+    states.append(E)
+    index = {id(state): i for i, state in enumerate(states)}
+    trans: Dict[Tuple[int, int], float] = {}
+
+    def set_trans(a: State, b: State, lprob: float):
+        trans[(index[id(a)], index[id(b)])] = lprob
+
+    MM, MI, MD, IM, II, DM, DD = range(7)
+    t = params.trans
+    set_trans(B, M[0], t[0][MM])
+    set_trans(B, D[0], t[0][MD])
+    for k in range(length - 1):
+        tk = t[k + 1]
+        set_trans(M[k], M[k + 1], tk[MM])
+        set_trans(M[k], I[k], tk[MI])
+        set_trans(M[k], D[k + 1], tk[MD])
+        set_trans(I[k], M[k + 1], tk[IM])
+        set_trans(I[k], I[k], tk[II])
+        set_trans(D[k], M[k + 1], tk[DM])
+        set_trans(D[k], D[k + 1], tk[DD])
+    set_trans(M[-1], E, 0.0)
+    set_trans(D[-1], E, 0.0)
+
+    start = [0.0] + [-inf] * (len(states) - 1)
+    topology = Topology(alphabet, states, start, trans, len(states) - 1)
+    return Model.create_from_topology(topology)
+
+
+def _base_lprobs(codon_rows: List[List[float]]) -> List[float]:
+    """
+    Nucleotide log probabilities averaged over codon positions and rows.
+    """
+    probs = [0.0] * 4
+    for row in codon_rows:
+        for i, lprob in enumerate(row):
+            p = exp(lprob)
+            probs[i // 16] += p
+            probs[(i // 4) % 4] += p
+            probs[i % 4] += p
+    total = sum(probs)
+    if total == 0.0:
+        return [log(0.25)] * 4
+    return [log(p / total) if p > 0.0 else -inf for p in probs]
+
+
+def _blocks(stream: IO[str]) -> Iterator[List[str]]:
+    block: List[str] = []
+    for line in stream:
+        if line.startswith("//"):
+            if block:
+                yield block
+            block = []
+        elif line.strip():
+            block.append(line)
+    if block:
+        raise ValueError("Unterminated HMMER3 profile.")
+
+
+def _parse_block(block: List[str]) -> HMMERProfile:
+    name = ""
+    aminos = b""
+    i = 0
+    while i < len(block):
+        fields = block[i].split()
+        i += 1
+        if fields[0] == "NAME":
+            name = fields[1]
+        elif fields[0] == "HMM":
+            aminos = "".join(fields[1:]).encode()
+            # Skip the transition header line.
+            i += 1
+            break
+    else:
+        raise ValueError(f"Missing HMM section in profile {name!r}.")
+
+    nsymbols = len(aminos)
+    if block[i].split()[0] == "COMPO":
+        i += 1
+
+    match: List[List[float]] = []
+    insert = [_lprobs(block[i].split(), nsymbols)]
+    trans = [_lprobs(block[i + 1].split(), 7)]
+    i += 2
+    while i + 2 < len(block):
+        fields = block[i].split()
+        match.append(_lprobs(fields[1:], nsymbols))
+        insert.append(_lprobs(block[i + 1].split(), nsymbols))
+        trans.append(_lprobs(block[i + 2].split(), 7))
+        i += 3
+
+    if i != len(block):
+        raise ValueError(f"Truncated node in profile {name!r}.")
+    if not match:
+        raise ValueError(f"Profile {name!r} has no nodes.")
+
+    return HMMERProfile(name, aminos, match, insert, trans)
+
+
+def _lprobs(fields: List[str], size: int) -> List[float]:
+    """
+    Convert HMMER negative natural log probabilities.
+    """
+    if len(fields) < size:
+        raise ValueError("Missing values in HMMER3 profile.")
+    return [-inf if f == "*" else -float(f) for f in fields[:size]]
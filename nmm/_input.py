@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Iterator, Type
+from typing import Dict, Iterator, Optional, Type
 
 from imm import DP, HMM, State
 
@@ -8,7 +8,9 @@ from . import wrap
 from ._alphabet import BaseAlphabet
 from ._cdata import CData
 from ._codon_prob import CodonProb
+from ._evalue import ScoreStatistics, read_statistics
 from ._ffi import ffi, lib
+from ._group import ModelGroup, group_models
 from ._model import Model
 from ._table import BaseTable, CodonTable
 
@@ -16,19 +18,37 @@ __all__ = ["Input"]
 
 
 class Input:
-    def __init__(self, nmm_input: CData):
+    __slots__ = ("_nmm_input", "_statistics", "_index")
+
+    def __init__(
+        self, nmm_input: CData, statistics: Optional[Dict[int, ScoreStatistics]] = None
+    ):
         if nmm_input == ffi.NULL:
             raise RuntimeError("`nmm_input` is NULL.")
         self._nmm_input = nmm_input
+        self._statistics = {} if statistics is None else statistics
+        self._index: Optional[int] = 0
 
     @classmethod
     def create(cls: Type[Input], filepath: bytes) -> Input:
-        return cls(lib.nmm_input_create(filepath))
+        """
+        Open a model file.
+
+        Parameters
+        ----------
+        filepath
+            File path.
+        """
+        nmm_input = lib.nmm_input_create(filepath)
+        stats = read_statistics(filepath)
+        return cls(nmm_input, stats)
 
     def fseek(self, offset: int):
         err: int = lib.nmm_input_fseek(self._nmm_input, offset)
         if err != 0:
             raise RuntimeError("Could not fseek.")
+        # Model indices are unknown past an arbitrary offset.
+        self._index = 0 if offset == 0 else None
 
     def ftell(self) -> int:
         offset: int = lib.nmm_input_ftell(self._nmm_input)
@@ -58,7 +78,25 @@ class Input:
 
         hmm = HMM(lib.nmm_model_hmm(nmm_model), abc, states)
         dp = DP(lib.nmm_model_dp(nmm_model), hmm)
-        return Model(nmm_model, hmm, dp)
+        model = Model(nmm_model, hmm, dp)
+
+        if self._index is not None:
+            model.statistics = self._statistics.get(self._index)
+            self._index += 1
+        return model
+
+    def read_groups(self, max_models: Optional[int] = None) -> Iterator[ModelGroup]:
+        """
+        Read the remaining models, grouping consecutive ones by topology.
+
+        Models are read as groups are consumed, see `group_models`.
+
+        Parameters
+        ----------
+        max_models
+            Maximum number of models of a group. Unbounded by default.
+        """
+        return group_models(self, max_models)
 
     def close(self):
         err: int = lib.nmm_input_close(self._nmm_input)
@@ -1,30 +1,81 @@
 from __future__ import annotations
 
-from typing import Type
+from math import inf
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from imm import DP, HMM, Alphabet
+from imm import DP, HMM, Alphabet, Fragment, Path, Sequence, Step
 
+from ._batch import viterbi_scores
+from ._cache import CachedResult, ResultCache
 from ._cdata import CData
+from ._dp import forward_score
+from ._encoded import SequenceLike, as_sequence
+from ._evalue import ScoreStatistics, calibrate
 from ._ffi import ffi, lib
+from ._fingerprint import fingerprint
+from ._nbytes import (
+    dp_nbytes,
+    dp_workspace_nbytes,
+    hmm_nbytes,
+    object_nbytes,
+    state_nbytes,
+)
+from ._path import ViterbiPath, viterbi_path
+from ._scan import Hit, scan
+from ._state import CodonState, FrameState
+from ._topology import Topology
 
 __all__ = ["Model"]
 
 
 class Model:
-    def __init__(self, nmm_model: CData, hmm: HMM, dp: DP):
+    __slots__ = (
+        "_nmm_model",
+        "_hmm",
+        "_dp",
+        "_topology",
+        "_statistics",
+        "_result_cache",
+        "_fingerprint",
+    )
+
+    def __init__(
+        self, nmm_model: CData, hmm: HMM, dp: DP, topology: Optional[Topology] = None
+    ):
         if nmm_model == ffi.NULL:
             raise RuntimeError("`nmm_model` is NULL.")
         self._nmm_model = nmm_model
         self._hmm = hmm
         self._dp = dp
+        self._topology = topology
+        self._statistics: Optional[ScoreStatistics] = None
+        self._result_cache: Optional[ResultCache] = None
+        self._fingerprint: Optional[str] = None
 
     @property
     def nmm_model(self) -> CData:
         return self._nmm_model
 
     @classmethod
-    def create(cls: Type[Model], hmm: HMM, dp: DP) -> Model:
-        return cls(lib.nmm_model_create(hmm.imm_hmm, dp.imm_dp), hmm, dp)
+    def create(
+        cls: Type[Model], hmm: HMM, dp: DP, topology: Optional[Topology] = None
+    ) -> Model:
+        nmm_model = lib.nmm_model_create(hmm.imm_hmm, dp.imm_dp)
+        return cls(nmm_model, hmm, dp, topology)
+
+    @classmethod
+    def create_from_topology(cls: Type[Model], topology: Topology) -> Model:
+        """
+        Create a model from its graph.
+
+        Parameters
+        ----------
+        topology
+            Model graph.
+        """
+        hmm = topology.create_hmm()
+        dp = hmm.create_dp(topology.states[topology.end])
+        return cls.create(hmm, dp, topology)
 
     @property
     def alphabet(self) -> Alphabet:
@@ -38,6 +89,324 @@ class Model:
     def hmm(self) -> HMM:
         return self._hmm
 
+    @property
+    def topology(self) -> Topology:
+        """
+        Model graph, read from the HMM on first access unless given at creation.
+
+        Reading the graph costs O(states²) native calls, so models that are only
+        scored with `dp.viterbi` never pay for it.
+        """
+        if self._topology is None:
+            self._topology = Topology.create(self._hmm)
+        return self._topology
+
+    def _transient_topology(self) -> Topology:
+        if self._topology is None:
+            return Topology.create(self._hmm)
+        return self._topology
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content hash of the model, stable across processes and runs.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.topology)
+        return self._fingerprint
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """
+        Cache used by `viterbi` and `viterbi_batch`, if any.
+        """
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, cache: Optional[ResultCache]):
+        self._result_cache = cache
+
+    def viterbi(self, seq: SequenceLike) -> CachedResult:
+        """
+        Viterbi result, served from `result_cache` when possible.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        """
+        cache = self._result_cache
+        if cache is None:
+            return self._viterbi(seq, True)
+
+        key = cache.key(seq)
+        result = cache.get(key)
+        if result is None:
+            result = self._viterbi(seq, cache.store_path)
+            cache.put(key, result, len(seq))
+        return result
+
+    def viterbi_batch(self, seqs: List[SequenceLike]) -> List[CachedResult]:
+        """
+        Viterbi results of a batch, scoring each distinct sequence once.
+
+        Parameters
+        ----------
+        seqs
+            Sequences.
+        """
+        distinct: Dict[bytes, CachedResult] = {}
+        results: List[CachedResult] = []
+        for seq in seqs:
+            symbols = bytes(seq)
+            result = distinct.get(symbols)
+            if result is None:
+                result = self.viterbi(seq)
+                distinct[symbols] = result
+            results.append(result)
+        return results
+
+    def _viterbi(self, seq: SequenceLike, store_path: bool) -> CachedResult:
+        results = self._dp.viterbi(as_sequence(seq, self.alphabet))
+        loglik: float = results[0].loglikelihood
+        return CachedResult(loglik, results if store_path else None)
+
+    def viterbi_score(self, seq: SequenceLike) -> float:
+        """
+        Viterbi log-likelihood, as computed by `dp.viterbi`.
+
+        The path of the native result is released right away instead of being
+        kept by the caller. The native DP has no score-only mode, so the traceback
+        is still computed.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        """
+        return self._viterbi(seq, False).loglikelihood
+
+    def viterbi_path(
+        self, seq: SequenceLike, interval: Optional[int] = None
+    ) -> ViterbiPath:
+        """
+        Viterbi log-likelihood and path in sublinear memory.
+
+        Only checkpoint rows are kept during the forward pass, and the traceback
+        recomputes the rows between checkpoints. Peak memory is O(states × √N)
+        by default instead of O(states × N) for `dp.viterbi`.
+
+        This is a pure-Python reference engine, much slower than `dp.viterbi`. Its
+        score matches the native one up to rounding, but it is not bit-identical,
+        and ties between equally likely paths may be broken differently.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        interval
+            Number of positions between checkpoints. Defaults to ⌊√N⌋ + 1.
+        """
+        topology = self.topology
+        loglik, steps = viterbi_path(topology, bytes(seq), interval)
+        if steps is None:
+            return ViterbiPath(loglik, None)
+        states = topology.states
+        path = Path.create([Step.create(states[t], size) for t, size in steps])
+        return ViterbiPath(loglik, path)
+
+    def viterbi_scores(self, seqs: List[SequenceLike], lanes: int = 16) -> List[float]:
+        """
+        Viterbi log-likelihoods of many sequences, computed lane-wise in Python.
+
+        Sequences are sorted by length and scored `lanes` at a time, their DP rows
+        advanced together. This is a reference engine to check native scores
+        against: it is slower than calling `viterbi_score`, i.e. `dp.viterbi`, on
+        each sequence, which should be used for throughput.
+
+        Parameters
+        ----------
+        seqs
+            Sequences.
+        lanes
+            Number of sequences advanced together.
+
+        Returns
+        -------
+        Viterbi log-likelihood of each sequence, in the given order.
+        """
+        symbols = [bytes(seq) for seq in seqs]
+        order = sorted(range(len(symbols)), key=lambda i: len(symbols[i]))
+        scores = [0.0] * len(symbols)
+        for first in range(0, len(order), lanes):
+            group = order[first : first + lanes]
+            batch = viterbi_scores(self.topology, [symbols[i] for i in group])
+            for i, score in zip(group, batch):
+                scores[i] = score
+        return scores
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the model, native allocations included.
+
+        It covers the HMM, the DP, the states and their tables, each table counted
+        once however many states share it, and the Python-side graph if it has
+        been read. Otherwise the graph is read for the estimate only and then
+        dropped. Native sizes are rough guesses, see `nmm._nbytes`. DP workspaces,
+        which only exist during a call, are estimated by `dp_workspace_nbytes`.
+        """
+        size = object_nbytes(self) + object_nbytes(self._hmm) + object_nbytes(self._dp)
+        if self._topology is not None:
+            size += self._topology.nbytes
+        topology = self._transient_topology()
+        size += hmm_nbytes(topology) + dp_nbytes(topology)
+        tables: Dict[int, Any] = {}
+        for state in topology.states:
+            size += state_nbytes(state)
+            if isinstance(state, FrameState):
+                tables[id(state.base_table)] = state.base_table
+                tables[id(state.codon_table)] = state.codon_table
+            elif isinstance(state, CodonState):
+                tables[id(state.codon_prob)] = state.codon_prob
+        return size + sum(table.nbytes for table in tables.values())
+
+    def dp_workspace_nbytes(self, seq_len: int) -> int:
+        """
+        Estimated memory used by a `dp.viterbi` call, on top of `nbytes`.
+
+        It does not cover the Python reference engines, which allocate Python
+        objects instead of native cells and need `topology`.
+
+        Parameters
+        ----------
+        seq_len
+            Sequence length.
+        """
+        return dp_workspace_nbytes(self._transient_topology(), seq_len)
+
+    def forward_score(self, seq: SequenceLike) -> float:
+        """
+        Forward log-likelihood.
+
+        The native DP has no Forward algorithm, so this runs the pure-Python
+        recursion of `topology`. Memory is O(states) per sequence but it is much
+        slower than `dp.viterbi`: it is meant for validation and small models, not
+        for filtering large searches.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        """
+        return forward_score(self.topology, bytes(seq))
+
+    @property
+    def statistics(self) -> Optional[ScoreStatistics]:
+        """
+        Null score distribution, if the model has been calibrated.
+        """
+        return self._statistics
+
+    @statistics.setter
+    def statistics(self, statistics: Optional[ScoreStatistics]):
+        self._statistics = statistics
+
+    def calibrate(
+        self, length: int, nsamples: int = 1000, seed: int = 0, workers: int = 1
+    ) -> ScoreStatistics:
+        """
+        Fit and store the null score distribution.
+
+        The statistics are saved alongside the model by `Output` and restored by
+        `Input`.
+
+        Parameters
+        ----------
+        length
+            Length of the random sequences.
+        nsamples
+            Number of random sequences.
+        seed
+            Random seed.
+        workers
+            Number of threads scoring sequences concurrently.
+        """
+        self._statistics = calibrate(self, length, nsamples, seed, workers)
+        return self._statistics
+
+    def evalue(self, loglikelihood: float, nsequences: int = 1) -> float:
+        """
+        E-value of a Viterbi log-likelihood.
+
+        Parameters
+        ----------
+        loglikelihood
+            Viterbi log-likelihood.
+        nsequences
+            Number of sequences searched.
+        """
+        if self._statistics is None:
+            raise RuntimeError("Model is not calibrated.")
+        return self._statistics.evalue(loglikelihood, nsequences)
+
+    def scan(
+        self,
+        seq: SequenceLike,
+        window_length: int,
+        overlap: int,
+        threshold: float = -inf,
+        workers: int = 1,
+    ) -> List[Hit]:
+        """
+        Find hits in a long sequence by Viterbi over overlapping windows.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        window_length
+            Window length.
+        overlap
+            Number of positions shared by consecutive windows.
+        threshold
+            Minimum log-likelihood of a hit.
+        workers
+            Number of threads scoring windows concurrently.
+        """
+        return scan(self, bytes(seq), window_length, overlap, threshold, workers)
+
+    def codon_lposteriors(self, seq: Sequence, path: Path) -> List[List[float]]:
+        """
+        Codon log posteriors along an alignment.
+
+        Parameters
+        ----------
+        seq
+            Sequence.
+        path
+            Path of `seq`, e.g. from ``dp.viterbi(seq)[0].path``.
+
+        Returns
+        -------
+        One row per frame-state step of `path`, in path order, holding the log
+        posterior of each of the 64 codons in `codon_iter` order. The result can
+        be converted with ``numpy.asarray`` into a (steps × 64) array.
+        """
+        memo: Dict[Tuple[CData, bytes], List[float]] = {}
+        rows: List[List[float]] = []
+        for frag_step in Fragment(seq, path):
+            state = frag_step.step.state
+            if not isinstance(state, FrameState):
+                continue
+            key = (state.imm_state, bytes(frag_step.sequence))
+            row = memo.get(key)
+            if row is None:
+                row = state.lposteriors(frag_step.sequence)
+                memo[key] = row
+            rows.append(row)
+        return rows
+
     # @property
     # def alphabet(self) -> BaseAlphabet:
     #     return self._alphabet
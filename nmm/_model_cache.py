@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+from threading import Lock
+from typing import Callable, List, Optional, Tuple, Union
+
+from ._evalue import statistics_filepath, write_statistics
+from ._input import Input
+from ._model import Model
+from ._output import Output
+
+__all__ = ["ModelCache"]
+
+_SUFFIX = b".nmm"
+
+
+class ModelCache:
+    """
+    Content-addressed directory of model files.
+
+    Each entry is a ``<key>.nmm`` file, with its score statistics sidecar when
+    the model is calibrated. Entries are written atomically, so concurrent
+    processes sharing a directory never read a partial file. When the directory
+    grows beyond `max_nbytes`, the least recently used entries are removed.
+
+    Parameters
+    ----------
+    directory
+        Cache directory, created if missing.
+    max_nbytes
+        Maximum total size of the entries, in bytes.
+    """
+
+    def __init__(
+        self, directory: Union[str, bytes], max_nbytes: int = 1024 * 1024 * 1024
+    ):
+        self._directory = os.fsencode(directory)
+        self._max_nbytes = max_nbytes
+        self._lock = Lock()
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> bytes:
+        return self._directory
+
+    def filepath(self, key: str) -> bytes:
+        if not key.isalnum():
+            raise ValueError("Cache keys must be alphanumeric.")
+        return os.path.join(self._directory, key.encode() + _SUFFIX)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.filepath(key))
+
+    def load(self, key: str) -> Optional[Model]:
+        """
+        Read the model of an entry, if present.
+        """
+        filepath = self.filepath(key)
+        try:
+            os.utime(filepath)
+        except FileNotFoundError:
+            return None
+        with Input.create(filepath) as input:
+            return input.read()
+
+    def store(self, model: Model, key: Optional[str] = None) -> str:
+        """
+        Write a model entry.
+
+        Parameters
+        ----------
+        model
+            Model.
+        key
+            Entry key. Defaults to the model fingerprint.
+
+        Returns
+        -------
+        Entry key.
+        """
+        if key is None:
+            key = model.fingerprint
+        filepath = self.filepath(key)
+        tmp_filepath = filepath + f".{os.getpid()}.{id(model)}.tmp".encode()
+        with Output.create(tmp_filepath) as output:
+            output.write(model)
+
+        tmp_stats = statistics_filepath(tmp_filepath)
+        if os.path.exists(tmp_stats):
+            os.replace(tmp_stats, statistics_filepath(filepath))
+        else:
+            write_statistics(filepath, {})
+        os.replace(tmp_filepath, filepath)
+        self.evict()
+        return key
+
+    def load_or_build(self, key: str, build: Callable[[], Model]) -> Model:
+        """
+        Load an entry, or build and store it if missing.
+
+        Parameters
+        ----------
+        key
+            Entry key, e.g. from `hash_parts` over the build inputs.
+        build
+            Function building the model.
+        """
+        model = self.load(key)
+        if model is None:
+            model = build()
+            self.store(model, key)
+        return model
+
+    @property
+    def nbytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Remove least recently used entries until the size limit is met.
+        """
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            for filepath, size, _ in entries:
+                if total <= self._max_nbytes:
+                    break
+                for path in (statistics_filepath(filepath), filepath):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+
+    def clear(self):
+        with self._lock:
+            for filepath, _, _ in self._entries():
+                os.remove(filepath)
+                if os.path.exists(statistics_filepath(filepath)):
+                    os.remove(statistics_filepath(filepath))
+
+    def _entries(self) -> List[Tuple[bytes, int, float]]:
+        entries: List[Tuple[bytes, int, float]] = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+                size = stat.st_size
+                stats = statistics_filepath(entry.path)
+                if os.path.exists(stats):
+                    size += os.path.getsize(stats)
+            except FileNotFoundError:
+                continue
+            entries.append((entry.path, size, stat.st_mtime))
+        return entries
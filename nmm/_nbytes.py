@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Iterable
+
+from imm import State
+
+if TYPE_CHECKING:
+    from ._topology import Topology
+
+__all__ = [
+    "container_nbytes",
+    "dp_nbytes",
+    "dp_workspace_nbytes",
+    "hmm_nbytes",
+    "object_nbytes",
+    "state_nbytes",
+]
+
+# Native objects are opaque in nmm.h, so their sizes are rough guesses, not read
+# from the C structures: pointers and doubles are taken as 8 bytes, and allocator
+# overhead is not counted.
+POINTER = 8
+DOUBLE = 8
+BASE_TABLE_NBYTES = POINTER + 4 * DOUBLE
+# Codon tables are indexed by triplets of the four bases plus the any-symbol.
+CODON_TABLE_NBYTES = POINTER + 5 * 5 * 5 * DOUBLE
+CODON_LPROB_NBYTES = POINTER + 4 * 4 * 4 * DOUBLE
+IMM_STATE_NBYTES = 8 * POINTER
+FRAME_STATE_NBYTES = IMM_STATE_NBYTES + 2 * POINTER + 3 * DOUBLE
+CODON_STATE_NBYTES = IMM_STATE_NBYTES + POINTER
+# Hash-table entries of the HMM, and flat arrays of the DP.
+HMM_STATE_NBYTES = 3 * POINTER + DOUBLE
+HMM_TRANSITION_NBYTES = 3 * POINTER + DOUBLE
+DP_STATE_NBYTES = 2 * POINTER + DOUBLE
+DP_TRANSITION_NBYTES = POINTER + DOUBLE
+# A DP matrix cell holds a score and a traceback step.
+DP_CELL_NBYTES = DOUBLE + POINTER
+
+
+def object_nbytes(obj: object) -> int:
+    """
+    Size of a Python object and of its instance dictionary, if any.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def container_nbytes(items: Iterable) -> int:
+    """
+    Size of a list, tuple or dict with its items, one level deep.
+    """
+    size = sys.getsizeof(items)
+    if isinstance(items, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in items.items())
+    else:
+        size += sum(sys.getsizeof(v) for v in items)
+    return size
+
+
+def state_nbytes(state: State) -> int:
+    """
+    Estimated memory of a state, native allocation included.
+
+    States without an `nbytes` property, like mute states, are estimated as a
+    bare native state.
+    """
+    nbytes = getattr(state, "nbytes", None)
+    if nbytes is None:
+        nbytes = IMM_STATE_NBYTES + len(state.name) + 1 + object_nbytes(state)
+    return nbytes
+
+
+def hmm_nbytes(topology: Topology) -> int:
+    """
+    Estimated native size of the HMM of a graph, states excluded.
+    """
+    nstates = topology.nstates
+    ntrans = len(topology.transitions)
+    return nstates * HMM_STATE_NBYTES + ntrans * HMM_TRANSITION_NBYTES
+
+
+def dp_nbytes(topology: Topology) -> int:
+    """
+    Estimated native size of the DP of a graph, workspace excluded.
+
+    The DP holds the state and transition arrays and the emission log
+    probability of every sequence each state can emit. Emission lengths are the
+    native ones of the states, not the narrowed `Topology.min_seq` and
+    `Topology.max_seq` of the Python engines.
+    """
+    nsymbols = len(topology.alphabet.symbols)
+    nemissions = sum(
+        sum(nsymbols**size for size in _native_lengths(state))
+        for state in topology.states
+    )
+    return (
+        topology.nstates * DP_STATE_NBYTES
+        + len(topology.transitions) * DP_TRANSITION_NBYTES
+        + nemissions * DOUBLE
+    )
+
+
+def dp_workspace_nbytes(topology: Topology, seq_len: int) -> int:
+    """
+    Estimated native memory of a `dp.viterbi` call on a sequence.
+
+    The DP matrix has a cell per sequence position, state and native emission
+    length.
+    """
+    ncolumns = sum(len(_native_lengths(state)) for state in topology.states)
+    return (seq_len + 1) * ncolumns * DP_CELL_NBYTES
+
+
+def _native_lengths(state: State) -> range:
+    return range(state.min_seq, state.max_seq + 1)
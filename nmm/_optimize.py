@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from math import inf
+from typing import Any, Dict, Hashable, List, NamedTuple, Set, Tuple, TypeVar
+
+from imm import State
+
+from ._codon import Codon, codon_iter
+from ._input import Input
+from ._model import Model
+from ._output import Output
+from ._state import CodonState, FrameState
+from ._topology import Topology
+
+__all__ = ["OptimizeReport", "optimize_file", "optimize_model", "optimize_topology"]
+
+T = TypeVar("T")
+
+
+class OptimizeReport(NamedTuple):
+    """
+    Size of a model graph before and after optimization.
+
+    Attributes
+    ----------
+    nstates
+        Number of states, before and after.
+    ntransitions
+        Number of transitions of non-zero probability, before and after.
+    ntables
+        Number of distinct base, codon and codon probability tables, before and
+        after.
+    """
+
+    nstates: Tuple[int, int]
+    ntransitions: Tuple[int, int]
+    ntables: Tuple[int, int]
+
+    @property
+    def removed_states(self) -> int:
+        return self.nstates[0] - self.nstates[1]
+
+    @property
+    def removed_transitions(self) -> int:
+        return self.ntransitions[0] - self.ntransitions[1]
+
+    @property
+    def merged_tables(self) -> int:
+        return self.ntables[0] - self.ntables[1]
+
+    def __str__(self) -> str:
+        return (
+            f"states {self.nstates[0]} -> {self.nstates[1]}, "
+            f"transitions {self.ntransitions[0]} -> {self.ntransitions[1]}, "
+            f"tables {self.ntables[0]} -> {self.ntables[1]}"
+        )
+
+
+def optimize_topology(topology: Topology) -> Tuple[Topology, OptimizeReport]:
+    """
+    Smaller model graph of equal scores.
+
+    The following rewrites are applied:
+
+    1. States that cannot be reached from a start state, or from which the end
+       state cannot be reached, are removed with their transitions.
+    2. A mute state that is neither a start nor the end state is bypassed by
+       direct transitions from each predecessor to each successor, of
+       probability the product along the bypassed path. This is done only if no
+       such direct transition already exists and if it does not increase the
+       number of transitions, and repeated until no mute state qualifies.
+    3. Frame and codon states with equal tables are rebuilt to share one table.
+
+    Every path of the original graph maps to a single path of the optimized one
+    with the same probability, so Viterbi and forward scores are preserved. Paths
+    no longer visit the bypassed mute states.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+
+    Returns
+    -------
+    Optimized graph and size report.
+    """
+    nstates = topology.nstates
+    start = {i: v for i, v in enumerate(topology.start_lprobs) if v > -inf}
+    trans = dict(topology.transitions)
+    end = topology.end
+
+    alive = _alive_states(topology, set(range(nstates)), start, trans)
+    start = {i: v for i, v in start.items() if i in alive}
+    trans = {(a, b): v for (a, b), v in trans.items() if a in alive and b in alive}
+    _bypass_mute_states(topology, alive, start, trans)
+
+    kept = sorted(alive)
+    remap = {old: new for new, old in enumerate(kept)}
+    states, ntables = _share_tables([topology.states[i] for i in kept])
+    optimized = Topology(
+        topology.alphabet,
+        states,
+        [start.get(i, -inf) for i in kept],
+        {(remap[a], remap[b]): v for (a, b), v in trans.items()},
+        remap[end],
+    )
+    report = OptimizeReport(
+        (nstates, optimized.nstates),
+        (len(topology.transitions), len(optimized.transitions)),
+        ntables,
+    )
+    return optimized, report
+
+
+def optimize_model(model: Model) -> Tuple[Model, OptimizeReport]:
+    """
+    Model of equal scores built from the optimized graph.
+
+    The HMM and DP are created anew from the result of `optimize_topology`, and
+    the score statistics of `model`, if any, are kept.
+
+    Parameters
+    ----------
+    model
+        Model.
+
+    Returns
+    -------
+    Optimized model and size report.
+    """
+    topology, report = optimize_topology(model.topology)
+    optimized = Model.create_from_topology(topology)
+    optimized.statistics = model.statistics
+    return optimized, report
+
+
+def optimize_file(input_filepath: bytes, output_filepath: bytes) -> OptimizeReport:
+    """
+    Optimize every model of an ``.nmm`` file into another file.
+
+    Parameters
+    ----------
+    input_filepath
+        File to read models from.
+    output_filepath
+        File to write the optimized models to, in the same order.
+
+    Returns
+    -------
+    Size report summed over all models.
+    """
+    totals = [0] * 6
+    with Input.create(input_filepath) as input:
+        with Output.create(output_filepath) as output:
+            for model in input:
+                optimized, report = optimize_model(model)
+                output.write(optimized)
+                sizes = report.nstates + report.ntransitions + report.ntables
+                totals = [a + b for a, b in zip(totals, sizes)]
+    return OptimizeReport(
+        (totals[0], totals[1]), (totals[2], totals[3]), (totals[4], totals[5])
+    )
+
+
+def _alive_states(
+    topology: Topology,
+    states: Set[int],
+    start: Dict[int, float],
+    trans: Dict[Tuple[int, int], float],
+) -> Set[int]:
+    """
+    States on some path from a start state to the end state.
+    """
+    mute_dead = {
+        i
+        for i in states
+        if topology.max_seq[i] == 0 and topology.emissions[i](b"") == -inf
+    }
+    succ: Dict[int, List[int]] = {i: [] for i in states}
+    pred: Dict[int, List[int]] = {i: [] for i in states}
+    for a, b in trans.keys():
+        succ[a].append(b)
+        pred[b].append(a)
+
+    def visit(roots: List[int], edges: Dict[int, List[int]]) -> Set[int]:
+        seen = set(i for i in roots if i not in mute_dead)
+        stack = list(seen)
+        while stack:
+            for j in edges[stack.pop()]:
+                if j not in seen and j not in mute_dead:
+                    seen.add(j)
+                    stack.append(j)
+        return seen
+
+    alive = visit(list(start.keys()), succ) & visit([topology.end], pred)
+    alive.add(topology.end)
+    return alive
+
+
+def _bypass_mute_states(
+    topology: Topology,
+    alive: Set[int],
+    start: Dict[int, float],
+    trans: Dict[Tuple[int, int], float],
+):
+    candidates = [
+        i
+        for i in sorted(alive)
+        if topology.max_seq[i] == 0 and i != topology.end and i not in start
+    ]
+    pred: Dict[int, Set[int]] = {i: set() for i in alive}
+    succ: Dict[int, Set[int]] = {i: set() for i in alive}
+    for a, b in trans.keys():
+        succ[a].add(b)
+        pred[b].add(a)
+
+    changed = True
+    while changed:
+        changed = False
+        for m in candidates:
+            if m not in alive or m in pred[m]:
+                continue
+            if len(pred[m]) * len(succ[m]) > len(pred[m]) + len(succ[m]):
+                continue
+            if any(a == b or b in succ[a] for a in pred[m] for b in succ[m]):
+                continue
+
+            lprob = topology.emissions[m](b"")
+            for a in pred[m]:
+                u = trans.pop((a, m))
+                succ[a].remove(m)
+                for b in succ[m]:
+                    trans[(a, b)] = u + lprob + trans[(m, b)]
+                    succ[a].add(b)
+                    pred[b].add(a)
+            for b in succ[m]:
+                del trans[(m, b)]
+                pred[b].remove(m)
+            alive.remove(m)
+            changed = True
+
+
+def _share_tables(states: List[State]) -> Tuple[List[State], Tuple[int, int]]:
+    """
+    Rebuild states so that equal tables are the same object.
+    """
+    codons: List[Codon] = []
+    before: Set[int] = set()
+    shared: Dict[Hashable, Any] = {}
+
+    def share(table: T, key: Hashable) -> T:
+        before.add(id(table))
+        return shared.setdefault(key, table)
+
+    result: List[State] = []
+    for state in states:
+        if isinstance(state, FrameState):
+            alphabet = state.alphabet
+            if not codons:
+                codons = list(codon_iter(alphabet))
+            baset = state.base_table
+            codont = state.codon_table
+            bases = [alphabet.symbols[i : i + 1] for i in range(4)]
+            key = ("base",) + tuple(baset.lprob(b) for b in bases)
+            new_baset = share(baset, key)
+            key = ("codon",) + tuple(codont.lprob(c) for c in codons)
+            new_codont = share(codont, key)
+            if new_baset is not baset or new_codont is not codont:
+                state = FrameState.create(
+                    state.name, new_baset, new_codont, state.epsilon
+                )
+        elif isinstance(state, CodonState):
+            if not codons:
+                codons = list(codon_iter(state.alphabet))
+            codonp = state.codon_prob
+            key = ("prob",) + tuple(codonp.get_lprob(c) for c in codons)
+            new_codonp = share(codonp, key)
+            if new_codonp is not codonp:
+                state = CodonState.create(state.name, new_codonp)
+        result.append(state)
+    return result, (len(before), len(shared))
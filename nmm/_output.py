@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Type
+from typing import Dict, Optional, Type
 
 from ._cdata import CData
+from ._evalue import ScoreStatistics, write_statistics
 from ._ffi import ffi, lib
 from ._model import Model
 
@@ -10,24 +11,44 @@ __all__ = ["Output"]
 
 
 class Output:
-    def __init__(self, nmm_output: CData):
+    __slots__ = ("_nmm_output", "_filepath", "_nmodels", "_statistics", "_closed")
+
+    def __init__(self, nmm_output: CData, filepath: Optional[bytes] = None):
         if nmm_output == ffi.NULL:
             raise RuntimeError("`nmm_output` is NULL.")
         self._nmm_output = nmm_output
+        self._filepath = filepath
+        self._nmodels = 0
+        self._statistics: Dict[int, ScoreStatistics] = {}
+        self._closed = False
 
     @classmethod
     def create(cls: Type[Output], filepath: bytes) -> Output:
-        return cls(lib.nmm_output_create(filepath))
+        return cls(lib.nmm_output_create(filepath), filepath)
 
     def write(self, model: Model):
         err: int = lib.nmm_output_write(self._nmm_output, model.nmm_model)
         if err != 0:
             raise RuntimeError("Could not write model.")
+        if model.statistics is not None:
+            self._statistics[self._nmodels] = model.statistics
+        self._nmodels += 1
 
     def close(self):
+        """
+        Close the file and write the score statistics sidecar.
+
+        The sidecar is removed if no written model has statistics. Closing an
+        already closed output does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
         err: int = lib.nmm_output_close(self._nmm_output)
         if err != 0:
             raise RuntimeError("Could not close output.")
+        if self._filepath is not None:
+            write_statistics(self._filepath, self._statistics)
 
     def __del__(self):
         if self._nmm_output != ffi.NULL:
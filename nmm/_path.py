@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from math import inf, sqrt
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from imm import Path
+
+from ._dp import emission_lengths
+from ._topology import Topology
+
+__all__ = ["ViterbiPath", "viterbi_path"]
+
+# Back pointer: predecessor state index (-1 for the start) and emission length.
+BackPointer = Optional[Tuple[int, int]]
+Row = List[float]
+
+
+class ViterbiPath(NamedTuple):
+    """
+    Viterbi log-likelihood and path.
+
+    Attributes
+    ----------
+    loglikelihood
+        Viterbi log-likelihood.
+    path
+        Viterbi path, or ``None`` if the sequence cannot be emitted.
+    """
+
+    loglikelihood: float
+    path: Optional[Path]
+
+
+class _Rows:
+    """
+    Viterbi row computation with back pointers.
+    """
+
+    __slots__ = (
+        "_seq",
+        "_nstates",
+        "_start",
+        "_emissions",
+        "_lengths",
+        "_emitters",
+        "_mute_order",
+        "_pred",
+        "_array",
+    )
+
+    def __init__(self, topology: Topology, seq: bytes):
+        nstates = topology.nstates
+        self._seq = seq
+        self._nstates = nstates
+        self._start = topology.start_lprobs
+        self._emissions = topology.emissions
+        self._lengths = emission_lengths(topology)
+        self._emitters = [i for i in range(nstates) if self._lengths[i]]
+        self._mute_order = topology.mute_order
+        self._pred = [topology.predecessors(i) for i in range(nstates)]
+
+    def compute(self, pos: int, rows: Dict[int, Row]) -> Tuple[Row, List[BackPointer]]:
+        seq = self._seq
+        start = self._start
+        emissions = self._emissions
+        row = [-inf] * self._nstates
+        bps: List[BackPointer] = [None] * self._nstates
+
+        for t in self._emitters:
+            best = -inf
+            bp: BackPointer = None
+            for size in self._lengths[t]:
+                if size > pos:
+                    break
+                e = emissions[t](seq[pos - size : pos])
+                if e == -inf:
+                    continue
+                prev = rows[pos - size]
+                if pos == size and start[t] > -inf:
+                    v = start[t] + e
+                    if v > best:
+                        best, bp = v, (-1, size)
+                for s, lprob in self._pred[t]:
+                    v = prev[s]
+                    if v > -inf:
+                        v = v + lprob + e
+                        if v > best:
+                            best, bp = v, (s, size)
+            row[t] = best
+            bps[t] = bp
+
+        for t in self._mute_order:
+            e = emissions[t](b"")
+            if e == -inf:
+                continue
+            best = row[t]
+            bp = bps[t]
+            if pos == 0 and start[t] > -inf:
+                v = start[t] + e
+                if v > best:
+                    best, bp = v, (-1, 0)
+            for s, lprob in self._pred[t]:
+                v = row[s]
+                if v > -inf:
+                    v = v + lprob + e
+                    if v > best:
+                        best, bp = v, (s, 0)
+            row[t] = best
+            bps[t] = bp
+
+        return row, bps
+
+
+def viterbi_path(
+    topology: Topology, seq: bytes, interval: Optional[int] = None
+) -> Tuple[float, Optional[List[Tuple[int, int]]]]:
+    """
+    Viterbi log-likelihood and path with checkpointed rows.
+
+    A forward pass keeps the DP rows only at checkpoints every `interval`
+    positions. The traceback then recomputes one segment between checkpoints at
+    a time, with back pointers, from the last segment to the first. Rows are
+    recomputed with the same arithmetic, so the result equals a full-matrix
+    traceback. Peak memory is O(states × (N / interval + interval)), that is
+    O(states × √N) for the default interval, at the cost of computing each row
+    twice.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seq
+        Sequence symbols.
+    interval
+        Number of positions between checkpoints. Defaults to ⌊√N⌋ + 1.
+
+    Returns
+    -------
+    Log-likelihood and path as (state index, emission length) steps, or
+    ``(-inf, None)`` if the sequence cannot be emitted.
+    """
+    length = len(seq)
+    if interval is None:
+        interval = int(sqrt(length)) + 1
+    if interval < 1:
+        raise ValueError("`interval` must be positive.")
+
+    rows = _Rows(topology, seq)
+    nrows = max(topology.max_seq) + 1
+
+    # checkpoints[j] holds the last `nrows` rows before position j * interval.
+    checkpoints: List[Dict[int, Row]] = [{}]
+    window: Dict[int, Row] = {}
+    for pos in range(length + 1):
+        if pos > 0 and pos % interval == 0:
+            checkpoints.append(dict(window))
+        window[pos] = rows.compute(pos, window)[0]
+        window.pop(pos - nrows, None)
+
+    score = window[length][topology.end]
+    if score == -inf:
+        return score, None
+
+    steps: List[Tuple[int, int]] = []
+    pos, t = length, topology.end
+    for j in range(len(checkpoints) - 1, -1, -1):
+        first = j * interval
+        segment = dict(checkpoints[j])
+        checkpoints[j] = {}
+        bps: Dict[int, List[BackPointer]] = {}
+        for p in range(first, min(first + interval, length + 1)):
+            segment[p], bps[p] = rows.compute(p, segment)
+
+        while pos >= first:
+            bp = bps[pos][t]
+            if bp is None:
+                raise RuntimeError("Broken Viterbi traceback.")
+            s, size = bp
+            steps.append((t, size))
+            if s < 0:
+                steps.reverse()
+                return score, steps
+            pos, t = pos - size, s
+
+    raise RuntimeError("Broken Viterbi traceback.")
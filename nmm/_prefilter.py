@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from threading import Lock
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
+
+from imm import Sequence, State
+
+from ._codon import Codon, codon_iter
+from ._encoded import EncodedSequence, SequenceLike, as_sequence
+from ._state import CodonState, FrameState
+from ._topology import Topology
+
+if TYPE_CHECKING:
+    from imm import Results
+
+    from ._model import Model
+
+__all__ = ["Prefilter", "PrefilterStats", "consensus_codons", "match_states"]
+
+
+class PrefilterStats(NamedTuple):
+    """
+    Prefilter counters.
+
+    Attributes
+    ----------
+    npassed
+        Number of sequences that passed the prefilter.
+    nrejected
+        Number of sequences rejected by the prefilter.
+    filter_seconds
+        Time spent in the prefilter.
+    dp_seconds
+        Time spent in full Viterbi for the passed sequences.
+    """
+
+    npassed: int
+    nrejected: int
+    filter_seconds: float
+    dp_seconds: float
+
+    @property
+    def pass_rate(self) -> float:
+        total = self.npassed + self.nrejected
+        return self.npassed / total if total > 0 else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        Estimated Viterbi time avoided, net of the prefilter time.
+        """
+        if self.npassed == 0:
+            return -self.filter_seconds
+        dp_mean = self.dp_seconds / self.npassed
+        return self.nrejected * dp_mean - self.filter_seconds
+
+
+class Prefilter:
+    """
+    Seed-match prefilter in front of full Viterbi.
+
+    Seeds are the nucleotide k-mers of the model consensus, the most likely codon
+    of each match state in path order (see `match_states`). A sequence passes if
+    it shares at least `min_seeds` distinct k-mers with the consensus.
+
+    Parameters
+    ----------
+    model
+        Model.
+    seeds
+        Consensus k-mers.
+    k
+        Seed length.
+    min_seeds
+        Minimum number of distinct seeds for a sequence to pass.
+    """
+
+    def __init__(self, model: Model, seeds: FrozenSet[bytes], k: int, min_seeds: int):
+        if k <= 0:
+            raise ValueError("`k` must be positive.")
+        self._model = model
+        self._seeds = seeds
+        self._k = k
+        self._min_seeds = min_seeds
+        self._lock = Lock()
+        self._npassed = 0
+        self._nrejected = 0
+        self._filter_seconds = 0.0
+        self._dp_seconds = 0.0
+
+    @classmethod
+    def create(
+        cls: Type[Prefilter],
+        model: Model,
+        k: int = 12,
+        min_seeds: int = 1,
+        states: Optional[Iterable[State]] = None,
+    ) -> Prefilter:
+        """
+        Create a prefilter.
+
+        Parameters
+        ----------
+        model
+            Model.
+        k
+            Seed length, in nucleotides.
+        min_seeds
+            Minimum number of distinct seeds for a sequence to pass.
+        states
+            States forming the consensus, in order. Defaults to the match states
+            of the model, as given by `match_states`.
+
+        Raises
+        ------
+        ValueError
+            If the consensus is shorter than `k`, as no sequence could pass.
+        """
+        if states is None:
+            states = match_states(model.topology)
+        consensus = consensus_codons(states, list(codon_iter(model.alphabet)))
+        if len(consensus) < k:
+            raise ValueError(
+                f"Consensus of {len(consensus)} nucleotides is shorter than `k`."
+            )
+        kmers = frozenset(consensus[i : i + k] for i in range(len(consensus) - k + 1))
+        return cls(model, kmers, k, min_seeds)
+
+    @property
+    def seeds(self) -> FrozenSet[bytes]:
+        return self._seeds
+
+    def passes(self, seq: SequenceLike) -> bool:
+        """
+        Whether a sequence passes the prefilter.
+        """
+        start = perf_counter()
+        ok = self._count_seeds(bytes(seq)) >= self._min_seeds
+        elapsed = perf_counter() - start
+        with self._lock:
+            self._filter_seconds += elapsed
+            if ok:
+                self._npassed += 1
+            else:
+                self._nrejected += 1
+        return ok
+
+    def viterbi(self, seq: Union[Sequence, EncodedSequence]) -> Optional[Results]:
+        """
+        Run full Viterbi only if the sequence passes the prefilter.
+
+        Returns
+        -------
+        Viterbi results, or ``None`` for rejected sequences.
+        """
+        if not self.passes(seq):
+            return None
+        start = perf_counter()
+        model = self._model
+        results = model.dp.viterbi(as_sequence(seq, model.alphabet))
+        elapsed = perf_counter() - start
+        with self._lock:
+            self._dp_seconds += elapsed
+        return results
+
+    @property
+    def stats(self) -> PrefilterStats:
+        with self._lock:
+            return PrefilterStats(
+                self._npassed, self._nrejected, self._filter_seconds, self._dp_seconds
+            )
+
+    def _count_seeds(self, seq: bytes) -> int:
+        k = self._k
+        seeds = self._seeds
+        if self._min_seeds <= 1:
+            return int(any(seq[i : i + k] in seeds for i in range(len(seq) - k + 1)))
+        found = {seq[i : i + k] for i in range(len(seq) - k + 1)}
+        return len(found & seeds)
+
+
+def consensus_codons(states: Iterable[State], codons: List[Codon]) -> bytes:
+    """
+    Concatenate the most likely codon of each frame and codon state.
+
+    Parameters
+    ----------
+    states
+        States in consensus order. Other state types are skipped.
+    codons
+        Candidate codons.
+    """
+    consensus: List[bytes] = []
+    for state in states:
+        if isinstance(state, FrameState):
+            lprob = state.codon_table.lprob
+        elif isinstance(state, CodonState):
+            lprob = state.codon_prob.get_lprob
+        else:
+            continue
+        best = max(codons, key=lprob)
+        consensus.append(best.symbols)
+    return b"".join(consensus)
+
+
+def match_states(topology: Topology) -> List[State]:
+    """
+    Frame and codon states of the main chain of a model, in path order.
+
+    Emitting states with a self-transition, like the insert states of a profile,
+    are left out. Among the others, one state follows another if the graph goes
+    from the first to the second directly or through mute states only, and the
+    longest such chain is returned. For a profile, it is M1, ..., Mn.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    """
+    nstates = topology.nstates
+    codon_states = (FrameState, CodonState)
+    matches = [
+        i
+        for i, state in enumerate(topology.states)
+        if isinstance(state, codon_states) and (i, i) not in topology.transitions
+    ]
+    match_set = set(matches)
+
+    follows: Dict[int, List[int]] = {}
+    for a in matches:
+        seen: Set[int] = set()
+        stack = [b for b, _ in topology.successors(a)]
+        targets: List[int] = []
+        while stack:
+            b = stack.pop()
+            if b in seen:
+                continue
+            seen.add(b)
+            if b in match_set:
+                targets.append(b)
+            elif topology.max_seq[b] == 0:
+                stack.extend(c for c, _ in topology.successors(b))
+        follows[a] = targets
+
+    # Depth-first post-order; edges closing a cycle are ignored.
+    order: List[int] = []
+    mark = [0] * nstates
+    for root in matches:
+        if mark[root]:
+            continue
+        stack = [(root, iter(follows[root]))]
+        mark[root] = 1
+        while stack:
+            a, children = stack[-1]
+            b = next(children, None)
+            if b is None:
+                stack.pop()
+                mark[a] = 2
+                order.append(a)
+            elif mark[b] == 0:
+                mark[b] = 1
+                stack.append((b, iter(follows[b])))
+
+    # Longest chain, computed from the last states backwards.
+    length = {a: 1 for a in matches}
+    after: Dict[int, Optional[int]] = {a: None for a in matches}
+    rank = {a: r for r, a in enumerate(order)}
+    for a in order:
+        for b in follows[a]:
+            if rank[b] < rank[a] and length[b] + 1 > length[a]:
+                length[a] = length[b] + 1
+                after[a] = b
+
+    chain: List[State] = []
+    if matches:
+        node: Optional[int] = max(reversed(order), key=lambda a: length[a])
+        while node is not None:
+            chain.append(topology.states[node])
+            node = after[node]
+    return chain
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from math import inf, isfinite
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from imm import MuteState
+
+from ._alphabet import BaseAlphabet
+from ._codon import Codon, codon_iter
+from ._codon_prob import CodonProb
+from ._model import Model
+from ._state import FrameState
+from ._table import BaseTable, CodonTable
+from ._topology import Topology
+
+__all__ = ["build_frame_profile"]
+
+
+class TableFactory:
+    """
+    Create tables from rows of log probabilities.
+
+    Identical rows share a single table so that a profile with repeated emission
+    parameters creates each native table only once.
+
+    Parameters
+    ----------
+    alphabet
+        Four-nucleotides alphabet.
+    """
+
+    def __init__(self, alphabet: BaseAlphabet):
+        self._alphabet = alphabet
+        self._codons: List[Codon] = list(codon_iter(alphabet))
+        self._base_tables: Dict[Tuple[float, ...], BaseTable] = {}
+        self._codon_tables: Dict[Tuple[float, ...], CodonTable] = {}
+        self._codon_probs: Dict[Tuple[float, ...], CodonProb] = {}
+
+    @property
+    def alphabet(self) -> BaseAlphabet:
+        return self._alphabet
+
+    @property
+    def codons(self) -> List[Codon]:
+        return self._codons
+
+    def base_table(self, lprobs: Iterable[float]) -> BaseTable:
+        """
+        Base table for four log probabilities, in alphabet order.
+        """
+        row = tuple(float(v) for v in lprobs)
+        if len(row) != 4:
+            raise ValueError("Base table row must have four values.")
+        baset = self._base_tables.get(row)
+        if baset is None:
+            baset = BaseTable.create(self._alphabet, row)
+            self._base_tables[row] = baset
+        return baset
+
+    def codon_prob(self, lprobs: Iterable[float]) -> CodonProb:
+        """
+        Codon probabilities for 64 log probabilities, in `codon_iter` order.
+
+        Only finite values are set; the remaining codons keep zero probability.
+        """
+        row = tuple(float(v) for v in lprobs)
+        if len(row) != len(self._codons):
+            raise ValueError(f"Codon row must have {len(self._codons)} values.")
+        codonp = self._codon_probs.get(row)
+        if codonp is None:
+            codonp = CodonProb.create(self._alphabet)
+            for codon, lprob in zip(self._codons, row):
+                if isfinite(lprob):
+                    codonp.set_lprob(codon, lprob)
+            self._codon_probs[row] = codonp
+        return codonp
+
+    def codon_table(self, lprobs: Iterable[float]) -> CodonTable:
+        """
+        Codon table for 64 log probabilities, in `codon_iter` order.
+        """
+        row = tuple(float(v) for v in lprobs)
+        codont = self._codon_tables.get(row)
+        if codont is None:
+            codont = CodonTable.create(self.codon_prob(row))
+            self._codon_tables[row] = codont
+        return codont
+
+
+def build_frame_profile(
+    alphabet: BaseAlphabet,
+    base_lprobs: Sequence[Sequence[float]],
+    codon_lprobs: Sequence[Sequence[float]],
+    epsilons: Sequence[float],
+    transitions: Sequence[Sequence[float]],
+    start_lprob: float = 0.0,
+) -> Model:
+    """
+    Build a linear frame-state profile from arrays of parameters.
+
+    The profile has the states B, M1, ..., ML, E, where B and E are mute states
+    and Mi are frame states. Any array-like object indexable by row, including
+    NumPy arrays, can be used.
+
+    Parameters
+    ----------
+    alphabet
+        Four-nucleotides alphabet.
+    base_lprobs
+        Array of shape (L, 4) with the base log probabilities of each position.
+    codon_lprobs
+        Array of shape (L, 64) with the codon log probabilities of each position,
+        in `codon_iter` order.
+    epsilons
+        Array of shape (L,) with the epsilon of each position.
+    transitions
+        Array of shape (L, 3) with the log probabilities of the transitions
+        B → Mi, Mi → Mi+1, and Mi → E. The Mi → Mi+1 value of the last position
+        is ignored.
+    start_lprob
+        Start log probability of state B. Defaults to ``0.0``.
+    """
+    length = len(epsilons)
+    if not (len(base_lprobs) == len(codon_lprobs) == len(transitions) == length):
+        raise ValueError("Parameter arrays must have the same number of rows.")
+    if length == 0:
+        raise ValueError("Profile must have at least one position.")
+
+    factory = TableFactory(alphabet)
+
+    B = MuteState.create(b"B", alphabet)
+    E = MuteState.create(b"E", alphabet)
+    M: List[FrameState] = []
+    for i in range(length):
+        baset = factory.base_table(base_lprobs[i])
+        codont = factory.codon_table(codon_lprobs[i])
+        name = f"M{i + 1}".encode()
+        M.append(FrameState.create(name, baset, codont, float(epsilons[i])))
+
+    states = [B] + M + [E]
+    start = [start_lprob] + [-inf] * (length + 1)
+    trans: Dict[Tuple[int, int], float] = {}
+    end = length + 1
+    for i in range(length):
+        enter, next_, exit_ = (float(v) for v in transitions[i])
+        trans[(0, i + 1)] = enter
+        if i + 1 < length:
+            trans[(i + 1, i + 2)] = next_
+        trans[(i + 1, end)] = exit_
+
+    topology = Topology(alphabet, states, start, trans, end)
+    return Model.create_from_topology(topology)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import itertools
+from math import exp, inf
+from random import Random
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple, Type
+
+from ._topology import Topology
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+__all__ = ["SampledSequence", "Sampler"]
+
+
+class SampledSequence(NamedTuple):
+    """
+    Sequence emitted by a model and its true path.
+
+    Attributes
+    ----------
+    symbols
+        Emitted sequence.
+    path
+        Steps as (state index, emitted length) pairs.
+    """
+
+    symbols: bytes
+    path: List[Tuple[int, int]]
+
+
+class _Choice:
+    """
+    Categorical distribution built from log probabilities.
+    """
+
+    __slots__ = ("_items", "_cum")
+
+    def __init__(self, items: list, lprobs: List[float]):
+        keep = [(i, lp) for i, lp in zip(items, lprobs) if lp > -inf]
+        if not keep:
+            raise ValueError("Distribution has no support.")
+        vmax = max(lp for _, lp in keep)
+        self._items = [i for i, _ in keep]
+        self._cum = list(itertools.accumulate(exp(lp - vmax) for _, lp in keep))
+
+    def __call__(self, random: Random):
+        return random.choices(self._items, cum_weights=self._cum)[0]
+
+    def draw(self, random: Random, k: int) -> list:
+        """
+        Draw `k` items at once.
+        """
+        return random.choices(self._items, cum_weights=self._cum, k=k)
+
+
+class Sampler:
+    """
+    Seedable sampler of sequences emitted by a model.
+
+    Emissions are drawn from each state's exact distribution, which is
+    tabulated, on first use, over every sequence of allowed length made of
+    alphabet symbols. Frame states therefore produce frameshifted emissions at
+    the rate implied by their epsilon.
+
+    Parameters
+    ----------
+    topology
+        Model graph.
+    seed
+        Random seed.
+    max_steps
+        Maximum number of steps of a path.
+    """
+
+    def __init__(
+        self, topology: Topology, seed: Optional[int] = None, max_steps: int = 100000
+    ):
+        self._topology = topology
+        self._random = Random(seed)
+        self._max_steps = max_steps
+        nstates = topology.nstates
+        self._start = _Choice(list(range(nstates)), topology.start_lprobs)
+        self._next: List[Optional[_Choice]] = [None] * nstates
+        self._emit: List[Optional[_Choice]] = [None] * nstates
+
+    @classmethod
+    def create(cls: Type[Sampler], model: Model, seed: Optional[int] = None) -> Sampler:
+        """
+        Create a sampler for a model.
+
+        Parameters
+        ----------
+        model
+            Model.
+        seed
+            Random seed.
+        """
+        return cls(model.topology, seed)
+
+    def sample(self) -> SampledSequence:
+        """
+        Sample one sequence and its path.
+        """
+        buffer, _, paths = self.sample_batch(1)
+        return SampledSequence(bytes(buffer), paths[0])
+
+    def sample_batch(
+        self, n: int, buffer: Optional[bytearray] = None
+    ) -> Tuple[bytearray, List[int], List[List[Tuple[int, int]]]]:
+        """
+        Sample many sequences into one contiguous buffer.
+
+        The state paths are sampled first. The emissions of each state are then
+        drawn together, for all of its steps in the batch, and copied into the
+        buffer once its final size is known.
+
+        Parameters
+        ----------
+        n
+            Number of sequences.
+        buffer
+            Buffer to reuse. Its previous content is discarded.
+
+        Returns
+        -------
+        The buffer holding the concatenated sequences, the ``n + 1`` offsets
+        delimiting them, and their paths.
+        """
+        random = self._random
+        states = [self._sample_states() for _ in range(n)]
+
+        counts = [0] * self._topology.nstates
+        for path in states:
+            for state in path:
+                counts[state] += 1
+        draws = [
+            iter(self._emission(state).draw(random, k)) if k > 0 else iter([])
+            for state, k in enumerate(counts)
+        ]
+
+        emissions: List[bytes] = []
+        offsets = [0]
+        paths: List[List[Tuple[int, int]]] = []
+        size = 0
+        for path in states:
+            steps: List[Tuple[int, int]] = []
+            for state in path:
+                emission = next(draws[state])
+                emissions.append(emission)
+                steps.append((state, len(emission)))
+                size += len(emission)
+            offsets.append(size)
+            paths.append(steps)
+
+        if buffer is None:
+            buffer = bytearray(size)
+        elif len(buffer) > size:
+            del buffer[size:]
+        else:
+            buffer.extend(bytes(size - len(buffer)))
+        start = 0
+        for emission in emissions:
+            end = start + len(emission)
+            buffer[start:end] = emission
+            start = end
+        return buffer, offsets, paths
+
+    def _sample_states(self) -> List[int]:
+        random = self._random
+        end = self._topology.end
+        path = [self._start(random)]
+        while path[-1] != end:
+            if len(path) == self._max_steps:
+                raise RuntimeError("Path exceeded `max_steps`.")
+            path.append(self._transition(path[-1])(random))
+        return path
+
+    def _transition(self, state: int) -> _Choice:
+        choice = self._next[state]
+        if choice is None:
+            succ = self._topology.successors(state)
+            if not succ:
+                raise RuntimeError("Reached a state without outgoing transitions.")
+            choice = _Choice([t for t, _ in succ], [lp for _, lp in succ])
+            self._next[state] = choice
+        return choice
+
+    def _emission(self, state: int) -> _Choice:
+        choice = self._emit[state]
+        if choice is None:
+            topology = self._topology
+            alphabet = topology.alphabet
+            any_symbol = alphabet.any_symbol
+            bases = [bytes([s]) for s in alphabet.symbols if bytes([s]) != any_symbol]
+            emission = topology.emissions[state]
+            lo, hi = topology.min_seq[state], topology.max_seq[state]
+            items = [
+                b"".join(seq)
+                for size in range(lo, hi + 1)
+                for seq in itertools.product(bases, repeat=size)
+            ]
+            choice = _Choice(items, [emission(item) for item in items])
+            self._emit[state] = choice
+        return choice
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from math import inf
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Tuple
+
+from imm import Sequence, lprob_is_valid
+
+if TYPE_CHECKING:
+    from ._model import Model
+
+__all__ = ["Hit", "scan", "windows"]
+
+
+class Hit(NamedTuple):
+    """
+    Sequence interval matched by a model.
+
+    Attributes
+    ----------
+    start
+        Start position, inclusive.
+    end
+        End position, exclusive.
+    loglikelihood
+        Best window log-likelihood within the interval.
+    evalue
+        Expected number of windows of a random sequence of the same length
+        scoring at least `loglikelihood`, or ``None`` if the model is not
+        calibrated.
+    """
+
+    start: int
+    end: int
+    loglikelihood: float
+    evalue: Optional[float] = None
+
+
+def windows(length: int, window_length: int, overlap: int) -> Iterator[Tuple[int, int]]:
+    """
+    Overlapping windows covering a sequence.
+
+    Parameters
+    ----------
+    length
+        Sequence length.
+    window_length
+        Window length.
+    overlap
+        Number of positions shared by consecutive windows.
+    """
+    if window_length <= 0:
+        raise ValueError("`window_length` must be positive.")
+    if not 0 <= overlap < window_length:
+        raise ValueError("`overlap` must be in the range [0, window_length).")
+
+    if length <= window_length:
+        yield (0, length)
+        return
+
+    step = window_length - overlap
+    start = 0
+    while start + window_length < length:
+        yield (start, start + window_length)
+        start += step
+    yield (length - window_length, length)
+
+
+def scan(
+    model: Model,
+    seq: bytes,
+    window_length: int,
+    overlap: int,
+    threshold: float = -inf,
+    workers: int = 1,
+) -> List[Hit]:
+    """
+    Scan a long sequence with overlapping windows.
+
+    Each window is scored independently by Viterbi, so the DP workspace is bounded
+    by `window_length` regardless of the sequence length. Windows scoring at least
+    `threshold` are hits; hits of overlapping windows are merged into a single one
+    reporting the best window score.
+
+    Parameters
+    ----------
+    model
+        Model.
+    seq
+        Sequence symbols.
+    window_length
+        Window length.
+    overlap
+        Number of positions shared by consecutive windows. It should be at least
+        the length of the longest expected hit so that no hit is split.
+    threshold
+        Minimum log-likelihood of a hit.
+    workers
+        Number of threads scoring windows concurrently.
+
+    Notes
+    -----
+    Hits have E-values if the model has score statistics, which should then be
+    calibrated on sequences of length `window_length`.
+    """
+    alphabet = model.alphabet
+    dp = model.dp
+
+    def score(interval: Tuple[int, int]) -> float:
+        start, end = interval
+        results = dp.viterbi(Sequence.create(seq[start:end], alphabet))
+        if len(results) == 0:
+            return -inf
+        loglik: float = results[0].loglikelihood
+        return loglik if lprob_is_valid(loglik) else -inf
+
+    intervals = list(windows(len(seq), window_length, overlap))
+    hits: List[Hit] = []
+    if workers <= 1:
+        _merge_into(hits, ((i, score(i)) for i in intervals), threshold)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i in range(0, len(intervals), 4 * workers):
+                chunk = intervals[i : i + 4 * workers]
+                _merge_into(hits, zip(chunk, executor.map(score, chunk)), threshold)
+
+    stats = model.statistics
+    if stats is None:
+        return hits
+    nwindows = len(intervals)
+    return [h._replace(evalue=stats.evalue(h.loglikelihood, nwindows)) for h in hits]
+
+
+def _merge_into(hits: List[Hit], scored, threshold: float):
+    """
+    Merge scored windows, given in position order, into hits.
+    """
+    for (start, end), loglik in scored:
+        if loglik < threshold or loglik == -inf:
+            continue
+        if hits and start < hits[-1].end:
+            last = hits[-1]
+            hits[-1] = Hit(last.start, end, max(last.loglikelihood, loglik))
+        else:
+            hits.append(Hit(start, end, loglik))
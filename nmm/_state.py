@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Tuple, Type, TypeVar
+from math import inf
+from typing import List, Optional, Tuple, Type, TypeVar, Union
 
 from imm import Alphabet, Sequence, State
 
 from ._alphabet import BaseAlphabet
 from ._cdata import CData
-from ._codon import Codon
+from ._codon import Codon, codon_iter
 from ._codon_prob import CodonProb
+from ._encoded import EncodedSequence
 from ._ffi import ffi, lib
+from ._nbytes import (
+    CODON_STATE_NBYTES,
+    FRAME_STATE_NBYTES,
+    container_nbytes,
+    object_nbytes,
+)
 from ._table import BaseTable, CodonTable
 
 __all__ = [
@@ -47,6 +55,7 @@ class FrameState(State[BaseAlphabet]):
         self._nmm_frame_state = nmm_frame_state
         self._baset = baset
         self._codont = codont
+        self._codon_support: Optional[List[Tuple[int, Codon]]] = None
         alphabet = baset.alphabet
         super().__init__(lib.nmm_frame_state_super(self._nmm_frame_state), alphabet)
 
@@ -85,17 +94,96 @@ class FrameState(State[BaseAlphabet]):
     def codon_table(self) -> CodonTable:
         return self._codont
 
-    def decode(self, seq: Sequence) -> Tuple[float, Codon]:
+    @property
+    def codon_support(self) -> List[Tuple[int, Codon]]:
+        """
+        Codons of nonzero probability, with their index in `codon_iter` order.
+
+        Read from the codon table on first access.
+        """
+        if self._codon_support is None:
+            codont = self._codont
+            self._codon_support = [
+                (i, codon)
+                for i, codon in enumerate(codon_iter(self.alphabet))
+                if codont.lprob(codon) > -inf
+            ]
+        return self._codon_support
+
+    def decode(self, seq: Union[Sequence, EncodedSequence]) -> Tuple[float, Codon]:
         state = self._nmm_frame_state
         any_symbol = self.alphabet.any_symbol
         codon = Codon.create(any_symbol * 3, self.alphabet)
         lprob = lib.nmm_frame_state_decode(state, seq.imm_seq, codon.nmm_codon)
         return lprob, codon
 
+    def lposterior(self, codon: Codon, seq: Union[Sequence, EncodedSequence]) -> float:
+        """
+        Log posterior probability of a codon given the emitted sequence.
+
+        Parameters
+        ----------
+        codon
+            Codon.
+        seq
+            Emitted sequence.
+        """
+        state = self._nmm_frame_state
+        return lib.nmm_frame_state_lposterior(state, codon.nmm_codon, seq.imm_seq)
+
+    def lposteriors(
+        self,
+        seq: Union[Sequence, EncodedSequence],
+        codons: Optional[List[Codon]] = None,
+    ) -> List[float]:
+        """
+        Log posterior probability of every codon given the emitted sequence.
+
+        Parameters
+        ----------
+        seq
+            Emitted sequence.
+        codons
+            Codons to evaluate. Defaults to the 64 codons in `codon_iter` order,
+            in which case only the `codon_support` is evaluated: every other
+            codon has zero posterior probability.
+        """
+        state = self._nmm_frame_state
+        imm_seq = seq.imm_seq
+        lposterior = lib.nmm_frame_state_lposterior
+        if codons is not None:
+            return [lposterior(state, c.nmm_codon, imm_seq) for c in codons]
+
+        lprobs = [-inf] * 64
+        for i, codon in self.codon_support:
+            lprobs[i] = lposterior(state, codon.nmm_codon, imm_seq)
+        return lprobs
+
     @property
     def epsilon(self) -> float:
         return lib.nmm_frame_state_epsilon(self._nmm_frame_state)
 
+    def is_codon_only(self) -> bool:
+        """
+        Whether the state only emits codons, i.e. sequences of length 3.
+
+        That is the case for a zero epsilon, which allows no frameshift.
+        """
+        return self.epsilon == 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the state, native allocation included.
+
+        The base and codon tables are not included, as they can be shared between
+        states.
+        """
+        size = FRAME_STATE_NBYTES + len(self.name) + 1 + object_nbytes(self)
+        if self._codon_support is not None:
+            size += container_nbytes(self._codon_support)
+        return size
+
     def __del__(self):
         if self._nmm_frame_state != ffi.NULL:
             lib.nmm_frame_state_destroy(self._nmm_frame_state)
@@ -138,6 +226,20 @@ class CodonState(State[BaseAlphabet]):
         ptr = lib.nmm_codon_state_create(name, codonp.nmm_codon_lprob)
         return CodonState(ptr, codonp)
 
+    @property
+    def codon_prob(self) -> CodonProb:
+        return self._codonp
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the state, native allocation included.
+
+        The codon probabilities are not included, as they can be shared between
+        states.
+        """
+        return CODON_STATE_NBYTES + len(self.name) + 1 + object_nbytes(self)
+
     def __del__(self):
         if self._nmm_codon_state != ffi.NULL:
             lib.nmm_codon_state_destroy(self._nmm_codon_state)
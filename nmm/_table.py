@@ -9,6 +9,13 @@ from ._cdata import CData
 from ._codon import Codon
 from ._codon_prob import CodonProb
 from ._ffi import ffi, lib
+from ._nbytes import (
+    BASE_TABLE_NBYTES,
+    CODON_TABLE_NBYTES,
+    DOUBLE,
+    POINTER,
+    object_nbytes,
+)
 
 __all__ = ["AminoTable", "BaseTable", "CodonTable"]
 
@@ -25,6 +32,8 @@ class AminoTable:
         20-symbols alphabet.
     """
 
+    __slots__ = ("_nmm_amino_table", "_alphabet")
+
     def __init__(self, nmm_amino_table: CData, alphabet: AminoAlphabet):
         if nmm_amino_table == ffi.NULL:
             raise RuntimeError("`nmm_amino_table` is NULL.")
@@ -60,6 +69,13 @@ class AminoTable:
     def lprob(self, amino: bytes) -> float:
         return lib.nmm_amino_table_lprob(self._nmm_amino_table, amino)
 
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the table, native allocation included.
+        """
+        return POINTER + len(self._alphabet.symbols) * DOUBLE + object_nbytes(self)
+
     def __del__(self):
         if self._nmm_amino_table != ffi.NULL:
             lib.nmm_amino_table_destroy(self._nmm_amino_table)
@@ -77,6 +93,8 @@ class BaseTable:
         Four-nucleotides alphabet.
     """
 
+    __slots__ = ("_nmm_base_table", "_alphabet")
+
     def __init__(self, nmm_base_table: CData, alphabet: BaseAlphabet):
         if nmm_base_table == ffi.NULL:
             raise RuntimeError("`nmm_base_table` is NULL.")
@@ -113,6 +131,13 @@ class BaseTable:
     def lprob(self, nucleotide: bytes) -> float:
         return lib.nmm_base_table_lprob(self._nmm_base_table, nucleotide)
 
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the table, native allocation included.
+        """
+        return BASE_TABLE_NBYTES + object_nbytes(self)
+
     def __del__(self):
         if self._nmm_base_table != ffi.NULL:
             lib.nmm_base_table_destroy(self._nmm_base_table)
@@ -132,6 +157,8 @@ class CodonTable:
         Four-nucleotides alphabet.
     """
 
+    __slots__ = ("_nmm_codon_table", "_alphabet")
+
     def __init__(self, nmm_codon_table: CData, alphabet: BaseAlphabet):
         if nmm_codon_table == ffi.NULL:
             raise RuntimeError("`nmm_codon_table` is NULL.")
@@ -164,6 +191,13 @@ class CodonTable:
             raise RuntimeError("Could not get probability.")
         return lprob
 
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated memory of the table, native allocation included.
+        """
+        return CODON_TABLE_NBYTES + object_nbytes(self)
+
     def __del__(self):
         if self._nmm_codon_table != ffi.NULL:
             lib.nmm_codon_table_destroy(self._nmm_codon_table)
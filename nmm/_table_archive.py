@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from enum import Enum
+from math import inf, isfinite
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Type, Union
+
+from ._alphabet import BaseAlphabet
+from ._codon import codon_iter
+from ._codon_prob import CodonProb
+from ._profile import TableFactory
+from ._table import BaseTable, CodonTable
+
+__all__ = ["TableArchive", "TableKind"]
+
+Table = Union[BaseTable, CodonProb, CodonTable]
+
+_MAGIC = b"NMMTABLE"
+_VERSION = 2
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<BHQI")
+# Set in the kind byte of entries stored as (codon index, value) pairs.
+_SPARSE = 0x80
+# Codon rows with at most this fraction of nonzero probabilities are stored
+# sparse.
+SPARSE_DENSITY = 0.25
+
+
+class TableKind(Enum):
+    BASE_TABLE = 0
+    CODON_PROB = 1
+    CODON_TABLE = 2
+
+
+class _Entry(NamedTuple):
+    kind: TableKind
+    offset: int
+    size: int
+    sparse: bool
+
+
+class TableArchive:
+    """
+    Versioned binary collection of named tables.
+
+    The file holds a header, an index of entries, and all table values as one
+    contiguous array of little-endian doubles. Codon tables with few codons of
+    nonzero probability are stored as (codon index, value) pairs. Opening an
+    archive maps the file into memory; values are read without copying, and
+    table objects are only created on access.
+
+    Parameters
+    ----------
+    buffer
+        Archive bytes.
+    alphabet
+        Four-nucleotides alphabet of the tables.
+    """
+
+    def __init__(self, buffer, alphabet: Optional[BaseAlphabet] = None):
+        view = memoryview(buffer)
+        magic, version, nsymbols = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a table archive.")
+        if version not in (1, _VERSION):
+            raise ValueError(f"Unsupported table archive version {version}.")
+
+        pos = _HEADER.size
+        symbols = bytes(view[pos : pos + nsymbols])
+        any_symbol = bytes(view[pos + nsymbols : pos + nsymbols + 1])
+        pos += nsymbols + 1
+        (count,) = struct.unpack_from("<I", view, pos)
+        pos += 4
+
+        self._entries: Dict[bytes, _Entry] = {}
+        for _ in range(count):
+            kind, name_len, offset, size = _ENTRY.unpack_from(view, pos)
+            pos += _ENTRY.size
+            name = bytes(view[pos : pos + name_len])
+            pos += name_len
+            sparse = bool(kind & _SPARSE)
+            kind = TableKind(kind & ~_SPARSE)
+            self._entries[name] = _Entry(kind, offset, size, sparse)
+
+        data_start = _align(pos)
+        self._buffer = buffer
+        self._values = view[data_start:].cast("d")
+        if alphabet is None:
+            alphabet = BaseAlphabet.create(symbols, any_symbol)
+        elif alphabet.symbols != symbols:
+            raise ValueError("Alphabet differs from the archive one.")
+        self._alphabet = alphabet
+        self._factory: Optional[TableFactory] = None
+
+    @classmethod
+    def open(
+        cls: Type[TableArchive],
+        filepath: Union[str, bytes],
+        alphabet: Optional[BaseAlphabet] = None,
+    ) -> TableArchive:
+        """
+        Memory-map an archive file.
+
+        Parameters
+        ----------
+        filepath
+            Archive file.
+        alphabet
+            Alphabet of the tables. Defaults to a new one from the archive.
+        """
+        with open(filepath, "rb") as stream:
+            buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, alphabet)
+
+    @staticmethod
+    def save(
+        filepath: Union[str, bytes], alphabet: BaseAlphabet, tables: Dict[bytes, Table]
+    ):
+        """
+        Write tables into an archive file.
+
+        Parameters
+        ----------
+        filepath
+            Archive file.
+        alphabet
+            Four-nucleotides alphabet of the tables.
+        tables
+            Tables keyed by name.
+        """
+        codons = list(codon_iter(alphabet))
+        bases = [alphabet.symbols[i : i + 1] for i in range(4)]
+        values = array("d")
+        index: List[bytes] = []
+        for name, table in tables.items():
+            offset = len(values)
+            if isinstance(table, BaseTable):
+                kind = TableKind.BASE_TABLE
+                values.extend(table.lprob(b) for b in bases)
+                flag = 0
+            elif isinstance(table, CodonProb):
+                kind = TableKind.CODON_PROB
+                flag = _extend_codons(values, [table.get_lprob(c) for c in codons])
+            elif isinstance(table, CodonTable):
+                kind = TableKind.CODON_TABLE
+                flag = _extend_codons(values, [table.lprob(c) for c in codons])
+            else:
+                raise TypeError(f"Unsupported table type {type(table).__name__}.")
+            size = len(values) - offset
+            code = kind.value | flag
+            index.append(_ENTRY.pack(code, len(name), offset, size) + name)
+
+        symbols = alphabet.symbols
+        header = _HEADER.pack(_MAGIC, _VERSION, len(symbols))
+        header += symbols + alphabet.any_symbol + struct.pack("<I", len(index))
+        header += b"".join(index)
+        header += b"\0" * (_align(len(header)) - len(header))
+
+        if values.itemsize != 8:
+            raise RuntimeError("Unexpected double size.")
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        with open(filepath, "wb") as stream:
+            stream.write(header)
+            stream.write(values.tobytes())
+
+    @classmethod
+    def load(
+        cls: Type[TableArchive],
+        filepath: Union[str, bytes],
+        alphabet: Optional[BaseAlphabet] = None,
+    ) -> Dict[bytes, Table]:
+        """
+        Read every table of an archive file with a single read.
+        """
+        with open(filepath, "rb") as stream:
+            archive = cls(stream.read(), alphabet)
+        return {name: archive[name] for name in archive}
+
+    @property
+    def alphabet(self) -> BaseAlphabet:
+        return self._alphabet
+
+    def kind(self, name: bytes) -> TableKind:
+        return self._entries[name].kind
+
+    def is_sparse(self, name: bytes) -> bool:
+        return self._entries[name].sparse
+
+    def values(self, name: bytes) -> memoryview:
+        """
+        Log probabilities of a table.
+
+        Base tables hold 4 values in alphabet order and codon tables 64 values in
+        `codon_iter` order. Values of dense entries are read without copying,
+        while sparse entries are expanded.
+        """
+        entry = self._entries[name]
+        values = self._values[entry.offset : entry.offset + entry.size]
+        if sys.byteorder != "little":
+            swapped = array("d", values)
+            swapped.byteswap()
+            values = memoryview(swapped)
+        if not entry.sparse:
+            return values
+        dense = array("d", [-inf] * 64)
+        for i in range(0, len(values), 2):
+            dense[int(values[i])] = values[i + 1]
+        return memoryview(dense)
+
+    def __getitem__(self, name: bytes) -> Table:
+        if self._factory is None:
+            self._factory = TableFactory(self._alphabet)
+        factory = self._factory
+        kind = self._entries[name].kind
+        values = self.values(name)
+        if kind == TableKind.BASE_TABLE:
+            return BaseTable.create(self._alphabet, tuple(values))
+        if kind == TableKind.CODON_PROB:
+            codonp = CodonProb.create(self._alphabet)
+            for codon, lprob in zip(factory.codons, values):
+                if lprob > -inf:
+                    codonp.set_lprob(codon, lprob)
+            return codonp
+        return factory.codon_table(values)
+
+    def __contains__(self, name: bytes) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _extend_codons(values: array, lprobs: Sequence[float]) -> int:
+    """
+    Append codon log probabilities, sparse if few are finite.
+
+    Returns
+    -------
+    Kind flag of the stored entry.
+    """
+    support = [(i, v) for i, v in enumerate(lprobs) if isfinite(v)]
+    if len(support) > SPARSE_DENSITY * len(lprobs):
+        values.extend(lprobs)
+        return 0
+    for i, v in support:
+        values.extend((float(i), v))
+    return _SPARSE
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) // 8 * 8
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from math import inf
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from imm import HMM, Alphabet, State
+
+from ._cdata import CData
+from ._emission import EmissionTable
+from ._nbytes import container_nbytes, object_nbytes
+from ._state import FrameState
+
+__all__ = ["Topology"]
+
+
+class Topology:
+    """
+    Model graph held in Python-side arrays.
+
+    States are referred to by their index in `states`.
+
+    Parameters
+    ----------
+    alphabet
+        Alphabet.
+    states
+        States.
+    start_lprobs
+        Start log probability of each state.
+    transitions
+        Transition log probabilities keyed by (source, target) state indices. Pairs
+        not present have zero probability.
+    end
+        Index of the end state.
+    """
+
+    __slots__ = (
+        "_alphabet",
+        "_states",
+        "_start",
+        "_trans",
+        "_end",
+        "_index",
+        "_pred",
+        "_succ",
+        "_codon_only",
+        "_min_seq",
+        "_max_seq",
+        "_emissions",
+        "_mute_order",
+    )
+
+    def __init__(
+        self,
+        alphabet: Alphabet,
+        states: Sequence[State],
+        start_lprobs: Sequence[float],
+        transitions: Dict[Tuple[int, int], float],
+        end: int,
+    ):
+        if len(states) != len(start_lprobs):
+            raise ValueError("`states` and `start_lprobs` lengths differ.")
+        if not 0 <= end < len(states):
+            raise ValueError("`end` is not a state index.")
+
+        self._alphabet = alphabet
+        self._states = list(states)
+        self._start = [float(v) for v in start_lprobs]
+        self._trans = {k: v for k, v in transitions.items() if v > -inf}
+        self._end = end
+        self._index = {s.imm_state: i for i, s in enumerate(self._states)}
+
+        nstates = len(self._states)
+        self._pred: List[List[Tuple[int, float]]] = [[] for _ in range(nstates)]
+        self._succ: List[List[Tuple[int, float]]] = [[] for _ in range(nstates)]
+        for (a, b), lprob in self._trans.items():
+            self._pred[b].append((a, lprob))
+            self._succ[a].append((b, lprob))
+
+        self._codon_only = [
+            i
+            for i, s in enumerate(self._states)
+            if isinstance(s, FrameState) and s.is_codon_only()
+        ]
+        self._min_seq = [s.min_seq for s in self._states]
+        self._max_seq = [s.max_seq for s in self._states]
+        for i in self._codon_only:
+            self._min_seq[i] = self._max_seq[i] = 3
+        self._emissions = [EmissionTable(s, alphabet) for s in self._states]
+        self._mute_order = self._sort_mute_states()
+
+    @classmethod
+    def create(
+        cls: Type[Topology],
+        hmm: HMM,
+        end_state: Optional[State] = None,
+    ) -> Topology:
+        """
+        Read the graph of an HMM.
+
+        Every pair of states is queried, so this costs O(states²) native calls.
+
+        Parameters
+        ----------
+        hmm
+            Hidden Markov model.
+        end_state
+            End state. Defaults to the single state without outgoing transitions.
+        """
+        states = list(hmm.states.values())
+        start = [hmm.start_lprob(s) for s in states]
+        trans: Dict[Tuple[int, int], float] = {}
+        for a, sa in enumerate(states):
+            for b, sb in enumerate(states):
+                lprob = hmm.transition(sa, sb)
+                if lprob > -inf:
+                    trans[(a, b)] = lprob
+
+        if end_state is None:
+            sources = {a for a, _ in trans.keys()}
+            sinks = [i for i in range(len(states)) if i not in sources]
+            if len(sinks) != 1:
+                raise ValueError("Could not infer the end state; pass `end_state`.")
+            end = sinks[0]
+        else:
+            end = states.index(end_state)
+
+        return cls(hmm.alphabet, states, start, trans, end)
+
+    @property
+    def alphabet(self) -> Alphabet:
+        return self._alphabet
+
+    @property
+    def states(self) -> List[State]:
+        return self._states
+
+    @property
+    def nstates(self) -> int:
+        return len(self._states)
+
+    @property
+    def start_lprobs(self) -> List[float]:
+        return self._start
+
+    @property
+    def transitions(self) -> Dict[Tuple[int, int], float]:
+        return self._trans
+
+    @property
+    def end(self) -> int:
+        return self._end
+
+    @property
+    def codon_only(self) -> List[int]:
+        """
+        Indices of the frame states that only emit codons.
+
+        Their emission lengths are narrowed to 3 in `min_seq` and `max_seq`, so
+        the Python engines skip the lengths of zero probability. The native DP
+        is unaffected.
+        """
+        return self._codon_only
+
+    @property
+    def min_seq(self) -> List[int]:
+        return self._min_seq
+
+    @property
+    def max_seq(self) -> List[int]:
+        return self._max_seq
+
+    @property
+    def emissions(self) -> List[EmissionTable]:
+        return self._emissions
+
+    @property
+    def mute_order(self) -> List[int]:
+        """
+        Indices of states that can emit the empty sequence, in topological order.
+        """
+        return self._mute_order
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory of the Python-side arrays and emission tables, states excluded.
+        """
+        size = object_nbytes(self)
+        size += object_nbytes(self._states) + object_nbytes(self._emissions)
+        for items in [
+            self._start,
+            self._trans,
+            self._index,
+            self._codon_only,
+            self._min_seq,
+            self._max_seq,
+            self._mute_order,
+        ]:
+            size += container_nbytes(items)
+        for adjacency in [self._pred, self._succ]:
+            size += object_nbytes(adjacency)
+            size += sum(container_nbytes(edges) for edges in adjacency)
+        size += sum(table.nbytes for table in self._emissions)
+        return size
+
+    def index(self, state: State) -> int:
+        return self._index[state.imm_state]
+
+    def state(self, imm_state: CData) -> State:
+        return self._states[self._index[imm_state]]
+
+    def predecessors(self, i: int) -> List[Tuple[int, float]]:
+        return self._pred[i]
+
+    def successors(self, i: int) -> List[Tuple[int, float]]:
+        return self._succ[i]
+
+    def replace(self, states: Sequence[State]) -> Topology:
+        """
+        Same graph with replacement states, index by index.
+        """
+        if len(states) != len(self._states):
+            raise ValueError("Wrong number of states.")
+        return Topology(
+            self._alphabet,
+            states,
+            self._start,
+            self._trans,
+            self._end,
+        )
+
+    def create_hmm(self) -> HMM:
+        """
+        Create an HMM with this graph.
+        """
+        hmm = HMM.create(self._alphabet)
+        for state, lprob in zip(self._states, self._start):
+            hmm.add_state(state, lprob)
+        for (a, b), lprob in self._trans.items():
+            hmm.set_transition(self._states[a], self._states[b], lprob)
+        return hmm
+
+    def _sort_mute_states(self) -> List[int]:
+        mute = [i for i in range(len(self._states)) if self._min_seq[i] == 0]
+        mute_set = set(mute)
+        indegree = {i: 0 for i in mute}
+        for (a, b) in self._trans.keys():
+            if a in mute_set and b in mute_set and a != b:
+                indegree[b] += 1
+            elif a == b and a in mute_set:
+                raise ValueError("Mute state with a self-transition.")
+
+        order: List[int] = []
+        ready = [i for i in mute if indegree[i] == 0]
+        while ready:
+            a = ready.pop(0)
+            order.append(a)
+            for b, _ in self._succ[a]:
+                if b in mute_set and b != a:
+                    indegree[b] -= 1
+                    if indegree[b] == 0:
+                        ready.append(b)
+
+        if len(order) != len(mute):
+            raise ValueError("Mute states form a cycle.")
+        return order
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from math import inf, log
+from typing import Dict, Iterable, List, Type
+
+from imm import Fragment, Sequence, State
+
+from ._codon import codon_iter
+from ._model import Model
+from ._profile import TableFactory
+from ._state import CodonState, FrameState
+
+__all__ = ["TrainingStats", "ViterbiTrainer"]
+
+
+class TrainingStats:
+    """
+    Sufficient statistics of Viterbi training.
+
+    Counts are keyed by state index in the model topology.
+
+    Parameters
+    ----------
+    codon_counts
+        Count of each codon, in `codon_iter` order, per state.
+    base_counts
+        Count of each base, in alphabet order, per frame state.
+    nsequences
+        Number of sequences accumulated.
+    loglikelihood
+        Sum of the Viterbi log-likelihoods of the accumulated sequences.
+    """
+
+    def __init__(
+        self,
+        codon_counts: Dict[int, List[float]],
+        base_counts: Dict[int, List[float]],
+        nsequences: int,
+        loglikelihood: float,
+    ):
+        self._codon_counts = codon_counts
+        self._base_counts = base_counts
+        self._nsequences = nsequences
+        self._loglikelihood = loglikelihood
+
+    @classmethod
+    def create(cls: Type[TrainingStats]) -> TrainingStats:
+        """
+        Create empty statistics.
+        """
+        return cls({}, {}, 0, 0.0)
+
+    @property
+    def codon_counts(self) -> Dict[int, List[float]]:
+        return self._codon_counts
+
+    @property
+    def base_counts(self) -> Dict[int, List[float]]:
+        return self._base_counts
+
+    @property
+    def nsequences(self) -> int:
+        return self._nsequences
+
+    @property
+    def loglikelihood(self) -> float:
+        return self._loglikelihood
+
+    def merge(self, other: TrainingStats):
+        """
+        Add the counts of another statistics object into this one.
+        """
+        _add_counts(self._codon_counts, other.codon_counts)
+        _add_counts(self._base_counts, other.base_counts)
+        self._nsequences += other.nsequences
+        self._loglikelihood += other.loglikelihood
+
+
+class ViterbiTrainer:
+    """
+    Viterbi training of frame-state and codon-state parameters.
+
+    Sequences are aligned by Viterbi; each frame-state step contributes its
+    decoded codon and its emitted bases, and each codon-state step its emitted
+    codon. Statistics of separate batches can be merged before updating the
+    model.
+
+    Parameters
+    ----------
+    model
+        Model to train.
+    pseudocount
+        Prior count of a state, spread evenly over its 64 codons or 4 bases
+        when estimating probabilities, so that rows of different sizes are
+        smoothed alike.
+    """
+
+    def __init__(self, model: Model, pseudocount: float = 1.0):
+        self._model = model
+        self._pseudocount = pseudocount
+        self._topology = model.topology
+        alphabet = model.alphabet
+        self._codon_index = {c.symbols: i for i, c in enumerate(codon_iter(alphabet))}
+        self._base_index = {alphabet.symbols[i : i + 1]: i for i in range(4)}
+
+    def accumulate(self, seqs: Iterable[Sequence]) -> TrainingStats:
+        """
+        Accumulate statistics over a batch of sequences.
+        """
+        stats = TrainingStats.create()
+        codon_counts = stats.codon_counts
+        base_counts = stats.base_counts
+        topology = self._topology
+        dp = self._model.dp
+        loglik = 0.0
+        nseqs = 0
+
+        for seq in seqs:
+            result = dp.viterbi(seq)[0]
+            loglik += result.loglikelihood
+            nseqs += 1
+            for frag_step in Fragment(seq, result.path):
+                state = topology.state(frag_step.step.state.imm_state)
+                i = topology.index(state)
+                if isinstance(state, FrameState):
+                    _, codon = state.decode(frag_step.sequence)
+                    self._count_codon(codon_counts, i, codon.symbols)
+                    self._count_bases(base_counts, i, bytes(frag_step.sequence))
+                elif isinstance(state, CodonState):
+                    self._count_codon(codon_counts, i, bytes(frag_step.sequence))
+
+        return TrainingStats(codon_counts, base_counts, nseqs, loglik)
+
+    def accumulate_batches(
+        self, batches: Iterable[List[Sequence]], workers: int = 1
+    ) -> TrainingStats:
+        """
+        Accumulate and merge statistics over batches, in parallel threads.
+        """
+        stats = TrainingStats.create()
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            for batch_stats in executor.map(self.accumulate, batches):
+                stats.merge(batch_stats)
+        return stats
+
+    def update(self, stats: TrainingStats) -> Model:
+        """
+        Create a model with parameters estimated from statistics.
+
+        States without counts keep their parameters. Frame states keep their
+        epsilon.
+        """
+        topology = self._topology
+        factory = TableFactory(self._model.alphabet)
+        states: List[State] = list(topology.states)
+
+        for i, state in enumerate(topology.states):
+            codons = stats.codon_counts.get(i)
+            if codons is None:
+                continue
+            codon_row = _lprobs(codons, self._pseudocount)
+            if isinstance(state, FrameState):
+                bases = stats.base_counts[i]
+                baset = factory.base_table(_lprobs(bases, self._pseudocount))
+                codont = factory.codon_table(codon_row)
+                states[i] = FrameState.create(state.name, baset, codont, state.epsilon)
+            elif isinstance(state, CodonState):
+                codonp = factory.codon_prob(codon_row)
+                states[i] = CodonState.create(state.name, codonp)
+
+        return Model.create_from_topology(topology.replace(states))
+
+    def _count_codon(self, counts: Dict[int, List[float]], i: int, codon: bytes):
+        j = self._codon_index.get(codon)
+        if j is not None:
+            counts.setdefault(i, [0.0] * 64)[j] += 1.0
+
+    def _count_bases(self, counts: Dict[int, List[float]], i: int, seq: bytes):
+        row = counts.setdefault(i, [0.0] * 4)
+        for k in range(len(seq)):
+            j = self._base_index.get(seq[k : k + 1])
+            if j is not None:
+                row[j] += 1.0
+
+
+def _add_counts(dst: Dict[int, List[float]], src: Dict[int, List[float]]):
+    for i, row in src.items():
+        if i in dst:
+            dst[i] = [a + b for a, b in zip(dst[i], row)]
+        else:
+            dst[i] = list(row)
+
+
+def _lprobs(counts: List[float], pseudocount: float) -> List[float]:
+    prior = pseudocount / len(counts)
+    total = sum(counts) + pseudocount
+    if total == 0.0:
+        return [-log(len(counts))] * len(counts)
+    return [log((c + prior) / total) if c + prior > 0 else -inf for c in counts]
@@ -0,0 +1,67 @@
+from math import log
+from typing import Callable
+
+import pytest
+from imm import HMM, MuteState
+
+from nmm import BaseAlphabet, BaseTable, Codon, CodonProb, CodonTable, FrameState, Model
+
+
+def _build_frame_model(epsilon: float) -> Model:
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    baset = BaseTable.create(abc, (log(0.25), log(0.25), log(0.25), log(0.25)))
+
+    codonp = CodonProb.create(abc)
+    codonp.set_lprob(Codon.create(b"AUG", abc), log(0.8))
+    codonp.set_lprob(Codon.create(b"AUU", abc), log(0.1))
+
+    B = MuteState.create(b"B", abc)
+    M = FrameState.create(b"M", baset, CodonTable.create(codonp), epsilon)
+    E = MuteState.create(b"E", abc)
+
+    hmm = HMM.create(abc)
+    hmm.add_state(B, log(1.0))
+    hmm.add_state(M)
+    hmm.add_state(E)
+    hmm.set_transition(B, M, log(1.0))
+    hmm.set_transition(M, E, log(1.0))
+    return Model.create(hmm, hmm.create_dp(E))
+
+
+@pytest.fixture
+def nmm_example():
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    baset = BaseTable.create(abc, (log(0.25), log(0.25), log(0.25), log(0.25)))
+
+    codonp = CodonProb.create(abc)
+    codonp.set_lprob(Codon.create(b"AUG", abc), log(0.8))
+    codonp.set_lprob(Codon.create(b"AUU", abc), log(0.1))
+
+    B = MuteState.create(b"B", abc)
+    M1 = FrameState.create(b"M1", baset, CodonTable.create(codonp), 0.02)
+    M2 = FrameState.create(b"M2", baset, CodonTable.create(codonp), 0.01)
+    E = MuteState.create(b"E", abc)
+
+    hmm = HMM.create(abc)
+    hmm.add_state(B, log(0.5))
+    hmm.add_state(M1)
+    hmm.add_state(M2)
+    hmm.add_state(E)
+
+    hmm.set_transition(B, M1, log(0.8))
+    hmm.set_transition(B, M2, log(0.2))
+    hmm.set_transition(M1, M2, log(0.1))
+    hmm.set_transition(M1, E, log(0.4))
+    hmm.set_transition(M2, E, log(0.3))
+
+    dp = hmm.create_dp(E)
+
+    return {"hmm": hmm, "dp": dp, "alphabet": abc}
+
+
+@pytest.fixture
+def frame_model() -> Callable[[float], Model]:
+    """
+    Builder of a model with a single frame state of the given epsilon.
+    """
+    return _build_frame_model
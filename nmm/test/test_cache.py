@@ -0,0 +1,34 @@
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import Model, ResultCache
+
+
+def test_result_cache(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+    model.result_cache = ResultCache(max_entries=2, store_path=True)
+
+    seq = Sequence.create(b"AUGAUU", abc)
+    result = model.viterbi(seq)
+    assert_allclose(result.loglikelihood, -7.069201008427531)
+    assert result.path is not None
+    assert model.viterbi(b"AUGAUU") is result
+
+    stats = model.result_cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+    results = model.viterbi_batch([b"AUGAUA", b"AUGAUA", b"AUGAUG", b"AUGAUU"])
+    assert results[0] is results[1]
+    stats = model.result_cache.stats
+    assert stats.nentries == 2
+    assert stats.misses == 4
+
+
+def test_result_cache_hash_keys():
+    cache = ResultCache(hash_keys=True, max_nbytes=1000)
+    key = cache.key(b"ACGT" * 100)
+    assert len(key) == 20
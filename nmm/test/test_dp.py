@@ -0,0 +1,80 @@
+from math import inf
+
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import Model
+from nmm._dp import symbol_rate, viterbi_score, viterbi_threshold
+
+
+def test_topology(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+
+    topology = model.topology
+    assert topology.nstates == 4
+    assert topology.states[topology.end].name == b"E"
+    assert len(topology.transitions) == 5
+    assert [topology.states[i].name for i in topology.mute_order] == [b"B", b"E"]
+
+
+def test_score_only(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    seq = Sequence.create(b"AUGAUU", abc)
+    viterbi = dp.viterbi(seq)[0].loglikelihood
+    assert_allclose(model.viterbi_score(seq), viterbi)
+    assert_allclose(model.viterbi_score(b"AUGAUU"), viterbi)
+    assert model.forward_score(seq) >= viterbi
+
+    for symbols in [b"AUG", b"AUGA", b"AUGAUU", b"AUGAUUA", b"AU", b""]:
+        results = dp.viterbi(Sequence.create(symbols, abc))
+        native = results[0].loglikelihood if len(results) > 0 else -inf
+        score = viterbi_score(model.topology, symbols)
+        if native == -inf:
+            assert score == -inf
+        else:
+            assert_allclose(score, native)
+
+
+def test_viterbi_threshold(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+    topology = model.topology
+    rate = symbol_rate(topology)
+
+    result = viterbi_threshold(topology, b"AUGAUU", -10.0, rate)
+    assert not result.abandoned
+    assert result.skipped_cells == 0
+    assert_allclose(result.loglikelihood, -7.069201008427531)
+
+    result = viterbi_threshold(topology, b"AUGAUU", result.loglikelihood, rate)
+    assert not result.abandoned
+    assert_allclose(result.loglikelihood, -7.069201008427531)
+
+    result = viterbi_threshold(topology, b"AUGAUU", -0.5, rate)
+    assert result.abandoned
+    assert result.loglikelihood == -inf
+    assert 0 < result.skipped_cells < result.ncells
+
+
+def test_viterbi_scores(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    seqs = [b"AUGAUU", b"AUG", b"", b"AUGAUUA", b"AUU", b"AUGAUU"]
+    scores = model.viterbi_scores(seqs, lanes=4)
+    assert scores[2] == -inf
+    for seq, score in zip(seqs, scores):
+        if seq:
+            assert_allclose(score, model.viterbi_score(seq))
+
+    expected = dp.viterbi(Sequence.create(b"AUGAUU", abc))[0].loglikelihood
+    assert_allclose(scores[0], expected)
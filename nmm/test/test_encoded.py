@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import BaseAlphabet, Codon, EncodedSequence, FrameState, Input, Model, Output
+
+
+def test_encoded_sequence():
+    abc = BaseAlphabet.create(b"ACGT", b"X")
+
+    seq = EncodedSequence.create(b"ACGTX", abc)
+    assert len(seq) == 5
+    assert bytes(seq.indices) == bytes([0, 1, 2, 3, 4])
+    assert bytes(seq) == b"ACGTX"
+    assert bytes(seq[1:3]) == b"CG"
+    assert bytes(seq.sequence) == b"ACGTX"
+
+    with pytest.raises(ValueError):
+        EncodedSequence.create(b"ACGU", abc)
+
+
+def test_encoded_sequence_from_buffer():
+    abc = BaseAlphabet.create(b"ACGT", b"X")
+
+    buffer = bytearray([3, 2, 1, 0])
+    seq = EncodedSequence.from_buffer(buffer, abc)
+    assert bytes(seq) == b"TGCA"
+    buffer[0] = 0
+    assert bytes(seq.indices) == bytes([0, 2, 1, 0])
+
+    with pytest.raises(ValueError):
+        EncodedSequence.from_buffer(bytearray([5]), abc)
+
+
+def test_encoded_sequence_scoring(nmm_example):
+    alphabet = nmm_example["alphabet"]
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+
+    seq = EncodedSequence.create(b"AUGAUU", alphabet)
+    assert_allclose(model.viterbi(seq).loglikelihood, -7.069201008427531)
+    assert_allclose(model.viterbi_score(seq), -7.069201008427531)
+    assert_allclose(dp.viterbi(seq.sequence)[0].loglikelihood, -7.069201008427531)
+
+    states = [s for s in hmm.states.values() if isinstance(s, FrameState)]
+    codon = Codon.create(b"AUG", alphabet)
+    state = states[0]
+    lprob, decoded = state.decode(EncodedSequence.create(b"AUG", alphabet))
+    expected = state.decode(Sequence.create(b"AUG", alphabet))
+    assert_allclose(lprob, expected[0])
+    assert decoded.symbols == codon.symbols
+
+
+def test_encoded_sequence_alphabets(tmpdir, nmm_example):
+    alphabet = nmm_example["alphabet"]
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+
+    filepath = Path(tmpdir / "model.nmm")
+    with Output.create(bytes(filepath)) as output:
+        output.write(Model.create(hmm, dp))
+    with Input.create(bytes(filepath)) as input:
+        model = input.read()
+    assert model.alphabet is not alphabet
+
+    seq = EncodedSequence.create(b"AUGAUU", alphabet)
+    assert_allclose(model.viterbi_score(seq), -7.069201008427531)
+    assert_allclose(
+        model.dp.viterbi(seq.sequence_for(model.alphabet))[0].loglikelihood,
+        dp.viterbi(seq.sequence)[0].loglikelihood,
+    )
+    last = seq.sequence_for(model.alphabet)
+    assert seq.sequence_for(model.alphabet) is last
+    assert seq.sequence is not last
+    assert seq.sequence is seq.sequence
+    assert seq.sequence_for(model.alphabet) is not last
+
+    with pytest.raises(ValueError):
+        seq.sequence_for(BaseAlphabet.create(b"ACGT", b"X"))
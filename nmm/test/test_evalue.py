@@ -0,0 +1,47 @@
+from math import exp, log
+from pathlib import Path
+from random import Random
+
+from imm.testing import assert_allclose
+
+from nmm import Input, Model, Output
+from nmm._evalue import fit_gumbel
+
+
+def test_fit_gumbel():
+    random = Random(1)
+    scores = [2.0 - log(-log(random.random())) / 0.7 for _ in range(20000)]
+    stats = fit_gumbel(scores)
+    assert_allclose(stats.mu, 2.0, rtol=0.05)
+    assert_allclose(stats.lambda_, 0.7, rtol=0.05)
+    assert_allclose(stats.pvalue(stats.mu), 1 - exp(-1))
+    assert stats.evalue(3.0, 100) < stats.evalue(2.0, 100)
+
+
+def test_calibrate(tmpdir, nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+
+    stats = model.calibrate(6, nsamples=100, workers=2)
+    assert stats.lambda_ > 0
+    assert model.evalue(-7.0) < model.evalue(-20.0)
+
+    filepath = Path(tmpdir / "model.nmm")
+    with Output.create(bytes(filepath)) as output:
+        output.write(Model.create(hmm, dp))
+        output.write(model)
+
+    with Input.create(bytes(filepath)) as input:
+        models = list(input)
+    assert models[0].statistics is None
+    assert models[1].statistics == stats
+
+    output = Output.create(bytes(filepath))
+    output.write(Model.create(hmm, dp))
+    output.close()
+    output.close()
+    del output
+    assert not Path(tmpdir / "model.nmm.stats").exists()
+    with Input.create(bytes(filepath)) as input:
+        assert input.read().statistics is None
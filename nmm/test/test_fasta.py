@@ -0,0 +1,47 @@
+import gzip
+from pathlib import Path
+
+from nmm import BaseAlphabet, EncodedSequence, read_sequences
+
+_FASTA = b""">r1 first read
+ACGT
+acgn
+
+>r2
+UUU
+"""
+
+_FASTQ = b"""@q1
+ACGTN
++
+IIIII
+@q2 second
+GG
++q2
+II
+"""
+
+
+def test_read_fasta(tmpdir):
+    filepath = Path(tmpdir / "reads.fa")
+    filepath.write_bytes(_FASTA)
+    abc = BaseAlphabet.create(b"ACGT", b"X")
+
+    batches = list(read_sequences(bytes(filepath), abc, batch_size=1))
+    assert len(batches) == 2
+    assert batches[0][0].id == b"r1"
+    assert isinstance(batches[0][0].sequence, EncodedSequence)
+    assert bytes(batches[0][0].sequence) == b"ACGTACGX"
+    assert bytes(batches[1][0].sequence) == b"XXX"
+
+
+def test_read_fastq_gzip(tmpdir):
+    filepath = Path(tmpdir / "reads.fq.gz")
+    filepath.write_bytes(gzip.compress(_FASTQ))
+    abc = BaseAlphabet.create(b"ACGT", b"X")
+
+    batches = list(read_sequences(bytes(filepath), abc))
+    assert len(batches) == 1
+    assert [r.id for r in batches[0]] == [b"q1", b"q2"]
+    assert bytes(batches[0][0].sequence) == b"ACGTX"
+    assert bytes(batches[0][1].sequence) == b"GG"
@@ -0,0 +1,61 @@
+from math import inf
+from pathlib import Path
+
+import pytest
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import Input, Model, Output, group_models
+
+
+def test_group_models(nmm_example, frame_model):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    models = [frame_model(0.01), frame_model(0.02), Model.create(hmm, dp)]
+
+    groups = list(group_models(models))
+    assert [len(group) for group in groups] == [2, 1]
+    assert groups[0].models == models[:2]
+
+    for seq in [b"AUG", b"AUGAUU", b"AUGA", b""]:
+        for group in groups:
+            scores = group.viterbi_scores(seq)
+            for score, model in zip(scores, group):
+                results = model.dp.viterbi(Sequence.create(seq, model.alphabet))
+                native = results[0].loglikelihood if len(results) > 0 else -inf
+                if native == -inf:
+                    assert score == native
+                else:
+                    assert_allclose(score, native)
+
+    models.append(frame_model(0.03))
+    groups = list(group_models(models, max_models=1))
+    assert [len(group) for group in groups] == [1, 1, 1, 1]
+    groups = list(group_models(models, max_models=2))
+    assert [len(group) for group in groups] == [2, 1, 1]
+
+    with pytest.raises(ValueError):
+        list(group_models(models, max_models=0))
+
+
+def test_input_read_groups(tmpdir, nmm_example, frame_model):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+
+    filepath = Path(tmpdir / "models.nmm")
+    with Output.create(bytes(filepath)) as output:
+        output.write(frame_model(0.01))
+        output.write(frame_model(0.02))
+        output.write(frame_model(0.03))
+        output.write(Model.create(hmm, dp))
+
+    with Input.create(bytes(filepath)) as input:
+        groups = input.read_groups(max_models=2)
+        first = next(groups)
+        assert len(first) == 2
+        assert [len(group) for group in groups] == [1, 1]
+
+    scores = first.viterbi_scores(b"AUG")
+    for score, model in zip(scores, first):
+        seq = Sequence.create(b"AUG", model.alphabet)
+        assert_allclose(score, model.dp.viterbi(seq)[0].loglikelihood)
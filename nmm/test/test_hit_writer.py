@@ -0,0 +1,61 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from imm import Sequence
+
+from nmm import HitWriter
+
+
+def test_hit_writer_flush():
+    stream = io.StringIO()
+    writer = HitWriter(stream, flush_size=2)
+    writer.write("m", "s1", -1.5)
+    assert stream.getvalue() == "model\tsequence\tloglikelihood\tpath\tcodons\n"
+    writer.write("m", "s2", -2.0, "M1:3", "AUG")
+    lines = stream.getvalue().splitlines()
+    assert lines[1:] == ["m\ts1\t-1.5\t\t", "m\ts2\t-2.0\tM1:3\tAUG"]
+    writer.write("m", "s3", -3.0)
+    writer.close()
+    assert stream.getvalue().splitlines()[-1] == "m\ts3\t-3.0\t\t"
+
+
+def test_hit_writer_separators():
+    stream = io.StringIO()
+    writer = HitWriter(stream, header=False)
+    for model, sequence in [("m\tx", "s"), ("m", "s\n"), ("m", "s\r")]:
+        with pytest.raises(ValueError):
+            writer.write(model, sequence, -1.0)
+    with pytest.raises(ValueError):
+        writer.write("m", "s", -1.0, "M1:3", "AU\tG")
+    writer.close()
+    assert stream.getvalue() == ""
+
+
+def test_hit_writer_threads():
+    stream = io.StringIO()
+    with HitWriter(stream, flush_size=7, header=False) as writer:
+        with ThreadPoolExecutor(4) as executor:
+            for i in range(100):
+                executor.submit(writer.write, "m", f"s{i}", float(-i))
+    lines = stream.getvalue().splitlines()
+    assert sorted(lines) == sorted(f"m\ts{i}\t{float(-i)!r}\t\t" for i in range(100))
+
+
+def test_hit_writer_result(tmpdir, nmm_example):
+    alphabet = nmm_example["alphabet"]
+    dp = nmm_example["dp"]
+
+    seq = Sequence.create(b"AUGAUU", alphabet)
+    result = dp.viterbi(seq)[0]
+    filepath = str(tmpdir / "hits.tsv")
+    with HitWriter.create(filepath) as writer:
+        writer.write_result("example", "seq", seq, result.loglikelihood, result.path)
+
+    with open(filepath, "r") as file:
+        lines = file.read().splitlines()
+    model, name, loglik, path, codons = lines[1].split("\t")
+    assert (model, name) == ("example", "seq")
+    assert abs(float(loglik) - result.loglikelihood) < 1e-12
+    assert "M1:3,M2:3" in path
+    assert codons == "AUGAUU"
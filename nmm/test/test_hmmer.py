@@ -0,0 +1,83 @@
+from io import StringIO
+from math import exp
+from pathlib import Path
+
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import (
+    BaseAlphabet,
+    GeneticCode,
+    Input,
+    convert_hmmer3,
+    read_hmmer3,
+    read_model_names,
+)
+
+_ALPH = "A C D E F G H I K L M N P Q R S T V W Y"
+_BG = " ".join(["2.99573"] * 20)
+_MATCH1 = " ".join(["0.05129"] + ["5.29832"] * 19)
+_MATCH2 = " ".join(["5.29832"] * 10 + ["0.05129"] + ["5.29832"] * 9)
+
+_PROFILE = f"""HMMER3/f [3.1b2 | February 2015]
+NAME  toy
+LENG  2
+ALPH  amino
+HMM   {_ALPH}
+      m->m m->i m->d i->m i->i d->m d->d
+COMPO {_BG}
+      {_BG}
+      0.01000 4.61512 * 0.61958 0.77255 0.00000 *
+1     {_MATCH1} 1 a - - -
+      {_BG}
+      0.01000 4.61512 5.33747 0.61958 0.77255 0.48576 0.95510
+2     {_MATCH2} 2 m - - -
+      {_BG}
+      0.00000 * * * * 0.00000 *
+//
+"""
+
+
+def test_genetic_code():
+    code = GeneticCode.create()
+    assert code.translate(b"AUG") == b"M"
+    assert code.translate(b"TAA") == b"*"
+    assert code.codons(b"W") == [b"TGG"]
+    assert len(code.codons(b"L")) == 6
+
+    aminos = b"ACDEFGHIKLMNPQRSTVWY"
+    lprobs = [-2.995732273553991] * 20
+    row = code.codon_lprobs(b"ACGU", aminos, lprobs)
+    assert len(row) == 64
+    assert_allclose(sum(exp(v) for v in row), 1.0)
+
+
+def test_read_hmmer3():
+    profiles = list(read_hmmer3(StringIO(_PROFILE + _PROFILE)))
+    assert len(profiles) == 2
+    profile = profiles[0]
+    assert profile.name == "toy"
+    assert profile.aminos == b"ACDEFGHIKLMNPQRSTVWY"
+    assert profile.length == 2
+    assert len(profile.insert) == 3
+    assert len(profile.trans) == 3
+    assert_allclose(profile.match[0][0], -0.05129)
+    assert_allclose(profile.trans[0][0], -0.01)
+
+
+def test_convert_hmmer3(tmpdir):
+    hmm_filepath = Path(tmpdir / "toy.hmm")
+    hmm_filepath.write_text(_PROFILE + _PROFILE.replace("NAME  toy", "NAME  toy2"))
+    nmm_filepath = Path(tmpdir / "toy.nmm")
+
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    assert convert_hmmer3(str(hmm_filepath), bytes(nmm_filepath), abc) == 2
+    assert read_model_names(bytes(nmm_filepath)) == ["toy", "toy2"]
+
+    with Input.create(bytes(nmm_filepath)) as input:
+        scores = []
+        for model in input:
+            seq = Sequence.create(b"GCUAUG", model.alphabet)
+            scores.append(model.dp.viterbi(seq)[0].loglikelihood)
+    assert len(scores) == 2
+    assert_allclose(scores[0], scores[1])
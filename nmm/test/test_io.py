@@ -1,52 +1,9 @@
-from math import log
 from pathlib import Path
 
-import pytest
-from imm import HMM, MuteState, Sequence
+from imm import Sequence
 from imm.testing import assert_allclose
 
-from nmm import (
-    BaseAlphabet,
-    BaseTable,
-    Codon,
-    CodonProb,
-    CodonTable,
-    FrameState,
-    Input,
-    Model,
-    Output,
-)
-
-
-@pytest.fixture
-def nmm_example():
-    abc = BaseAlphabet.create(b"ACGU", b"X")
-    baset = BaseTable.create(abc, (log(0.25), log(0.25), log(0.25), log(0.25)))
-
-    codonp = CodonProb.create(abc)
-    codonp.set_lprob(Codon.create(b"AUG", abc), log(0.8))
-    codonp.set_lprob(Codon.create(b"AUU", abc), log(0.1))
-
-    B = MuteState.create(b"B", abc)
-    M1 = FrameState.create(b"M1", baset, CodonTable.create(codonp), 0.02)
-    M2 = FrameState.create(b"M2", baset, CodonTable.create(codonp), 0.01)
-    E = MuteState.create(b"E", abc)
-
-    hmm = HMM.create(abc)
-    hmm.add_state(B, log(0.5))
-    hmm.add_state(M1)
-    hmm.add_state(M2)
-    hmm.add_state(E)
-
-    hmm.set_transition(B, M1, log(0.8))
-    hmm.set_transition(B, M2, log(0.2))
-    hmm.set_transition(M1, M2, log(0.1))
-    hmm.set_transition(M1, E, log(0.4))
-    hmm.set_transition(M2, E, log(0.3))
-
-    dp = hmm.create_dp(E)
-
-    return {"hmm": hmm, "dp": dp, "alphabet": abc}
+from nmm import FrameState, Input, Model, Output
 
 
 def test_io(tmpdir, nmm_example):
@@ -74,3 +31,20 @@ def test_io(tmpdir, nmm_example):
             assert_allclose(score, -7.069201008427531)
             nmodels += 1
         assert nmodels == 3
+
+
+def test_io_wrappers(tmpdir, nmm_example):
+    filepath = Path(tmpdir / "model.nmm")
+    with Output.create(bytes(filepath)) as output:
+        output.write(Model.create(nmm_example["hmm"], nmm_example["dp"]))
+
+    with Input.create(bytes(filepath)) as input:
+        model = input.read()
+
+    assert not hasattr(model, "__dict__")
+    assert not hasattr(model.topology, "__dict__")
+    assert not hasattr(model.topology.emissions[0], "__dict__")
+    for state in model.topology.states:
+        if isinstance(state, FrameState):
+            assert not hasattr(state.base_table, "__dict__")
+            assert not hasattr(state.codon_table, "__dict__")
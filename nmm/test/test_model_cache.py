@@ -0,0 +1,59 @@
+import os
+
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import ModelCache, hash_parts
+
+
+def test_model_fingerprint(frame_model):
+    assert frame_model(0.01).fingerprint == frame_model(0.01).fingerprint
+    assert frame_model(0.01).fingerprint != frame_model(0.02).fingerprint
+    assert len(frame_model(0.01).fingerprint) == 64
+
+
+def test_model_cache(tmpdir, frame_model):
+    cache = ModelCache(str(tmpdir / "models"))
+    key = hash_parts(b"parameters", 0.01)
+    nbuilds = 0
+
+    def build():
+        nonlocal nbuilds
+        nbuilds += 1
+        return frame_model(0.01)
+
+    model = cache.load_or_build(key, build)
+    assert key in cache
+    loaded = cache.load_or_build(key, build)
+    assert nbuilds == 1
+
+    seq = Sequence.create(b"AUG", model.alphabet)
+    assert_allclose(
+        loaded.dp.viterbi(seq)[0].loglikelihood,
+        model.dp.viterbi(seq)[0].loglikelihood,
+    )
+    assert cache.load("0" * 64) is None
+
+
+def test_model_cache_eviction(tmpdir, frame_model):
+    cache = ModelCache(str(tmpdir / "models"))
+    first = cache.store(frame_model(0.01))
+    os.utime(cache.filepath(first), (0, 0))
+    size = cache.nbytes
+
+    cache = ModelCache(str(tmpdir / "models"), max_nbytes=size)
+    second = cache.store(frame_model(0.02))
+    assert first not in cache
+    assert second in cache
+    assert cache.nbytes <= size
+
+
+def test_model_cache_statistics(tmpdir, frame_model):
+    cache = ModelCache(str(tmpdir / "models"))
+    model = frame_model(0.01)
+    stats = model.calibrate(3, nsamples=50)
+    key = cache.store(model)
+    assert cache.load(key).statistics == stats
+
+    cache.store(frame_model(0.01), key)
+    assert cache.load(key).statistics is None
@@ -0,0 +1,53 @@
+from nmm import FrameState, Model
+from nmm._nbytes import (
+    DOUBLE,
+    DP_CELL_NBYTES,
+    DP_STATE_NBYTES,
+    DP_TRANSITION_NBYTES,
+    dp_nbytes,
+    dp_workspace_nbytes,
+)
+
+
+def test_model_nbytes(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+    size = model.nbytes
+    workspace = [model.dp_workspace_nbytes(n) for n in [0, 1, 10, 100]]
+    assert model.nbytes == size
+
+    frames = [s for s in model.topology.states if isinstance(s, FrameState)]
+    assert len(frames) == 2
+    baset = frames[0].base_table
+    assert baset is frames[1].base_table
+    codonts = [frame.codon_table for frame in frames]
+    assert codonts[1].nbytes > baset.nbytes
+
+    tables = baset.nbytes + sum(codont.nbytes for codont in codonts)
+    states = sum(frame.nbytes for frame in frames)
+    assert model.nbytes > tables + states + model.topology.nbytes
+    assert model.nbytes == size + model.topology.nbytes
+
+    assert workspace == [model.dp_workspace_nbytes(n) for n in [0, 1, 10, 100]]
+    assert workspace[0] > 0
+    step = workspace[1] - workspace[0]
+    assert workspace[2] == workspace[0] + 10 * step
+    assert workspace[3] == workspace[0] + 100 * step
+
+
+def test_dp_nbytes(frame_model):
+    for epsilon in [0.0, 0.01]:
+        topology = frame_model(epsilon).topology
+        assert topology.nstates == 3
+        assert len(topology.transitions) == 2
+
+        # Mute states emit the empty sequence, and the frame state every
+        # sequence of length 1 to 5, whether or not its epsilon is zero.
+        nemissions = 1 + (4 + 4**2 + 4**3 + 4**4 + 4**5) + 1
+        expected = 3 * DP_STATE_NBYTES + 2 * DP_TRANSITION_NBYTES
+        assert dp_nbytes(topology) == expected + nemissions * DOUBLE
+
+        ncolumns = 1 + 5 + 1
+        assert dp_workspace_nbytes(topology, 0) == ncolumns * DP_CELL_NBYTES
+        assert dp_workspace_nbytes(topology, 9) == 10 * ncolumns * DP_CELL_NBYTES
@@ -0,0 +1,89 @@
+from math import log
+from pathlib import Path
+
+from imm import HMM, MuteState, Sequence
+from imm.testing import assert_allclose
+
+from nmm import (
+    BaseAlphabet,
+    BaseTable,
+    Codon,
+    CodonProb,
+    CodonTable,
+    FrameState,
+    Input,
+    Model,
+    Output,
+    optimize_file,
+    optimize_model,
+)
+
+SEQS = [b"AUG", b"AUGAUU", b"AUGA", b"AUGAUUA", b"AUAUU"]
+
+
+def _build_model() -> Model:
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    baset = BaseTable.create(abc, (log(0.25), log(0.25), log(0.25), log(0.25)))
+
+    codonp = CodonProb.create(abc)
+    codonp.set_lprob(Codon.create(b"AUG", abc), log(0.8))
+    codonp.set_lprob(Codon.create(b"AUU", abc), log(0.1))
+
+    B = MuteState.create(b"B", abc)
+    D = MuteState.create(b"D", abc)
+    M1 = FrameState.create(b"M1", baset, CodonTable.create(codonp), 0.02)
+    M2 = FrameState.create(b"M2", baset, CodonTable.create(codonp), 0.01)
+    U = FrameState.create(b"U", baset, CodonTable.create(codonp), 0.01)
+    E = MuteState.create(b"E", abc)
+
+    hmm = HMM.create(abc)
+    hmm.add_state(B, log(0.5))
+    for state in [D, M1, M2, U, E]:
+        hmm.add_state(state)
+
+    hmm.set_transition(B, M1, log(0.8))
+    hmm.set_transition(B, D, log(0.2))
+    hmm.set_transition(D, M2, log(0.9))
+    hmm.set_transition(M1, M2, log(0.1))
+    hmm.set_transition(M1, E, log(0.4))
+    hmm.set_transition(M2, E, log(0.3))
+    hmm.set_transition(U, E, log(0.3))
+    return Model.create(hmm, hmm.create_dp(E))
+
+
+def test_optimize_model():
+    model = _build_model()
+    optimized, report = optimize_model(model)
+
+    assert report.nstates == (6, 4)
+    assert report.ntransitions == (7, 5)
+    assert report.merged_tables == 1
+    names = sorted(state.name for state in optimized.topology.states)
+    assert names == [b"B", b"E", b"M1", b"M2"]
+
+    for symbols in SEQS:
+        seq = Sequence.create(symbols, model.alphabet)
+        expected = model.dp.viterbi(seq)[0].loglikelihood
+        assert_allclose(optimized.dp.viterbi(seq)[0].loglikelihood, expected)
+        assert_allclose(optimized.viterbi_score(symbols), expected)
+
+
+def test_optimize_file(tmpdir):
+    src = Path(tmpdir / "models.nmm")
+    dst = Path(tmpdir / "optimized.nmm")
+    with Output.create(bytes(src)) as output:
+        output.write(_build_model())
+        output.write(_build_model())
+
+    report = optimize_file(bytes(src), bytes(dst))
+    assert report.nstates == (12, 8)
+
+    model = _build_model()
+    with Input.create(bytes(dst)) as input:
+        models = list(input)
+    assert len(models) == 2
+    for optimized in models:
+        seq = Sequence.create(b"AUGAUU", optimized.alphabet)
+        expected = model.dp.viterbi(Sequence.create(b"AUGAUU", model.alphabet))
+        result = optimized.dp.viterbi(seq)[0].loglikelihood
+        assert_allclose(result, expected[0].loglikelihood)
@@ -0,0 +1,28 @@
+from math import inf
+
+from imm import Fragment, Sequence
+from imm.testing import assert_allclose
+
+from nmm import Model
+
+
+def _steps(seq, path):
+    return [(s.step.state.name, s.step.seq_len) for s in Fragment(seq, path)]
+
+
+def test_viterbi_path(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    seq = Sequence.create(b"AUGAUU", abc)
+    expected = dp.viterbi(seq)[0]
+    for interval in [None, 1, 2, 4, 100]:
+        result = model.viterbi_path(seq, interval)
+        assert_allclose(result.loglikelihood, expected.loglikelihood)
+        assert _steps(seq, result.path) == _steps(seq, expected.path)
+
+    result = model.viterbi_path(b"A")
+    assert result.loglikelihood == -inf
+    assert result.path is None
@@ -0,0 +1,37 @@
+from math import inf
+
+from imm import Fragment, Sequence
+from imm.testing import assert_allclose
+
+from nmm import FrameState, Model, codon_iter
+
+
+def test_codon_lposteriors(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    seq = Sequence.create(b"AUGAUU", abc)
+    path = dp.viterbi(seq)[0].path
+    rows = model.codon_lposteriors(seq, path)
+    assert len(rows) == 2
+    assert all(len(row) == 64 for row in rows)
+
+    frag_steps = [
+        frag_step
+        for frag_step in Fragment(seq, path)
+        if isinstance(frag_step.step.state, FrameState)
+    ]
+    assert [bytes(frag_step.sequence) for frag_step in frag_steps] == [b"AUG", b"AUU"]
+    for row, frag_step in zip(rows, frag_steps):
+        expected = frag_step.step.state.lposteriors(frag_step.sequence)
+        for value, lprob in zip(row, expected):
+            if lprob == -inf:
+                assert value == -inf
+            else:
+                assert_allclose(value, lprob)
+
+    codons = [codon.symbols for codon in codon_iter(abc)]
+    assert max(rows[0]) == rows[0][codons.index(b"AUG")]
+    assert max(rows[1]) == rows[1][codons.index(b"AUU")]
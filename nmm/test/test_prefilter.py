@@ -0,0 +1,74 @@
+from math import log
+
+import pytest
+from imm import HMM, MuteState, Sequence
+from imm.testing import assert_allclose
+
+from nmm import (
+    BaseAlphabet,
+    BaseTable,
+    Codon,
+    CodonProb,
+    CodonTable,
+    FrameState,
+    Model,
+    Prefilter,
+)
+
+
+def test_prefilter(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    prefilter = Prefilter.create(model, k=3)
+    assert prefilter.seeds == frozenset([b"AUG", b"UGA", b"GAU"])
+
+    assert prefilter.passes(b"CCAUGCC")
+    assert not prefilter.passes(b"CCCCCC")
+
+    results = prefilter.viterbi(Sequence.create(b"AUGAUU", abc))
+    assert results is not None
+    assert_allclose(results[0].loglikelihood, -7.069201008427531)
+    assert prefilter.viterbi(Sequence.create(b"CCCCCC", abc)) is None
+
+    stats = prefilter.stats
+    assert stats.npassed == 2
+    assert stats.nrejected == 2
+    assert_allclose(stats.pass_rate, 0.5)
+
+    with pytest.raises(ValueError):
+        Prefilter.create(model, k=7)
+
+
+def test_prefilter_match_states():
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    baset = BaseTable.create(abc, (log(0.25), log(0.25), log(0.25), log(0.25)))
+
+    def codon_table(symbols: bytes) -> CodonTable:
+        codonp = CodonProb.create(abc)
+        codonp.set_lprob(Codon.create(symbols, abc), log(0.9))
+        codonp.set_lprob(Codon.create(b"AAA", abc), log(0.1))
+        return CodonTable.create(codonp)
+
+    B = MuteState.create(b"B", abc)
+    M1 = FrameState.create(b"M1", baset, codon_table(b"AUG"), 0.01)
+    I1 = FrameState.create(b"I1", baset, codon_table(b"CCC"), 0.01)
+    M2 = FrameState.create(b"M2", baset, codon_table(b"GGG"), 0.01)
+    E = MuteState.create(b"E", abc)
+
+    hmm = HMM.create(abc)
+    hmm.add_state(B, log(1.0))
+    for state in [I1, M2, M1, E]:
+        hmm.add_state(state)
+    hmm.set_transition(B, M1, log(1.0))
+    hmm.set_transition(M1, M2, log(0.9))
+    hmm.set_transition(M1, I1, log(0.1))
+    hmm.set_transition(I1, I1, log(0.5))
+    hmm.set_transition(I1, M2, log(0.5))
+    hmm.set_transition(M2, E, log(1.0))
+    model = Model.create(hmm, hmm.create_dp(E))
+
+    prefilter = Prefilter.create(model, k=6)
+    assert prefilter.seeds == frozenset([b"AUGGGG"])
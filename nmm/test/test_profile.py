@@ -0,0 +1,53 @@
+from math import inf, log
+
+from imm import Sequence
+from imm.testing import assert_allclose
+
+from nmm import BaseAlphabet, build_frame_profile, codon_iter
+
+
+def test_build_frame_profile():
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    base_lprobs = [[log(0.25)] * 4, [log(0.25)] * 4]
+
+    row = [-inf] * 64
+    for i, codon in enumerate(codon_iter(abc)):
+        if codon.symbols == b"AUG":
+            row[i] = log(0.8)
+        if codon.symbols == b"AUU":
+            row[i] = log(0.1)
+    codon_lprobs = [row, row]
+
+    transitions = [[log(0.8), log(0.1), log(0.4)], [log(0.2), -inf, log(0.3)]]
+
+    model = build_frame_profile(
+        abc, base_lprobs, codon_lprobs, [0.02, 0.01], transitions, log(0.5)
+    )
+    results = model.dp.viterbi(Sequence.create(b"AUGAUU", abc))
+    assert len(results) == 1
+    assert_allclose(results[0].loglikelihood, -7.069201008427531)
+
+
+def test_codon_only_profile():
+    abc = BaseAlphabet.create(b"ACGU", b"X")
+    base_lprobs = [[log(0.25)] * 4, [log(0.25)] * 4]
+    row = [log(1 / 64)] * 64
+    transitions = [[log(0.8), log(0.1), log(0.4)], [log(0.2), -inf, log(0.3)]]
+
+    model = build_frame_profile(abc, base_lprobs, [row, row], [0.0, 0.0], transitions)
+    topology = model.topology
+    assert topology.codon_only == [1, 2]
+    assert topology.min_seq[1:3] == [3, 3]
+    assert topology.max_seq[1:3] == [3, 3]
+
+    for seq in [b"AUG", b"AUGA", b"AUGAUU", b"AUGAUUA", b"AU"]:
+        expected = model.dp.viterbi(Sequence.create(seq, abc))[0].loglikelihood
+        score = model.viterbi_scores([seq])[0]
+        if expected == -inf:
+            assert score == -inf
+        else:
+            assert_allclose(score, expected)
+
+    model = build_frame_profile(abc, base_lprobs, [row, row], [0.01, 0.01], transitions)
+    assert model.topology.codon_only == []
+    assert model.forward_score(b"AUGA") > -inf
@@ -0,0 +1,31 @@
+from math import inf
+
+from nmm import Model, Sampler
+
+
+def test_sampler(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+    topology = model.topology
+
+    sampler = Sampler.create(model, seed=5)
+    sampled = sampler.sample()
+    assert len(sampled.symbols) == sum(size for _, size in sampled.path)
+    assert sampled.path[-1][0] == topology.end
+    assert model.viterbi_score(sampled.symbols) > -inf
+
+    buffer, offsets, paths = sampler.sample_batch(10)
+    assert len(offsets) == 11
+    assert len(paths) == 10
+    assert offsets[-1] == len(buffer)
+
+    for i, path in enumerate(paths):
+        assert offsets[i + 1] - offsets[i] == sum(size for _, size in path)
+        assert path[-1][0] == topology.end
+
+    sampler = Sampler.create(model, seed=5)
+    sampler.sample()
+    again = bytearray(b"X" * 1000)
+    assert sampler.sample_batch(10, again) == (buffer, offsets, paths)
+    assert len(again) == offsets[-1]
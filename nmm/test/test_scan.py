@@ -0,0 +1,29 @@
+from math import log
+
+from nmm import Model
+from nmm._scan import windows
+
+
+def test_windows():
+    assert list(windows(5, 10, 2)) == [(0, 5)]
+    assert list(windows(10, 4, 1)) == [(0, 4), (3, 7), (6, 10)]
+    assert list(windows(11, 4, 1)) == [(0, 4), (3, 7), (6, 10), (7, 11)]
+
+
+def test_scan(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    model = Model.create(hmm, dp)
+
+    seq = b"AUGAUU" + b"CCCCCC" * 3 + b"AUGAUU"
+    hits = model.scan(seq, 6, 0, threshold=log(1e-4))
+    assert [(h.start, h.end) for h in hits] == [(0, 6), (24, 30)]
+
+    hits = model.scan(seq, 6, 0, threshold=log(1e-4), workers=2)
+    assert [(h.start, h.end) for h in hits] == [(0, 6), (24, 30)]
+
+    assert all(h.evalue is None for h in hits)
+    model.calibrate(6, nsamples=100)
+    hits = model.scan(seq, 6, 0, threshold=log(1e-4))
+    assert [(h.start, h.end) for h in hits] == [(0, 6), (24, 30)]
+    assert all(h.evalue == model.evalue(h.loglikelihood, 5) for h in hits)
@@ -11,6 +11,7 @@ from nmm import (
     CodonState,
     CodonTable,
     FrameState,
+    codon_iter,
 )
 
 
@@ -83,3 +84,32 @@ def test_frame_state():
     lprob, codon = frame_state.decode(Sequence.create(b"UUU", base))
     assert_allclose(lprob, -8.110186062956258)
     assert codon.symbols == b"AUU"
+
+
+def test_frame_state_lposteriors():
+    base = BaseAlphabet.create(b"ACGU", b"X")
+    baset = BaseTable.create(base, (log(0.25), log(0.25), log(0.25), log(0.25)))
+
+    codonp = CodonProb.create(base)
+    codonp.set_lprob(Codon.create(b"AUG", base), log(0.8))
+    codonp.set_lprob(Codon.create(b"AUU", base), log(0.1))
+    codonp.normalize()
+    frame_state = FrameState.create(b"M1", baset, CodonTable.create(codonp), 0.1)
+
+    seq = Sequence.create(b"AUA", base)
+    codons = list(codon_iter(base))
+    lposteriors = frame_state.lposteriors(seq)
+    assert len(lposteriors) == 64
+    best = max(range(64), key=lambda i: lposteriors[i])
+    assert codons[best].symbols == b"AUG"
+    assert_allclose(
+        lposteriors[best], frame_state.lposterior(Codon.create(b"AUG", base), seq)
+    )
+    assert lprob_is_zero(lposteriors[codons.index(Codon.create(b"CCC", base))])
+    assert [codons[i].symbols for i, _ in frame_state.codon_support] == [
+        b"AUG",
+        b"AUU",
+    ]
+    ccc = Codon.create(b"CCC", base)
+    assert lposteriors == frame_state.lposteriors(seq, codons)
+    assert lprob_is_zero(frame_state.lposteriors(seq, [ccc])[0])
@@ -0,0 +1,74 @@
+from math import log
+from pathlib import Path
+
+from imm import lprob_is_zero
+from imm.testing import assert_allclose
+
+from nmm import (
+    BaseAlphabet,
+    BaseTable,
+    Codon,
+    CodonProb,
+    CodonTable,
+    TableArchive,
+    TableKind,
+    codon_iter,
+)
+
+
+def test_table_archive(tmpdir):
+    base = BaseAlphabet.create(b"ACGT", b"X")
+    baset = BaseTable.create(base, (log(0.1), log(0.2), log(0.3), log(0.4)))
+
+    codonp = CodonProb.create(base)
+    codonp.set_lprob(Codon.create(b"AAA", base), log(0.01))
+    codonp.set_lprob(Codon.create(b"CAT", base), log(0.40))
+    codont = CodonTable.create(codonp)
+
+    filepath = Path(tmpdir / "tables.bin")
+    tables = {b"base": baset, b"prob": codonp, b"table": codont}
+    TableArchive.save(bytes(filepath), base, tables)
+
+    archive = TableArchive.open(bytes(filepath), base)
+    assert len(archive) == 3
+    assert list(archive) == [b"base", b"prob", b"table"]
+    assert archive.kind(b"prob") == TableKind.CODON_PROB
+    assert_allclose(archive.values(b"base")[3], log(0.4))
+
+    loaded = TableArchive.load(bytes(filepath))
+    assert_allclose(loaded[b"base"].lprob(b"G"), log(0.3))
+    cat = Codon.create(b"CAT", loaded[b"prob"].alphabet)
+    assert_allclose(loaded[b"prob"].get_lprob(cat), log(0.40))
+    assert lprob_is_zero(
+        loaded[b"prob"].get_lprob(Codon.create(b"ACA", loaded[b"prob"].alphabet))
+    )
+    cax = Codon.create(b"CAX", loaded[b"table"].alphabet)
+    assert_allclose(loaded[b"table"].lprob(cax), log(0.40))
+
+
+def test_table_archive_sparse(tmpdir):
+    base = BaseAlphabet.create(b"ACGT", b"X")
+    codons = list(codon_iter(base))
+
+    sparse = CodonProb.create(base)
+    sparse.set_lprob(Codon.create(b"CAT", base), log(0.5))
+    sparse.set_lprob(Codon.create(b"TTT", base), log(0.5))
+    dense = CodonProb.create(base)
+    for codon in codons:
+        dense.set_lprob(codon, log(1 / 64))
+
+    filepath = Path(tmpdir / "tables.bin")
+    tables = {b"sparse": sparse, b"dense": dense}
+    TableArchive.save(bytes(filepath), base, tables)
+    assert filepath.stat().st_size < 8 * (64 + 64 + 8)
+
+    archive = TableArchive.open(bytes(filepath), base)
+    assert archive.is_sparse(b"sparse")
+    assert not archive.is_sparse(b"dense")
+
+    values = archive.values(b"sparse")
+    assert len(values) == 64
+    cat = codons.index(Codon.create(b"CAT", base))
+    assert_allclose(values[cat], log(0.5))
+    assert sum(lprob_is_zero(v) for v in values) == 62
+    assert_allclose(archive[b"dense"].get_lprob(codons[7]), log(1 / 64))
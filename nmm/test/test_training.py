@@ -0,0 +1,29 @@
+from imm import Sequence
+
+from nmm import Codon, Model, TrainingStats, ViterbiTrainer
+
+
+def test_viterbi_trainer(nmm_example):
+    hmm = nmm_example["hmm"]
+    dp = nmm_example["dp"]
+    abc = nmm_example["alphabet"]
+    model = Model.create(hmm, dp)
+
+    trainer = ViterbiTrainer(model)
+    seqs = [Sequence.create(b"AUGAUU", abc) for _ in range(4)]
+    stats = trainer.accumulate_batches([seqs[:2], seqs[2:]], workers=2)
+    assert stats.nsequences == 4
+
+    single = TrainingStats.create()
+    single.merge(trainer.accumulate(seqs))
+    assert single.codon_counts == stats.codon_counts
+    assert single.base_counts == stats.base_counts
+
+    trained = trainer.update(stats)
+    assert trained.topology.nstates == model.topology.nstates
+    assert trained.viterbi_score(b"AUGAUU") >= model.viterbi_score(b"AUGAUU")
+
+    M2 = trained.topology.states[2]
+    auu = Codon.create(b"AUU", abc)
+    aug = Codon.create(b"AUG", abc)
+    assert M2.codon_table.lprob(auu) > M2.codon_table.lprob(aug)